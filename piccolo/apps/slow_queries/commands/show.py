@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import sys
+from typing import Any, Optional
+
+from piccolo.engine.finder import engine_finder
+from piccolo.engine.instrumentation import SlowQueryHook
+from piccolo.utils.printing import get_fixed_length_string
+
+
+def get_path() -> Optional[str]:
+    """
+    Find the ``path`` of the ``SlowQueryHook`` registered with the engine.
+    """
+    engine = engine_finder()
+    if engine is None:
+        return None
+
+    for hook in engine.hooks:
+        if isinstance(hook, SlowQueryHook) and hook.path is not None:
+            return hook.path
+
+    return None
+
+
+def print_entry(entry: dict[str, Any]):
+    start_time = datetime.datetime.fromtimestamp(entry["start_time"])
+    print("-" * 79)
+    print(
+        get_fixed_length_string(f"{entry['duration'] * 1000:.2f}ms", 12)
+        + f"{start_time.isoformat(sep=' ', timespec='seconds')}"
+        + (f" (node: {entry['node']})" if entry["node"] else "")
+    )
+    print(entry["sql"])
+    if entry["args"]:
+        print(f"Args: {entry['args']}")
+    if entry["plan"]:
+        print("Plan:")
+        print(entry["plan"])
+
+
+def show(path: str = "", limit: int = 20, as_json: bool = False):
+    """
+    Prints out the slow queries recorded by ``SlowQueryHook``, slowest first.
+
+    :param path:
+        The file the slow queries were written to. If not specified, the
+        ``path`` of the ``SlowQueryHook`` registered with the engine in
+        ``piccolo_conf.py`` is used.
+    :param limit:
+        The maximum number of queries to show.
+    :param as_json:
+        If ``True``, print out the raw JSON instead.
+
+    """
+    path = path or get_path() or ""
+    if not path:
+        sys.exit(
+            "Unable to find the slow queries - either pass in `--path`, or "
+            "register a `SlowQueryHook` with a `path` with the engine."
+        )
+
+    if not os.path.exists(path):
+        print("No slow queries have been recorded.")
+        return
+
+    with open(path) as f:
+        entries: list[dict[str, Any]] = json.load(f)
+
+    entries = sorted(entries, key=lambda i: i["duration"], reverse=True)
+    entries = entries[:limit]
+
+    if as_json:
+        print(json.dumps(entries, indent=2))
+        return
+
+    if not entries:
+        print("No slow queries have been recorded.")
+        return
+
+    for entry in entries:
+        print_entry(entry)
@@ -0,0 +1,9 @@
+from piccolo.conf.apps import AppConfig, Command
+
+from .commands.show import show
+
+APP_CONFIG = AppConfig(
+    app_name="slow_queries",
+    migrations_folder_path="",
+    commands=[Command(callable=show, aliases=["dump"])],
+)
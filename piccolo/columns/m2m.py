@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 from piccolo.columns.column_types import (
     JSON,
     JSONB,
+    Bytea,
     Column,
     ForeignKey,
     LazyTableReference,
@@ -57,6 +58,18 @@ class M2MSelect(Selectable):
             for column in columns
         )
 
+    @property
+    def sqlite_json_safe(self) -> bool:
+        """
+        If ``True``, SQLite can return all of the values in one go, using its
+        JSON functions. They don't support binary values.
+        """
+        from piccolo.engine.sqlite import json_functions_supported
+
+        return json_functions_supported() and not any(
+            isinstance(column, Bytea) for column in self.columns
+        )
+
     def get_select_string(
         self, engine_type: str, with_alias=True
     ) -> QueryString:
@@ -123,6 +136,28 @@ class M2MSelect(Selectable):
                     ) AS "{m2m_relationship_name}"
                 """)
         elif engine_type == "sqlite":
+            if self.sqlite_json_safe:
+                if self.as_list:
+                    column_name = self.columns[0]._meta.db_column_name
+                    value = f'"inner_{table_2_name}"."{column_name}"'
+                else:
+                    value = "json_object({})".format(
+                        ", ".join(
+                            f"'{column._meta.name}', "
+                            f'"inner_{table_2_name}".'
+                            f'"{column._meta.db_column_name}"'
+                            for column in self.columns
+                        )
+                    )
+
+                return QueryString(f"""
+                    (
+                        SELECT json_group_array({value})
+                        FROM {inner_select}
+                    )
+                    AS "{m2m_relationship_name} [M2M_JSON]"
+                """)
+
             if len(self.columns) > 1 or not self.serialisation_safe:
                 column_name = table_2_pk_name
             else:
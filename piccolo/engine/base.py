@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import contextvars
 import logging
 import pprint
 import string
+import time
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING, Final, Generic, Optional, TypeVar, Union
+from collections.abc import AsyncGenerator, Generator, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Final,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Self
 
@@ -14,7 +26,9 @@ from piccolo.utils.sync import run_sync
 from piccolo.utils.warnings import Level, colored_string, colored_warning
 
 if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.engine.instrumentation import QueryEvent, QueryHook
     from piccolo.query.base import DDL, Query
+    from piccolo.table import Table
 
 
 logger = logging.getLogger(__name__)
@@ -47,6 +61,56 @@ class BaseBatch(metaclass=ABCMeta):
     @abstractmethod
     async def __anext__(self) -> list[dict]: ...
 
+    @abstractmethod
+    async def next(self) -> list[dict]: ...
+
+    @property
+    def read_ahead(self) -> bool:
+        """
+        Whether the next batch can be fetched while the current one is still
+        being consumed. Override if the connection is shared with other
+        queries.
+        """
+        return True
+
+    async def stream(self) -> AsyncGenerator[Any, None]:
+        """
+        Yields the rows one at a time. While the current batch of rows is
+        being consumed, the next batch is fetched in the background.
+
+        Unlike ``async with``, this opens and closes the batch itself.
+        """
+        exception: Optional[BaseException] = None
+        pending: Optional[asyncio.Future] = None
+
+        try:
+            # If this fails, the batch still needs closing, as the connection
+            # has already been opened.
+            await self.__aenter__()
+            pending = asyncio.ensure_future(self.next())
+
+            while rows := await pending:
+                if self.read_ahead:
+                    pending = asyncio.ensure_future(self.next())
+
+                for row in rows:
+                    yield row
+
+                if not self.read_ahead:
+                    pending = asyncio.ensure_future(self.next())
+        except BaseException as e:
+            exception = e
+            raise
+        finally:
+            if pending is not None and not pending.done():
+                # The connection can't be closed while it's still fetching.
+                with contextlib.suppress(Exception):
+                    await pending
+
+            await self.__aexit__(
+                type(exception) if exception else None, exception, None
+            )
+
 
 class BaseTransaction(metaclass=ABCMeta):
 
@@ -79,6 +143,70 @@ class BaseAtomic(metaclass=ABCMeta):
 TransactionClass = TypeVar("TransactionClass", bound=BaseTransaction)
 
 
+class IdentityMap:
+    """
+    Keeps track of the rows which have been loaded, so each row is only
+    represented by a single ``Table`` instance, and can be retrieved without
+    querying the database again. See :meth:`Engine.identity_map`.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self):
+        self._rows: dict[type[Table], dict[Any, Table]] = {}
+
+    def get(self, table: type[Table], primary_key: Any) -> Optional[Table]:
+        rows = self._rows.get(table)
+        return None if rows is None else rows.get(primary_key)
+
+    def add(self, row: Table) -> Table:
+        """
+        Start tracking the row. If a row with the same primary key is already
+        being tracked, then that instance is returned instead.
+        """
+        from piccolo.table import Table
+
+        # Any related rows which were prefetched are tracked too.
+        related_rows = {}
+        for foreign_key in row._meta.foreign_key_columns:
+            name = foreign_key._meta.name
+            value = row.__dict__.get(name)
+            if isinstance(value, Table):
+                related_rows[name] = row.__dict__[name] = self.add(value)
+
+        primary_key = row.__dict__.get(row._meta.primary_key._meta.name)
+        if primary_key is None or isinstance(primary_key, QueryString):
+            return row
+
+        existing = self._rows.setdefault(row.__class__, {}).setdefault(
+            primary_key, row
+        )
+        if existing is not row:
+            # Bypass ``__setattr__``, so they aren't saved unnecessarily.
+            existing.__dict__.update(related_rows)
+        return existing
+
+    def replace(self, row: Table):
+        """
+        Track this row, replacing any existing instance with the same primary
+        key - for example, when the row has just been saved.
+        """
+        primary_key = row.__dict__.get(row._meta.primary_key._meta.name)
+        if primary_key is None or isinstance(primary_key, QueryString):
+            return
+        self._rows.setdefault(row.__class__, {})[primary_key] = row
+
+    def invalidate(self, table: type[Table]):
+        """
+        Stop tracking any rows for the given table - for example, when they
+        might have been modified by an update or delete query.
+        """
+        self._rows.pop(table, None)
+
+    def __len__(self) -> int:
+        return sum(len(i) for i in self._rows.values())
+
+
 class Engine(Generic[TransactionClass], metaclass=ABCMeta):
     __slots__ = (
         "query_id",
@@ -87,8 +215,15 @@ class Engine(Generic[TransactionClass], metaclass=ABCMeta):
         "engine_type",
         "min_version_number",
         "current_transaction",
+        "current_identity_map",
+        "pool_loop",
+        "hooks",
     )
 
+    # The maximum number of bind parameters allowed in a single query. Queries
+    # with more values than this (e.g. large inserts) are split up.
+    max_query_parameters: int = 32767
+
     def __init__(
         self,
         engine_type: str,
@@ -100,6 +235,15 @@ class Engine(Generic[TransactionClass], metaclass=ABCMeta):
         self.log_responses = log_responses
         self.engine_type = engine_type
         self.min_version_number = min_version_number
+        # The event loop the connection pool was started in, as a pool can
+        # only be used by that event loop.
+        self.pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hooks: list[QueryHook] = []
+        self.current_identity_map: contextvars.ContextVar[
+            Optional[IdentityMap]
+        ] = contextvars.ContextVar(
+            f"{engine_type}_current_identity_map", default=None
+        )
 
         run_sync(self.check_version())
         run_sync(self.prep_database())
@@ -139,6 +283,33 @@ class Engine(Generic[TransactionClass], metaclass=ABCMeta):
         """
         return results
 
+    def transform_response_to_tuples(self, results) -> list[tuple]:
+        """
+        Converts each row returned by the database adapter into a tuple. This
+        is faster than creating dictionaries, if the column names aren't
+        needed.
+        """
+        return [tuple(i.values()) for i in results]
+
+    def transform_response_to_columns(
+        self, results, column_names: Sequence[str] = ()
+    ) -> dict[str, list]:
+        """
+        Converts the rows returned by the database adapter into a dictionary,
+        mapping each column name to a list of values.
+
+        :param column_names:
+            If there are no rows, the names can't be taken from them, so an
+            empty list is returned for each of these instead.
+
+        """
+        if not results:
+            return {name: [] for name in column_names}
+
+        names = list(results[0].keys())
+        values = zip(*(i.values() for i in results))
+        return dict(zip(names, map(list, values)))
+
     @abstractmethod
     async def run_ddl(self, ddl: str, in_pool: bool = True):
         pass
@@ -211,6 +382,105 @@ class Engine(Generic[TransactionClass], metaclass=ABCMeta):
         """
         return self.current_transaction.get() is not None
 
+    ###########################################################################
+
+    @contextlib.asynccontextmanager
+    async def identity_map(self) -> AsyncGenerator[IdentityMap, None]:
+        """
+        Within this context, each row loaded by an ``objects`` query is only
+        represented by a single ``Table`` instance. Looking up a row by its
+        primary key (e.g. using ``get``), or using ``get_related``, returns
+        the existing instance if the row has already been loaded, rather
+        than querying the database::
+
+            async with DB.identity_map():
+                bands = await Band.objects()
+                for band in bands:
+                    # Only queries the database once for each manager.
+                    manager = await band.get_related(Band.manager)
+
+        It's scoped to the current ``asyncio`` task, so it's suitable for
+        wrapping each web request. Any update or delete queries on a table
+        remove its rows from the identity map.
+
+        """
+        identity_map = IdentityMap()
+        token = self.current_identity_map.set(identity_map)
+        try:
+            yield identity_map
+        finally:
+            self.current_identity_map.reset(token)
+
+    ###########################################################################
+    # Instrumentation
+
+    def add_hook(self, hook: QueryHook):
+        """
+        Register a hook, which is notified about every query run by this
+        engine. See :class:`QueryHook <piccolo.engine.instrumentation.QueryHook>`.
+        """  # noqa: E501
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: QueryHook):
+        self.hooks.remove(hook)
+
+    @contextlib.contextmanager
+    def instrument(
+        self,
+        sql: str,
+        args: Sequence[Any] = (),
+        args_count: Optional[int] = None,
+        node: Optional[str] = None,
+        query_id: Optional[int] = None,
+    ) -> Generator[Optional[QueryEvent], None, None]:
+        """
+        Wrap the execution of a query with this, so the hooks are called.
+        Yields ``None`` if there aren't any hooks - otherwise the caller
+        should set ``row_count`` on the event.
+
+        Any exceptions raised by the hooks are logged, rather than causing
+        the query to fail.
+        """
+        if not self.hooks:
+            yield None
+            return
+
+        from piccolo.engine.instrumentation import QueryEvent
+
+        event = QueryEvent(
+            engine=self,
+            query_id=self.get_query_id() if query_id is None else query_id,
+            sql=sql,
+            args=args,
+            args_count=len(args) if args_count is None else args_count,
+            node=node,
+            in_transaction=self.current_transaction.get() is not None,
+            start_time=time.time(),
+        )
+        self._call_hooks("before_query", event)
+
+        start = time.perf_counter()
+        try:
+            yield event
+        except BaseException as exception:
+            # ``BaseException``, so the hooks also know about cancelled
+            # queries (e.g. so spans are ended).
+            event.duration = time.perf_counter() - start
+            self._call_hooks("on_error", event, exception)
+            raise
+
+        event.duration = time.perf_counter() - start
+        self._call_hooks("after_query", event)
+
+    def _call_hooks(self, method_name: str, *args: Any):
+        for hook in self.hooks:
+            try:
+                getattr(hook, method_name)(*args)
+            except Exception:
+                logger.exception(
+                    f"{hook.__class__.__name__}.{method_name} failed."
+                )
+
     ###########################################################################
     # Logging queries and responses
 
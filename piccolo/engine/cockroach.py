@@ -3,7 +3,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, Optional, cast
 
-from .postgres import Atomic, PostgresEngine, PostgresTransaction
+from .postgres import (
+    Atomic,
+    PostgresEngine,
+    PostgresTransaction,
+    ReplicaRouter,
+)
 
 
 class CockroachAtomic(Atomic):
@@ -67,6 +72,8 @@ class CockroachEngine(PostgresEngine):
         log_queries: bool = False,
         log_responses: bool = False,
         extra_nodes: Optional[dict[str, CockroachEngine]] = None,
+        prepared_statement_cache_size: Optional[int] = None,
+        replica_router: Optional[ReplicaRouter] = None,
     ) -> None:
         super().__init__(
             config=config,
@@ -74,6 +81,8 @@ class CockroachEngine(PostgresEngine):
             log_queries=log_queries,
             log_responses=log_responses,
             extra_nodes=extra_nodes,
+            prepared_statement_cache_size=prepared_statement_cache_size,
+            replica_router=replica_router,
         )
         self.engine_type = "cockroach"
         self.min_version_number = 0
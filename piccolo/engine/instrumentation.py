@@ -0,0 +1,523 @@
+"""
+Hooks for observing the queries run by an engine - for example, to log slow
+queries, or to send spans to a tracing system.
+
+Usage::
+
+    from piccolo.engine.instrumentation import LoggingHook
+
+    DB = PostgresEngine(config={...})
+    DB.add_hook(LoggingHook())
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+from collections.abc import Callable, Coroutine, Sequence
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from piccolo.utils.encoding import dump_json
+
+if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.engine.base import Engine
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryEvent:
+    """
+    Describes a query being run by an engine. The same instance is passed to
+    each of the hook's methods, so hooks can store their own state on it
+    using ``context``.
+    """
+
+    engine: Engine
+    query_id: int
+    #: The compiled SQL.
+    sql: str
+    #: The arguments passed with the SQL.
+    args: Sequence[Any] = ()
+    #: The number of arguments passed with the SQL.
+    args_count: int = 0
+    #: Which of the engine's ``extra_nodes`` the query is being run on, or
+    #: ``None`` if it's being run on the engine itself.
+    node: Optional[str] = None
+    in_transaction: bool = False
+    #: A value from :func:`time.time` - when the query started.
+    start_time: float = 0.0
+    #: In seconds - only set once the query has finished.
+    duration: Optional[float] = None
+    #: The number of rows returned - only set once the query has finished.
+    row_count: Optional[int] = None
+    context: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def operation(self) -> str:
+        """
+        The SQL command being run, e.g. ``'SELECT'``.
+        """
+        return self.sql.lstrip().split(" ", 1)[0].upper()
+
+
+class QueryHook:
+    """
+    Subclass this, and override any of the methods, to be notified about
+    queries. Register it using ``Engine.add_hook``.
+
+    The hooks are called for every query, so they should be fast. If a hook
+    raises an exception, it's logged, and the query carries on.
+
+    ``on_error`` is also called if the query is cancelled, in which case
+    ``exception`` is an ``asyncio.CancelledError``.
+    """
+
+    def before_query(self, event: QueryEvent) -> None:
+        pass
+
+    def after_query(self, event: QueryEvent) -> None:
+        pass
+
+    def on_error(self, event: QueryEvent, exception: BaseException) -> None:
+        pass
+
+
+class LoggingHook(QueryHook):
+    """
+    Logs each query using Python's ``logging`` module, along with how long it
+    took, and how many rows were returned.
+
+    :param logger:
+        Defaults to the ``'piccolo.queries'`` logger.
+    :param level:
+        The level used for successful queries. Errors are always logged at
+        ``logging.ERROR``.
+
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+    ):
+        self.logger = logger or logging.getLogger("piccolo.queries")
+        self.level = level
+
+    def after_query(self, event: QueryEvent) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level,
+            "Query %s took %.2fms and returned %s rows: %s",
+            event.query_id,
+            (event.duration or 0.0) * 1000,
+            event.row_count,
+            event.sql,
+            extra={"query_event": event},
+        )
+
+    def on_error(self, event: QueryEvent, exception: BaseException) -> None:
+        self.logger.error(
+            "Query %s failed after %.2fms - %r: %s",
+            event.query_id,
+            (event.duration or 0.0) * 1000,
+            exception,
+            event.sql,
+            extra={"query_event": event},
+        )
+
+
+DB_SYSTEMS = {
+    "postgres": "postgresql",
+    "cockroach": "cockroachdb",
+    "sqlite": "sqlite",
+}
+
+
+class SpanHook(QueryHook):
+    """
+    Emits a span for each query, using the OpenTelemetry semantic conventions
+    for database clients.
+
+    If a ``tracer`` is passed in (from ``opentelemetry.trace.get_tracer``),
+    real OpenTelemetry spans are created. Otherwise no collector or
+    OpenTelemetry packages are required - each finished span is converted to
+    a dictionary in the OpenTelemetry span format, and passed to
+    ``exporter``, and the most recent ones are kept in ``spans``.
+
+    :param tracer:
+        An OpenTelemetry tracer.
+    :param exporter:
+        Called with each finished span, if ``tracer`` isn't specified.
+    :param max_spans:
+        How many of the most recent spans to keep in ``spans``.
+
+    """
+
+    def __init__(
+        self,
+        tracer: Any = None,
+        exporter: Optional[Callable[[dict[str, Any]], None]] = None,
+        max_spans: int = 1000,
+    ):
+        self.tracer = tracer
+        self.exporter = exporter
+        self.spans: collections.deque[dict[str, Any]] = collections.deque(
+            maxlen=max_spans
+        )
+
+    def get_attributes(self, event: QueryEvent) -> dict[str, Any]:
+        attributes: dict[str, Any] = {
+            "db.system": DB_SYSTEMS.get(
+                event.engine.engine_type, event.engine.engine_type
+            ),
+            "db.statement": event.sql,
+            "db.operation": event.operation,
+            "piccolo.args_count": event.args_count,
+            "piccolo.in_transaction": event.in_transaction,
+        }
+        if event.node is not None:
+            attributes["piccolo.node"] = event.node
+        return attributes
+
+    def before_query(self, event: QueryEvent) -> None:
+        if self.tracer is not None:
+            from opentelemetry.trace import SpanKind
+
+            event.context["span"] = self.tracer.start_span(
+                event.operation,
+                kind=SpanKind.CLIENT,
+                attributes=self.get_attributes(event),
+            )
+
+    def _finish(
+        self, event: QueryEvent, exception: Optional[BaseException] = None
+    ) -> None:
+        if self.tracer is not None:
+            from opentelemetry.trace import Status, StatusCode
+
+            span = event.context.pop("span", None)
+            if span is None:
+                return
+
+            if event.row_count is not None:
+                span.set_attribute(
+                    "db.response.returned_rows", event.row_count
+                )
+            if exception is not None:
+                span.record_exception(exception)
+                span.set_status(Status(StatusCode.ERROR, repr(exception)))
+            span.end()
+            return
+
+        start = int(event.start_time * 1e9)
+        attributes = self.get_attributes(event)
+        if event.row_count is not None:
+            attributes["db.response.returned_rows"] = event.row_count
+
+        span_dict: dict[str, Any] = {
+            "name": event.operation,
+            "kind": "SPAN_KIND_CLIENT",
+            "trace_id": os.urandom(16).hex(),
+            "span_id": os.urandom(8).hex(),
+            "start_time_unix_nano": start,
+            "end_time_unix_nano": start + int((event.duration or 0.0) * 1e9),
+            "attributes": attributes,
+            "status": (
+                {"code": "STATUS_CODE_OK"}
+                if exception is None
+                else {
+                    "code": "STATUS_CODE_ERROR",
+                    "message": repr(exception),
+                }
+            ),
+        }
+
+        self.spans.append(span_dict)
+        if self.exporter is not None:
+            self.exporter(span_dict)
+
+    def after_query(self, event: QueryEvent) -> None:
+        self._finish(event)
+
+    def on_error(self, event: QueryEvent, exception: BaseException) -> None:
+        self._finish(event, exception=exception)
+
+
+@dataclass
+class SlowQuery:
+    """
+    A query recorded by :class:`SlowQueryHook`.
+    """
+
+    sql: str
+    args: list[Any]
+    #: In seconds.
+    duration: float
+    #: A value from :func:`time.time` - when the query started.
+    start_time: float
+    engine_type: str
+    node: Optional[str] = None
+    in_transaction: bool = False
+    row_count: Optional[int] = None
+    #: The query plan, if it was captured.
+    plan: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def get_explain_sql(engine_type: str, sql: str, analyze: bool) -> str:
+    """
+    Wraps the SQL in the appropriate ``EXPLAIN`` statement for the engine.
+    """
+    if engine_type == "sqlite":
+        return f"EXPLAIN QUERY PLAN {sql}"
+    elif engine_type == "cockroach":
+        return f"EXPLAIN ANALYZE {sql}" if analyze else f"EXPLAIN {sql}"
+    else:
+        return (
+            f"EXPLAIN (ANALYZE, BUFFERS) {sql}"
+            if analyze
+            else f"EXPLAIN {sql}"
+        )
+
+
+LOCKING_CLAUSE = re.compile(
+    r"\bFOR\s+(NO\s+KEY\s+UPDATE|KEY\s+SHARE|UPDATE|SHARE)\b",
+    flags=re.IGNORECASE,
+)
+
+
+def can_analyze(engine_type: str, sql: str) -> bool:
+    """
+    ``EXPLAIN ANALYZE`` actually runs the query, so only use it for
+    ``SELECT`` queries which don't lock any rows - otherwise it might wait
+    for the locks held by the original query's transaction.
+    """
+    return (
+        engine_type != "sqlite"
+        and sql.lstrip().upper().startswith("SELECT")
+        and LOCKING_CLAUSE.search(sql) is None
+    )
+
+
+def format_plan(engine_type: str, rows: Sequence[Any]) -> str:
+    """
+    Converts the rows returned by ``EXPLAIN`` into text.
+    """
+    if engine_type == "sqlite":
+        return "\n".join(
+            f"{row['id']} {row['parent']} {row['detail']}" for row in rows
+        )
+    return "\n".join(str(next(iter(dict(row).values()))) for row in rows)
+
+
+class SlowQueryHook(QueryHook):
+    """
+    Records any queries which take longer than ``threshold``, in a bounded
+    ring buffer (``entries``).
+
+    It can also capture the query plan for a sample of them, by running the
+    query again in ``EXPLAIN`` on a new connection. ``EXPLAIN ANALYZE``
+    actually runs the query, so it's only used for ``SELECT`` queries which
+    don't lock rows (i.e. without ``FOR UPDATE`` / ``FOR SHARE``), and in a
+    transaction which is rolled back. Other queries are explained without
+    running them.
+
+    :param threshold:
+        In seconds - queries taking at least this long are recorded.
+    :param max_entries:
+        Once this many slow queries have been recorded, the oldest are
+        discarded.
+    :param explain_sample_rate:
+        The proportion of slow queries to capture the query plan for, between
+        ``0.0`` (none) and ``1.0`` (all of them). Only one query plan is
+        captured at a time - any slow queries in the meantime are skipped, so
+        the database isn't overwhelmed with extra connections.
+    :param analyze:
+        Whether to use ``EXPLAIN ANALYZE`` (and ``BUFFERS`` on Postgres). Not
+        supported by SQLite, which only uses ``EXPLAIN QUERY PLAN``.
+    :param path:
+        If specified, the entries are written to this file as JSON each time
+        a slow query is recorded, so they can be viewed using
+        ``piccolo slow_queries show``, from another process. The file is
+        written in the background, and any errors are logged.
+
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        max_entries: int = 100,
+        explain_sample_rate: float = 0.0,
+        analyze: bool = True,
+        path: Optional[str] = None,
+    ):
+        if not 0.0 <= explain_sample_rate <= 1.0:
+            raise ValueError("explain_sample_rate must be between 0 and 1.")
+
+        self.threshold = threshold
+        self.explain_sample_rate = explain_sample_rate
+        self.analyze = analyze
+        self.path = path
+        self.entries: collections.deque[SlowQuery] = collections.deque(
+            maxlen=max_entries
+        )
+        self._tasks: set[asyncio.Task] = set()
+        self._explain_task: Optional[asyncio.Task] = None
+        # Each save is given a version, so an older save which finishes late
+        # doesn't overwrite a newer one.
+        self._save_version = 0
+        self._saved_version = 0
+        self._save_lock = threading.Lock()
+
+    def _create_task(
+        self, coroutine: Coroutine[Any, Any, None]
+    ) -> asyncio.Task:
+        # Hooks are synchronous, so run it in the background.
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def after_query(self, event: QueryEvent) -> None:
+        if event.duration is None or event.duration < self.threshold:
+            return
+
+        entry = SlowQuery(
+            sql=event.sql,
+            args=list(event.args),
+            duration=event.duration,
+            start_time=event.start_time,
+            engine_type=event.engine.engine_type,
+            node=event.node,
+            in_transaction=event.in_transaction,
+            row_count=event.row_count,
+        )
+        self.entries.append(entry)
+
+        if (
+            self.explain_sample_rate
+            and (self._explain_task is None or self._explain_task.done())
+            and random.random() < self.explain_sample_rate
+        ):
+            self._explain_task = self._create_task(
+                self.explain(entry, engine=event.engine)
+            )
+        elif self.path is not None:
+            self._create_task(self.save())
+
+    async def explain(self, entry: SlowQuery, engine: Engine) -> None:
+        """
+        Capture the query plan for the entry.
+        """
+        analyze = self.analyze and can_analyze(
+            engine_type=entry.engine_type, sql=entry.sql
+        )
+        sql = get_explain_sql(
+            engine_type=entry.engine_type, sql=entry.sql, analyze=analyze
+        )
+
+        if entry.node is not None:
+            engine = getattr(engine, "extra_nodes", {}).get(entry.node, engine)
+
+        try:
+            if analyze:
+                rows = await self._run_analyze(
+                    engine=engine, sql=sql, args=entry.args
+                )
+            else:
+                # Bypass ``run_querystring``, so it isn't instrumented.
+                rows = await engine._run_in_new_connection(  # type: ignore
+                    query=sql, args=entry.args
+                )
+        except Exception as exception:
+            entry.plan = f"Unable to capture the plan - {exception!r}"
+        else:
+            entry.plan = format_plan(engine_type=entry.engine_type, rows=rows)
+
+        await self.save()
+
+    @staticmethod
+    async def _run_analyze(
+        engine: Engine, sql: str, args: Sequence[Any]
+    ) -> list[Any]:
+        """
+        Runs ``EXPLAIN ANALYZE`` on a new connection, in a transaction which
+        is always rolled back, in case the query has any side effects (e.g.
+        it calls a volatile function).
+
+        We can't use ``engine.transaction()``, as this runs in the context of
+        the original query, so it might join its transaction.
+        """
+        connection = await engine.get_new_connection()  # type: ignore
+        try:
+            transaction = connection.transaction()
+            await transaction.start()
+            try:
+                return await connection.fetch(sql, *args)
+            finally:
+                await transaction.rollback()
+        finally:
+            await connection.close()
+
+    async def wait(self) -> None:
+        """
+        Wait for any query plans which are still being captured, and for the
+        entries to be saved.
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return [entry.to_dict() for entry in self.entries]
+
+    async def save(self) -> None:
+        """
+        Write the entries to ``path`` as JSON, in a separate thread. Any
+        errors are logged, rather than raised.
+        """
+        if self.path is None:
+            return
+
+        self._save_version += 1
+        try:
+            await asyncio.to_thread(
+                self._write,
+                path=self.path,
+                entries=self.to_dicts(),
+                version=self._save_version,
+            )
+        except OSError:
+            logger.exception(f"Unable to save the slow queries to {self.path}")
+
+    def _write(self, path: str, entries: list[dict[str, Any]], version: int):
+        with self._save_lock:
+            if version < self._saved_version:
+                return
+
+            # Write to a temporary file first, and then rename it, so anyone
+            # reading the file never sees it partially written.
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(dump_json(entries, pretty=True))
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+            self._saved_version = version
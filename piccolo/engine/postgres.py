@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import contextvars
-from collections.abc import Sequence
+import time
+from collections.abc import Generator, Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Union
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
 
 from typing_extensions import Self
 
@@ -35,10 +47,19 @@ class AsyncBatch(BaseBatch):
     connection: Connection
     query: Query
     batch_size: int
+    # If set, the connection is released back to the pool when finished,
+    # rather than being closed.
+    pool: Optional[Pool] = None
+    # If ``True``, the connection belongs to the current transaction, so we
+    # leave it open.
+    in_transaction: bool = False
+    # Which of the engine's ``extra_nodes`` the query is running on.
+    node: Optional[str] = None
 
     # Set internally
     _transaction: Optional[Transaction] = None
     _cursor: Optional[Cursor] = None
+    _closed: bool = False
 
     @property
     def cursor(self) -> Cursor:
@@ -46,6 +67,12 @@ class AsyncBatch(BaseBatch):
             raise ValueError("_cursor not set")
         return self._cursor
 
+    @property
+    def read_ahead(self) -> bool:
+        # Other queries in the transaction share the connection, and asyncpg
+        # only allows one operation at a time on a connection.
+        return not self.in_transaction
+
     @property
     def transaction(self) -> Transaction:
         if not self._transaction:
@@ -66,23 +93,213 @@ class AsyncBatch(BaseBatch):
         return response
 
     async def __aenter__(self: Self) -> Self:
-        self._transaction = self.connection.transaction()
-        await self._transaction.start()
-        querystring = self.query.querystrings[0]
-        template, template_args = querystring.compile_string()
+        try:
+            if not self.in_transaction:
+                # Cursors can only be used within a transaction.
+                transaction = self.connection.transaction()
+                await transaction.start()
+                self._transaction = transaction
+
+            querystring = self.query.querystrings[0]
+            template, template_args = querystring.compile_string()
+
+            # Only opening the cursor is instrumented, rather than fetching
+            # each batch.
+            with self.query.table._meta.db.instrument(
+                template, args=template_args, node=self.node
+            ):
+                self._cursor = await self.connection.cursor(
+                    template, *template_args
+                )
+        except BaseException:
+            # Otherwise the connection is never returned to the pool.
+            await self._close(rollback=True)
+            raise
 
-        self._cursor = await self.connection.cursor(template, *template_args)
         return self
 
+    async def _close(self, rollback: bool):
+        if self.in_transaction or self._closed:
+            return
+
+        self._closed = True
+
+        try:
+            if self._transaction is not None:
+                if rollback:
+                    await self._transaction.rollback()
+                else:
+                    await self._transaction.commit()
+        finally:
+            if self.pool:
+                await self.pool.release(self.connection)
+            else:
+                await self.connection.close()
+
     async def __aexit__(self, exception_type, exception, traceback):
-        if exception:
-            await self.transaction.rollback()
+        await self._close(rollback=exception is not None)
+        return exception is not None
+
+
+###############################################################################
+
+
+class RoutingStrategy(str, Enum):
+    """
+    How :class:`ReplicaRouter` chooses which node to send a query to.
+    """
+
+    round_robin = "round_robin"
+    least_outstanding = "least_outstanding"
+
+
+class ReplicaRouter:
+    """
+    Sends read only queries to the ``extra_nodes`` of a
+    :class:`PostgresEngine` automatically, so ``node`` doesn't need passing to
+    every query.
+
+    If a node can't be reached, it's ejected for ``ejection_time`` seconds,
+    and the query is retried on the main node.
+    """
+
+    __slots__ = (
+        "strategy",
+        "nodes",
+        "max_failures",
+        "ejection_time",
+        "_counter",
+        "_outstanding",
+        "_failures",
+        "_ejected_until",
+    )
+
+    def __init__(
+        self,
+        strategy: Union[
+            RoutingStrategy, Literal["round_robin", "least_outstanding"]
+        ] = RoutingStrategy.round_robin,
+        nodes: Optional[Sequence[str]] = None,
+        max_failures: int = 1,
+        ejection_time: float = 30.0,
+    ):
+        """
+        :param strategy:
+            ``'round_robin'`` takes turns between the nodes.
+            ``'least_outstanding'`` picks the node with the fewest queries
+            currently running on it.
+        :param nodes:
+            The names of the ``extra_nodes`` to use. If not specified, all of
+            them are used.
+        :param max_failures:
+            How many connection errors in a row before a node is ejected.
+        :param ejection_time:
+            How many seconds an ejected node is left out for, before being
+            tried again.
+
+        """
+        self.strategy = RoutingStrategy(strategy)
+        self.nodes = nodes
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self._counter = 0
+        self._outstanding: dict[str, int] = {}
+        self._failures: dict[str, int] = {}
+        self._ejected_until: dict[str, float] = {}
+
+    def is_healthy(self, node: str) -> bool:
+        ejected_until = self._ejected_until.get(node)
+        if ejected_until is None:
+            return True
+
+        if time.monotonic() >= ejected_until:
+            # Re-admit the node - if it's still down, it will be ejected again
+            # on the next failure.
+            del self._ejected_until[node]
+            return True
+
+        return False
+
+    def choose(self, nodes: Sequence[str]) -> Optional[str]:
+        """
+        :returns:
+            The name of the node to run the query on, or ``None`` if no
+            healthy nodes are available, in which case the main node should
+            be used.
+
+        """
+        if self.nodes is not None:
+            nodes = [i for i in nodes if i in self.nodes]
+
+        healthy = [i for i in nodes if self.is_healthy(i)]
+        if not healthy:
+            return None
+
+        self._counter += 1
+
+        if self.strategy == RoutingStrategy.least_outstanding:
+            # Rotate the list first, so ties are shared between the nodes.
+            offset = self._counter % len(healthy)
+            rotated = healthy[offset:] + healthy[:offset]
+            return min(rotated, key=lambda i: self._outstanding.get(i, 0))
+
+        return healthy[self._counter % len(healthy)]
+
+    def record_success(self, node: str):
+        self._failures.pop(node, None)
+
+    def record_failure(self, node: str):
+        failures = self._failures.get(node, 0) + 1
+        if failures >= self.max_failures:
+            self._failures.pop(node, None)
+            self._ejected_until[node] = time.monotonic() + self.ejection_time
         else:
-            await self.transaction.commit()
+            self._failures[node] = failures
 
-        await self.connection.close()
+    @staticmethod
+    def is_connection_error(exception: BaseException) -> bool:
+        """
+        Only connection errors count as failures - an error in the query
+        itself would fail on any node.
+        """
+        if isinstance(exception, (OSError, asyncio.TimeoutError)):
+            return True
+
+        return isinstance(
+            exception,
+            (
+                asyncpg.exceptions.PostgresConnectionError,
+                asyncpg.exceptions.ConnectionDoesNotExistError,
+                asyncpg.exceptions.CannotConnectNowError,
+            ),
+        )
 
-        return exception is not None
+    @contextlib.contextmanager
+    def track(self, node: str) -> Generator[None, None, None]:
+        """
+        Wrap the running of each query with this, so outstanding queries and
+        failures are recorded.
+        """
+        self._outstanding[node] = self._outstanding.get(node, 0) + 1
+        try:
+            yield
+        except BaseException as exception:
+            if self.is_connection_error(exception):
+                self.record_failure(node)
+            raise
+        else:
+            self.record_success(node)
+        finally:
+            self._outstanding[node] -= 1
+
+    @property
+    def ejected_nodes(self) -> list[str]:
+        now = time.monotonic()
+        return [
+            node
+            for node, ejected_until in self._ejected_until.items()
+            if now < ejected_until
+        ]
 
 
 ###############################################################################
@@ -116,22 +333,67 @@ class Atomic(BaseAtomic):
     async def setup_transaction(self, transaction: PostgresTransaction):
         pass
 
-    async def run(self):
+    async def run(self) -> list[Any]:
+        """
+        Runs the queries in a transaction, and returns the response for each
+        one. Consecutive DDL statements are sent to the database together,
+        rather than waiting for each one to complete before sending the next.
+        """
         from piccolo.query.methods.objects import Create, GetOrCreate
 
         try:
+            for query in self.queries:
+                if not isinstance(query, (Query, DDL, Create, GetOrCreate)):
+                    raise ValueError("Unrecognised query")
+
+            # Compile all of the DDL up front.
+            ddl = {
+                index: list(query.ddl)
+                for index, query in enumerate(self.queries)
+                if isinstance(query, DDL)
+            }
+
+            responses: list[Any] = []
+
             async with self.engine.transaction() as transaction:
                 await self.setup_transaction(transaction=transaction)
-                for query in self.queries:
-                    if isinstance(query, (Query, DDL, Create, GetOrCreate)):
-                        await query.run()
-                    else:
-                        raise ValueError("Unrecognised query")
+
+                pending: list[int] = []
+                for index, query in enumerate(self.queries):
+                    if index in ddl:
+                        pending.append(index)
+                        continue
+
+                    if pending:
+                        responses += await self._run_ddl(pending, ddl)
+                        pending = []
+
+                    responses.append(await query.run())
+
+                if pending:
+                    responses += await self._run_ddl(pending, ddl)
+
             self.queries = []
+            return responses
         except Exception as exception:
             self.queries = []
             raise exception from exception
 
+    async def _run_ddl(
+        self, indexes: list[int], ddl: dict[int, list[str]]
+    ) -> list[Any]:
+        statements = [
+            statement for index in indexes for statement in ddl[index]
+        ]
+        if statements:
+            await self.engine.run_ddl_script(statements)
+
+        # Match the response of ``DDL.run``.
+        return [
+            [] if len(ddl[index]) == 1 else [[] for _ in ddl[index]]
+            for index in indexes
+        ]
+
     def run_sync(self):
         return run_sync(self.run())
 
@@ -346,6 +608,35 @@ class PostgresEngine(Engine[PostgresTransaction]):
 
             >>> await MyTable.select().run(node="read_replica_1")
 
+    :param replica_router:
+        If specified, read only queries are sent to the ``extra_nodes``
+        automatically, without having to pass ``node`` to each query. Queries
+        which write data, and any queries inside a transaction, still run on
+        the main node. See :class:`ReplicaRouter`::
+
+            DB = PostgresEngine(
+                config={'database': 'main_db'},
+                extra_nodes={
+                    'read_replica_1': PostgresEngine(...),
+                    'read_replica_2': PostgresEngine(...),
+                },
+                replica_router=ReplicaRouter(strategy='least_outstanding')
+            )
+
+    :param prepared_statement_cache_size:
+        asyncpg prepares each query on the server, and caches the prepared
+        statements for each connection, so the server doesn't have to parse
+        and plan the same query repeatedly. This is how many prepared
+        statements are kept for each connection (the least recently used are
+        removed first). If not specified, asyncpg's default is used (see
+        ``statement_cache_size`` in the asyncpg docs).
+
+        The cached statements are discarded after running DDL (for example,
+        a migration), as they might no longer be valid.
+
+        If you're using PgBouncer in transaction pooling mode, set this to
+        ``0``, as prepared statements can't be reused.
+
     """  # noqa: E501
 
     __slots__ = (
@@ -353,6 +644,7 @@ class PostgresEngine(Engine[PostgresTransaction]):
         "extensions",
         "extra_nodes",
         "pool",
+        "replica_router",
     )
 
     def __init__(
@@ -362,16 +654,25 @@ class PostgresEngine(Engine[PostgresTransaction]):
         log_queries: bool = False,
         log_responses: bool = False,
         extra_nodes: Optional[Mapping[str, PostgresEngine]] = None,
+        prepared_statement_cache_size: Optional[int] = None,
+        replica_router: Optional[ReplicaRouter] = None,
     ) -> None:
         if extra_nodes is None:
             extra_nodes = {}
 
+        if prepared_statement_cache_size is not None:
+            config = {
+                **config,
+                "statement_cache_size": prepared_statement_cache_size,
+            }
+
         self.config = config
         self.extensions = extensions
         self.log_queries = log_queries
         self.log_responses = log_responses
         self.extra_nodes = extra_nodes
         self.pool: Optional[Pool] = None
+        self.replica_router = replica_router
         database_name = config.get("database", "Unknown")
         self.current_transaction = contextvars.ContextVar(
             f"pg_current_transaction_{database_name}", default=None
@@ -466,11 +767,13 @@ class PostgresEngine(Engine[PostgresTransaction]):
             config = dict(self.config)
             config.update(**kwargs)
             self.pool = await asyncpg.create_pool(**config)
+            self.pool_loop = asyncio.get_running_loop()
 
     async def close_connection_pool(self) -> None:
         if self.pool:
             await self.pool.close()
             self.pool = None
+            self.pool_loop = None
         else:
             colored_warning("No pool is running.")
 
@@ -498,15 +801,114 @@ class PostgresEngine(Engine[PostgresTransaction]):
         :param node:
             Which node to run the query on (see ``extra_nodes``). If not
             specified, it runs on the main Postgres node.
+
+        If a transaction is active, its connection is used, so uncommitted
+        rows are visible. Otherwise a connection is taken from the pool, if
+        one is running.
+
         """
+        current_transaction = None if node else self.current_transaction.get()
+
+        if node is None and current_transaction is None:
+            node = self._get_read_node(query.querystrings[0])
+
         engine: Any = self.extra_nodes.get(node) if node else self
+
+        if current_transaction:
+            return AsyncBatch(
+                connection=current_transaction.connection,
+                query=query,
+                batch_size=batch_size,
+                in_transaction=True,
+            )
+
+        if engine.pool:
+            connection = await engine.pool.acquire()
+            return AsyncBatch(
+                connection=connection,
+                query=query,
+                batch_size=batch_size,
+                pool=engine.pool,
+                node=node,
+            )
+
         connection = await engine.get_new_connection()
         return AsyncBatch(
-            connection=connection, query=query, batch_size=batch_size
+            connection=connection,
+            query=query,
+            batch_size=batch_size,
+            node=node,
         )
 
     ###########################################################################
 
+    async def copy_records_to_table(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        records: Sequence[tuple],
+        schema_name: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> str:
+        """
+        Inserts the records using Postgres' ``COPY`` command, which is much
+        faster than ``INSERT`` for large numbers of rows.
+
+        :param table_name:
+            The unquoted name of the table.
+        :param columns:
+            The unquoted names of the columns, in the same order as the values
+            in each record.
+        :param records:
+            The values for each row.
+        :returns:
+            The status returned by Postgres, e.g. ``'COPY 1000'``.
+
+        """
+        query_id = self.get_query_id()
+        column_names = ",".join(f'"{i}"' for i in columns)
+        sql = f'COPY "{table_name}" ({column_names}) FROM STDIN'
+
+        if self.log_queries:
+            self.print_query(
+                query_id=query_id, query=f"{sql} - {len(records)} rows"
+            )
+
+        kwargs: dict[str, Any] = {
+            "records": records,
+            "columns": columns,
+            "schema_name": schema_name,
+        }
+
+        with self.instrument(sql, query_id=query_id) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                connection = current_transaction.connection
+                status = await connection.copy_records_to_table(
+                    table_name, **kwargs
+                )
+            elif in_pool and self.pool:
+                async with self.pool.acquire() as connection:
+                    status = await connection.copy_records_to_table(
+                        table_name, **kwargs
+                    )
+            else:
+                connection = await self.get_new_connection()
+                try:
+                    status = await connection.copy_records_to_table(
+                        table_name, **kwargs
+                    )
+                finally:
+                    await connection.close()
+
+            if event is not None:
+                event.row_count = 0
+
+        return status
+
+    ###########################################################################
+
     async def _run_in_pool(
         self, query: str, args: Optional[Sequence[Any]] = None
     ):
@@ -536,6 +938,20 @@ class PostgresEngine(Engine[PostgresTransaction]):
         await connection.close()
         return results
 
+    def _get_read_node(self, querystring: QueryString) -> Optional[str]:
+        """
+        If a ``replica_router`` is configured, and the query only reads data,
+        returns which of the ``extra_nodes`` to run it on.
+        """
+        if (
+            self.replica_router is None
+            or querystring.query_type != "select"
+            or self.current_transaction.get() is not None
+        ):
+            return None
+
+        return self.replica_router.choose(list(self.extra_nodes))
+
     async def run_querystring(
         self, querystring: QueryString, in_pool: bool = True
     ):
@@ -543,47 +959,128 @@ class PostgresEngine(Engine[PostgresTransaction]):
             engine_type=self.engine_type
         )
 
+        node = self._get_read_node(querystring)
+        if node is not None:
+            replica_router = cast(ReplicaRouter, self.replica_router)
+            try:
+                with replica_router.track(node), self.instrument(
+                    query, args=query_args, node=node
+                ) as event:
+                    response = await self.extra_nodes[node].run_querystring(
+                        querystring, in_pool=in_pool
+                    )
+                    if event is not None:
+                        event.row_count = len(response)
+                    return response
+            except Exception as exception:
+                if not replica_router.is_connection_error(exception):
+                    raise
+                # Fall back to the main node.
+
         query_id = self.get_query_id()
 
         if self.log_queries:
             self.print_query(query_id=query_id, query=querystring.__str__())
 
-        # If running inside a transaction:
-        current_transaction = self.current_transaction.get()
-        if current_transaction:
-            response = await current_transaction.connection.fetch(
-                query, *query_args
-            )
-        elif in_pool and self.pool:
-            response = await self._run_in_pool(query, query_args)
-        else:
-            response = await self._run_in_new_connection(query, query_args)
+        with self.instrument(
+            query, args=query_args, query_id=query_id
+        ) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                response = await current_transaction.connection.fetch(
+                    query, *query_args
+                )
+            elif in_pool and self.pool:
+                response = await self._run_in_pool(query, query_args)
+            else:
+                response = await self._run_in_new_connection(query, query_args)
+
+            if event is not None:
+                event.row_count = len(response)
 
         if self.log_responses:
             self.print_response(query_id=query_id, response=response)
 
         return response
 
+    @staticmethod
+    async def _discard_cached_statements(connection: Connection):
+        """
+        Call this after running DDL. asyncpg caches a prepared statement for
+        each query, which might now be invalid. asyncpg retries the query if
+        so, but not within a transaction, so we discard them (for every
+        connection in the pool).
+        """
+        await connection.reload_schema_state()
+
     async def run_ddl(self, ddl: str, in_pool: bool = True):
         query_id = self.get_query_id()
 
         if self.log_queries:
             self.print_query(query_id=query_id, query=ddl)
 
-        # If running inside a transaction:
-        current_transaction = self.current_transaction.get()
-        if current_transaction:
-            response = await current_transaction.connection.fetch(ddl)
-        elif in_pool and self.pool:
-            response = await self._run_in_pool(ddl)
-        else:
-            response = await self._run_in_new_connection(ddl)
+        with self.instrument(ddl, query_id=query_id) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                connection = current_transaction.connection
+                response = await connection.fetch(ddl)
+                await self._discard_cached_statements(connection)
+            elif in_pool and self.pool:
+                async with self.pool.acquire() as connection:
+                    response = await connection.fetch(ddl)
+                    await self._discard_cached_statements(connection)
+            else:
+                response = await self._run_in_new_connection(ddl)
+
+            if event is not None:
+                event.row_count = len(response)
 
         if self.log_responses:
             self.print_response(query_id=query_id, response=response)
 
         return response
 
+    async def run_ddl_script(self, ddl: Sequence[str], in_pool: bool = True):
+        """
+        Runs several DDL statements using a single round trip to the
+        database, rather than waiting for each one to complete before sending
+        the next.
+
+        :param ddl:
+            The DDL statements to run. They mustn't contain any arguments.
+
+        """
+        if self.log_queries:
+            for statement in ddl:
+                self.print_query(query_id=self.get_query_id(), query=statement)
+
+        # Without any arguments, asyncpg uses the simple query protocol, which
+        # supports several statements at once.
+        script = ";\n".join(ddl)
+
+        with self.instrument(script) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                connection = current_transaction.connection
+                await connection.execute(script)
+                await self._discard_cached_statements(connection)
+            elif in_pool and self.pool:
+                async with self.pool.acquire() as connection:
+                    await connection.execute(script)
+                    await self._discard_cached_statements(connection)
+            else:
+                connection = await self.get_new_connection()
+                try:
+                    await connection.execute(script)
+                finally:
+                    await connection.close()
+
+            if event is not None:
+                event.row_count = 0
+
     def transform_response_to_dicts(self, results) -> list[dict]:
         """
         asyncpg returns a special Record object, so we need to convert it to
@@ -591,6 +1088,25 @@ class PostgresEngine(Engine[PostgresTransaction]):
         """
         return [dict(i) for i in results]
 
+    def transform_response_to_tuples(self, results) -> list[tuple]:
+        """
+        asyncpg's ``Record`` objects can be converted directly to tuples.
+        """
+        return [tuple(i) for i in results]
+
+    def transform_response_to_columns(
+        self, results, column_names: Sequence[str] = ()
+    ) -> dict[str, list]:
+        """
+        asyncpg's ``Record`` objects are iterable, so can be transposed
+        directly.
+        """
+        if not results:
+            return {name: [] for name in column_names}
+
+        names = list(results[0].keys())
+        return dict(zip(names, map(list, zip(*results))))
+
     def atomic(self) -> Atomic:
         return Atomic(engine=self)
 
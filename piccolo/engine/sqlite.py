@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import datetime
 import enum
 import os
 import sqlite3
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from functools import partial, wraps
-from typing import TYPE_CHECKING, Any, Optional, Union
+from functools import lru_cache, partial, wraps
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 from typing_extensions import Self
 
@@ -27,6 +28,7 @@ from piccolo.querystring import QueryString
 from piccolo.utils.encoding import dump_json, load_json
 from piccolo.utils.lazy_loader import LazyLoader
 from piccolo.utils.sync import run_sync
+from piccolo.utils.warnings import colored_warning
 
 aiosqlite = LazyLoader("aiosqlite", globals(), "aiosqlite")
 
@@ -290,6 +292,45 @@ def convert_M2M_out(value: str) -> list:
     return value.split(",")
 
 
+@decode_to_string
+def convert_M2M_JSON_out(value: str) -> list:
+    return load_json(value)
+
+
+def convert_json_value_out(value: Any, column_type: str) -> Any:
+    """
+    Values extracted using SQLite's JSON functions (e.g. ``json_object``)
+    bypass the converters registered with ``sqlite3``, so we apply them here
+    instead, based on the column type.
+    """
+    if value is None:
+        return None
+
+    # Mimic how ``sqlite3.PARSE_DECLTYPES`` extracts the type name.
+    type_name = column_type.split("(")[0].split(" ")[0].upper()
+    converter = sqlite3.converters.get(type_name)
+    if converter is None:
+        return value
+
+    return converter(str(value).encode("utf8"))
+
+
+@lru_cache(maxsize=1)
+def json_functions_supported() -> bool:
+    """
+    SQLite's JSON functions are built in from version 3.38, and are usually
+    available in older versions too, but it's not guaranteed.
+    """
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.execute("SELECT json_group_array(json_object('a', 1))")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+    return True
+
+
 ###############################################################################
 # Register the basic converters
 
@@ -304,6 +345,7 @@ CONVERTERS = {
     "TIMESTAMP": convert_timestamp_out,
     "TIMESTAMPTZ": convert_timestamptz_out,
     "M2M": convert_M2M_out,
+    "M2M_JSON": convert_M2M_JSON_out,
 }
 
 for column_name, converter in CONVERTERS.items():
@@ -362,11 +404,20 @@ class AsyncBatch(BaseBatch):
         querystring = self.query.querystrings[0]
         template, template_args = querystring.compile_string()
 
-        self._cursor = await self.connection.execute(template, *template_args)
+        # Only opening the cursor is instrumented, rather than fetching each
+        # batch.
+        with self.query.table._meta.db.instrument(
+            template, args=template_args
+        ):
+            self._cursor = await self.connection.execute(
+                template, template_args
+            )
         return self
 
     async def __aexit__(self, exception_type, exception, traceback):
-        await self.cursor.close()
+        # The cursor won't exist if the query failed.
+        if self._cursor is not None:
+            await self._cursor.close()
         await self.connection.close()
         return exception is not None
 
@@ -411,19 +462,49 @@ class Atomic(BaseAtomic):
     def add(self, *query: Union[Query, DDL]):
         self.queries += list(query)
 
-    async def run(self):
+    async def run(self) -> list[Any]:
+        """
+        Runs the queries in a transaction, and returns the response for each
+        one. If all of the queries are DDL statements, they're run using a
+        single ``executescript`` call.
+        """
         from piccolo.query.methods.objects import Create, GetOrCreate
 
         try:
+            for query in self.queries:
+                if not isinstance(query, (Query, DDL, Create, GetOrCreate)):
+                    raise ValueError("Unrecognised query")
+
+            if (
+                self.queries
+                and all(isinstance(query, DDL) for query in self.queries)
+                # ``executescript`` commits any open transaction first.
+                and self.engine.current_transaction.get() is None
+            ):
+                ddl = [list(cast(DDL, query).ddl) for query in self.queries]
+                await self.engine.run_ddl_script(
+                    [
+                        statement
+                        for statements in ddl
+                        for statement in statements
+                    ],
+                    transaction_type=self.transaction_type,
+                )
+                self.queries = []
+                # Match the response of ``DDL.run``.
+                return [
+                    [] if len(statements) == 1 else [[] for _ in statements]
+                    for statements in ddl
+                ]
+
+            responses: list[Any] = []
             async with self.engine.transaction(
                 transaction_type=self.transaction_type
             ):
                 for query in self.queries:
-                    if isinstance(query, (Query, DDL, Create, GetOrCreate)):
-                        await query.run()
-                    else:
-                        raise ValueError("Unrecognised query")
+                    responses.append(await query.run())
             self.queries = []
+            return responses
         except Exception as exception:
             self.queries = []
             raise exception from exception
@@ -523,7 +604,10 @@ class SQLiteTransaction(BaseTransaction):
         return self
 
     async def get_connection(self):
-        return await self.engine.get_connection()
+        if self.engine.pool:
+            return await self.engine.pool.acquire()
+        else:
+            return await self.engine.get_connection()
 
     async def begin(self):
         await self.connection.execute(f"BEGIN {self.transaction_type.value}")
@@ -569,7 +653,11 @@ class SQLiteTransaction(BaseTransaction):
             if not self._committed and not self._rolled_back:
                 await self.commit()
 
-        await self.connection.close()
+        if self.engine.pool:
+            await self.engine.pool.release(self.connection)
+        else:
+            await self.connection.close()
+
         self.engine.current_transaction.reset(self.context)
 
         return exception is None
@@ -578,18 +666,146 @@ class SQLiteTransaction(BaseTransaction):
 ###############################################################################
 
 
+class SQLitePool:
+    """
+    SQLite only allows one connection to write to the database at a time, but
+    several can read from it. So we keep a fixed number of long lived
+    connections for read queries, and a single connection for everything
+    else, which is only used by one query at a time.
+
+    Create it using ``SQLiteEngine.start_connection_pool``.
+    """
+
+    __slots__ = ("engine", "max_size", "_readers", "_writer", "_writer_lock")
+
+    def __init__(self, engine: SQLiteEngine, max_size: int = 4):
+        """
+        :param max_size:
+            The number of connections used for read queries.
+
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+
+        self.engine = engine
+        self.max_size = max_size
+        self._readers: asyncio.Queue[Connection] = asyncio.Queue()
+        self._writer: Optional[Connection] = None
+        self._writer_lock = asyncio.Lock()
+
+    async def start(self):
+        for _ in range(self.max_size):
+            self._readers.put_nowait(await self.engine.get_connection())
+        self._writer = await self.engine.get_connection()
+
+    async def close(self):
+        """
+        Waits for any connections which are in use to be released, and then
+        closes all of them.
+        """
+        for _ in range(self.max_size):
+            connection = await self._readers.get()
+            await connection.close()
+
+        if self._writer is not None:
+            async with self._writer_lock:
+                await self._writer.close()
+                self._writer = None
+
+    async def acquire(self, read_only: bool = False) -> Connection:
+        """
+        :param read_only:
+            If ``True``, one of the read connections is returned, otherwise
+            we wait until the write connection is available.
+
+        """
+        if read_only:
+            return await self._readers.get()
+
+        await self._writer_lock.acquire()
+        if self._writer is None:
+            self._writer_lock.release()
+            raise ValueError("The pool has been closed.")
+        return self._writer
+
+    async def release(self, connection: Connection):
+        if connection is self._writer:
+            self._writer_lock.release()
+        else:
+            self._readers.put_nowait(connection)
+
+
+###############################################################################
+
+# The values we accept for PRAGMAs which take a string - they can't be
+# parameterised, so we validate them instead. SQLite isn't case sensitive, so
+# they're normalised to lowercase.
+JOURNAL_MODES = ("delete", "truncate", "persist", "memory", "wal", "off")
+SYNCHRONOUS_MODES = ("off", "normal", "full", "extra")
+STRING_PRAGMAS: dict[str, tuple[str, ...]] = {
+    "auto_vacuum": ("none", "full", "incremental"),
+    "journal_mode": JOURNAL_MODES,
+    "locking_mode": ("normal", "exclusive"),
+    "synchronous": SYNCHRONOUS_MODES,
+    "temp_store": ("default", "file", "memory"),
+}
+
+
+def validate_pragmas(pragmas: dict[str, Any]) -> dict[str, Any]:
+    """
+    Raises a ``ValueError`` if any of the PRAGMAs are invalid, otherwise
+    returns them with any string values in lowercase.
+    """
+    output = {}
+
+    for name, value in pragmas.items():
+        if not name.isidentifier():
+            raise ValueError(f"{name} isn't a valid PRAGMA name")
+
+        if isinstance(value, str):
+            choices = STRING_PRAGMAS.get(name)
+            if choices is None:
+                raise ValueError(f"{name} must be an integer")
+
+            value = value.lower()
+            if value not in choices:
+                raise ValueError(f"{name} must be one of {', '.join(choices)}")
+        elif not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{name} must be an integer or a string")
+        elif name in ("journal_mode", "locking_mode"):
+            raise ValueError(f"{name} must be a string")
+
+        output[name] = value
+
+    return output
+
+
+###############################################################################
+
+
 def dict_factory(cursor, row) -> dict:
     return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
 
 
 class SQLiteEngine(Engine[SQLiteTransaction]):
-    __slots__ = ("connection_kwargs",)
+    __slots__ = ("connection_kwargs", "pool", "pragmas")
+
+    # Older versions of SQLite only allow 999 bind parameters by default.
+    max_query_parameters = (
+        32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    )
 
     def __init__(
         self,
         path: str = "piccolo.sqlite",
         log_queries: bool = False,
         log_responses: bool = False,
+        journal_mode: Optional[str] = None,
+        synchronous: Optional[str] = None,
+        busy_timeout: Optional[int] = None,
+        cache_size: Optional[int] = None,
+        mmap_size: Optional[int] = None,
+        extra_pragmas: Optional[dict[str, Union[str, int]]] = None,
         **connection_kwargs,
     ) -> None:
         """
@@ -602,6 +818,30 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
         :param log_responses:
             If ``True``, the raw response from each query is printed out.
             Useful for debugging.
+        :param journal_mode:
+            For example ``'wal'``, which lets readers continue while another
+            connection is writing, and is recommended when there are lots of
+            concurrent queries. See the `SQLite docs <https://www.sqlite.org/pragma.html#pragma_journal_mode>`_.
+        :param synchronous:
+            For example ``'normal'``, which is safe to use with ``'wal'``
+            mode, and reduces the number of disk syncs. See the `SQLite docs <https://www.sqlite.org/pragma.html#pragma_synchronous>`_.
+        :param busy_timeout:
+            How many milliseconds to wait for a lock to be released, before
+            raising a ``database is locked`` error.
+        :param cache_size:
+            The number of pages of the database cached in memory (or if
+            negative, the number of kibibytes). See the `SQLite docs <https://www.sqlite.org/pragma.html#pragma_cache_size>`_.
+        :param mmap_size:
+            The maximum number of bytes of the database file to access using
+            memory mapped I/O.
+        :param extra_pragmas:
+            Any other PRAGMAs to set, for example
+            ``{'temp_store': 'memory'}``.
+
+        The PRAGMA values above are set whenever a connection is opened. If
+        not specified, SQLite's defaults are used. The values are available
+        via ``engine.pragmas``.
+
         :param connection_kwargs:
             These are passed directly to the database adapter. We recommend
             setting ``timeout`` if you expect your application to process a
@@ -623,6 +863,26 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
             **connection_kwargs,
         }
 
+        self.pool: Optional[SQLitePool] = None
+
+        # The order matters - `busy_timeout` is set first, as changing
+        # `journal_mode` needs a lock.
+        pragmas: dict[str, Any] = {
+            "busy_timeout": busy_timeout,
+            "journal_mode": journal_mode,
+            "synchronous": synchronous,
+            "cache_size": cache_size,
+            "mmap_size": mmap_size,
+            **(extra_pragmas or {}),
+        }
+        self.pragmas = validate_pragmas(
+            {
+                name: value
+                for name, value in pragmas.items()
+                if value is not None
+            }
+        )
+
         self.current_transaction = contextvars.ContextVar(
             f"sqlite_current_transaction_{path}", default=None
         )
@@ -673,6 +933,38 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
 
     ###########################################################################
 
+    async def start_connection_pool(self, max_size: int = 4) -> None:
+        """
+        Rather than opening a new connection for each query, reuse a fixed
+        set of connections. See :class:`SQLitePool`.
+
+        :param max_size:
+            The number of connections used for read queries. There's always
+            a single connection for writes, as SQLite only supports one
+            writer at a time.
+
+        """
+        if self.pool:
+            colored_warning(
+                "A pool already exists - close it first if you want to create "
+                "a new pool.",
+            )
+        else:
+            pool = SQLitePool(engine=self, max_size=max_size)
+            await pool.start()
+            self.pool = pool
+            self.pool_loop = asyncio.get_running_loop()
+
+    async def close_connection_pool(self) -> None:
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+            self.pool_loop = None
+        else:
+            colored_warning("No pool is running.")
+
+    ###########################################################################
+
     async def batch(
         self, query: Query, batch_size: int = 100, node: Optional[str] = None
     ) -> AsyncBatch:
@@ -693,9 +985,14 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
     ###########################################################################
 
     async def get_connection(self) -> Connection:
+        """
+        Returns a new connection - doesn't retrieve it from the pool.
+        """
         connection = await aiosqlite.connect(**self.connection_kwargs)
         connection.row_factory = dict_factory  # type: ignore
         await connection.execute("PRAGMA foreign_keys = 1")
+        for name, value in self.pragmas.items():
+            await connection.execute(f"PRAGMA {name} = {value}")
         return connection
 
     ###########################################################################
@@ -713,30 +1010,85 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
         response = await cursor.fetchone()
         return response[table._meta.primary_key._meta.db_column_name]
 
-    async def _run_in_new_connection(
+    async def _run(
         self,
+        connection: Connection,
         query: str,
         args: Optional[list[Any]] = None,
         query_type: str = "generic",
         table: Optional[type[Table]] = None,
+        commit: bool = False,
     ):
+        """
+        :param commit:
+            Only needed if ``isolation_level`` has been overridden in
+            ``connection_kwargs``. Don't use it within a transaction.
+
+        """
         if args is None:
             args = []
-        async with aiosqlite.connect(**self.connection_kwargs) as connection:
-            await connection.execute("PRAGMA foreign_keys = 1")
 
-            connection.row_factory = dict_factory  # type: ignore
-            async with connection.execute(query, args) as cursor:
+        async with connection.execute(query, args) as cursor:
+            response = await cursor.fetchall()
+
+            if commit:
                 await connection.commit()
 
-                if query_type == "insert" and self.get_version_sync() < 3.35:
-                    # We can't use the RETURNING clause on older versions
-                    # of SQLite.
-                    assert table is not None
-                    pk = await self._get_inserted_pk(cursor, table)
-                    return [{table._meta.primary_key._meta.db_column_name: pk}]
-                else:
-                    return await cursor.fetchall()
+            if query_type == "insert" and self.get_version_sync() < 3.35:
+                # We can't use the RETURNING clause on older versions
+                # of SQLite.
+                assert table is not None
+                pk = await self._get_inserted_pk(cursor, table)
+                return [{table._meta.primary_key._meta.db_column_name: pk}]
+            else:
+                return response
+
+    async def _run_in_pool(
+        self,
+        query: str,
+        args: Optional[list[Any]] = None,
+        query_type: str = "generic",
+        table: Optional[type[Table]] = None,
+    ):
+        if not self.pool:
+            raise ValueError("A pool isn't currently running.")
+
+        connection = await self.pool.acquire(
+            read_only=(query_type == "select")
+        )
+
+        try:
+            return await self._run(
+                connection=connection,
+                query=query,
+                args=args,
+                query_type=query_type,
+                table=table,
+                commit=True,
+            )
+        finally:
+            await self.pool.release(connection)
+
+    async def _run_in_new_connection(
+        self,
+        query: str,
+        args: Optional[list[Any]] = None,
+        query_type: str = "generic",
+        table: Optional[type[Table]] = None,
+    ):
+        connection = await self.get_connection()
+
+        try:
+            return await self._run(
+                connection=connection,
+                query=query,
+                args=args,
+                query_type=query_type,
+                table=table,
+                commit=True,
+            )
+        finally:
+            await connection.close()
 
     async def _run_in_existing_connection(
         self,
@@ -749,29 +1101,22 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
         """
         This is used when a transaction is currently active.
         """
-        if args is None:
-            args = []
-        await connection.execute("PRAGMA foreign_keys = 1")
-
-        connection.row_factory = dict_factory
-        async with connection.execute(query, args) as cursor:
-            response = await cursor.fetchall()
-
-            if query_type == "insert" and self.get_version_sync() < 3.35:
-                # We can't use the RETURNING clause on older versions
-                # of SQLite.
-                assert table is not None
-                pk = await self._get_inserted_pk(cursor, table)
-                return [{table._meta.primary_key._meta.db_column_name: pk}]
-            else:
-                return response
+        return await self._run(
+            connection=connection,
+            query=query,
+            args=args,
+            query_type=query_type,
+            table=table,
+        )
 
     async def run_querystring(
-        self, querystring: QueryString, in_pool: bool = False
+        self, querystring: QueryString, in_pool: bool = True
     ):
         """
-        Connection pools aren't currently supported - the argument is there
-        for consistency with other engines.
+        :param in_pool:
+            Whether to run this in a connection pool if one is running (see
+            ``start_connection_pool``).
+
         """
         query_id = self.get_query_id()
 
@@ -782,56 +1127,214 @@ class SQLiteEngine(Engine[SQLiteTransaction]):
             engine_type=self.engine_type
         )
 
-        # If running inside a transaction:
-        current_transaction = self.current_transaction.get()
-        if current_transaction:
-            response = await self._run_in_existing_connection(
-                connection=current_transaction.connection,
-                query=query,
-                args=query_args,
-                query_type=querystring.query_type,
-                table=querystring.table,
-            )
-        else:
-            response = await self._run_in_new_connection(
-                query=query,
-                args=query_args,
-                query_type=querystring.query_type,
-                table=querystring.table,
-            )
+        with self.instrument(
+            query, args=query_args, query_id=query_id
+        ) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                response = await self._run_in_existing_connection(
+                    connection=current_transaction.connection,
+                    query=query,
+                    args=query_args,
+                    query_type=querystring.query_type,
+                    table=querystring.table,
+                )
+            elif in_pool and self.pool:
+                response = await self._run_in_pool(
+                    query=query,
+                    args=query_args,
+                    query_type=querystring.query_type,
+                    table=querystring.table,
+                )
+            else:
+                response = await self._run_in_new_connection(
+                    query=query,
+                    args=query_args,
+                    query_type=querystring.query_type,
+                    table=querystring.table,
+                )
+
+            if event is not None:
+                event.row_count = len(response)
 
         if self.log_responses:
             self.print_response(query_id=query_id, response=response)
 
         return response
 
-    async def run_ddl(self, ddl: str, in_pool: bool = False):
+    async def _executemany(
+        self,
+        connection: Connection,
+        query: str,
+        args_list: Sequence[Sequence[Any]],
+        commit: bool = False,
+    ):
+        await connection.executemany(query, args_list)
+        if commit:
+            await connection.commit()
+
+    async def run_executemany(
+        self,
+        querystring: QueryString,
+        args_list: Sequence[Sequence[Any]],
+        in_pool: bool = True,
+    ):
+        """
+        Runs the same query once for each set of arguments, so the query only
+        needs preparing once.
+
+        :param querystring:
+            The query to run. Its own argument values are ignored - only the
+            compiled SQL is used.
+        :param args_list:
+            The arguments for each run of the query.
+        :param in_pool:
+            Whether to run this in a connection pool if one is running (see
+            ``start_connection_pool``).
+
+        """
+        query_id = self.get_query_id()
+
+        if self.log_queries:
+            self.print_query(
+                query_id=query_id,
+                query=f"{querystring} - {len(args_list)} times",
+            )
+
+        query, _ = querystring.compile_string(engine_type=self.engine_type)
+
+        with self.instrument(
+            query,
+            args_count=sum(len(i) for i in args_list),
+            query_id=query_id,
+        ) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                await self._executemany(
+                    connection=current_transaction.connection,
+                    query=query,
+                    args_list=args_list,
+                )
+            elif in_pool and self.pool:
+                connection = await self.pool.acquire()
+                try:
+                    await self._executemany(
+                        connection=connection,
+                        query=query,
+                        args_list=args_list,
+                        commit=True,
+                    )
+                finally:
+                    await self.pool.release(connection)
+            else:
+                connection = await self.get_connection()
+                try:
+                    await self._executemany(
+                        connection=connection,
+                        query=query,
+                        args_list=args_list,
+                        commit=True,
+                    )
+                finally:
+                    await connection.close()
+
+            if event is not None:
+                event.row_count = 0
+
+    async def run_ddl(self, ddl: str, in_pool: bool = True):
         """
-        Connection pools aren't currently supported - the argument is there
-        for consistency with other engines.
+        :param in_pool:
+            Whether to run this in a connection pool if one is running (see
+            ``start_connection_pool``).
+
         """
         query_id = self.get_query_id()
 
         if self.log_queries:
             self.print_query(query_id=query_id, query=ddl)
 
-        # If running inside a transaction:
-        current_transaction = self.current_transaction.get()
-        if current_transaction:
-            response = await self._run_in_existing_connection(
-                connection=current_transaction.connection,
-                query=ddl,
-            )
-        else:
-            response = await self._run_in_new_connection(
-                query=ddl,
-            )
+        with self.instrument(ddl, query_id=query_id) as event:
+            # If running inside a transaction:
+            current_transaction = self.current_transaction.get()
+            if current_transaction:
+                response = await self._run_in_existing_connection(
+                    connection=current_transaction.connection,
+                    query=ddl,
+                )
+            elif in_pool and self.pool:
+                response = await self._run_in_pool(query=ddl)
+            else:
+                response = await self._run_in_new_connection(
+                    query=ddl,
+                )
+
+            if event is not None:
+                event.row_count = len(response)
 
         if self.log_responses:
             self.print_response(query_id=query_id, response=response)
 
         return response
 
+    async def run_ddl_script(
+        self,
+        ddl: Sequence[str],
+        transaction_type: TransactionType = TransactionType.deferred,
+        in_pool: bool = True,
+    ):
+        """
+        Runs several DDL statements in a transaction, using a single
+        ``executescript`` call, rather than one call per statement.
+
+        It can't be used within an existing transaction, as
+        ``executescript`` commits it first.
+
+        :param ddl:
+            The DDL statements to run. They mustn't contain any arguments.
+        :param transaction_type:
+            The type of transaction to run the statements in.
+        :param in_pool:
+            Whether to run this in a connection pool if one is running (see
+            ``start_connection_pool``).
+
+        """
+        if self.current_transaction.get():
+            raise TransactionError(
+                "DDL scripts can't be run within an existing transaction."
+            )
+
+        if self.log_queries:
+            for statement in ddl:
+                self.print_query(query_id=self.get_query_id(), query=statement)
+
+        script = ";\n".join(
+            [f"BEGIN {transaction_type.value}", *ddl, "COMMIT;"]
+        )
+
+        if in_pool and self.pool:
+            connection = await self.pool.acquire()
+        else:
+            connection = await self.get_connection()
+
+        try:
+            with self.instrument(script) as event:
+                await connection.executescript(script)
+                if event is not None:
+                    event.row_count = 0
+        except Exception:
+            # The script stops at the failing statement, so the transaction
+            # is still open.
+            if connection.in_transaction:
+                await connection.execute("ROLLBACK")
+            raise
+        finally:
+            if in_pool and self.pool:
+                await self.pool.release(connection)
+            else:
+                await connection.close()
+
     def atomic(
         self, transaction_type: TransactionType = TransactionType.deferred
     ) -> Atomic:
@@ -20,6 +20,9 @@ from piccolo.apps.playground.piccolo_app import APP_CONFIG as playground_config
 from piccolo.apps.project.piccolo_app import APP_CONFIG as project_config
 from piccolo.apps.schema.piccolo_app import APP_CONFIG as schema_config
 from piccolo.apps.shell.piccolo_app import APP_CONFIG as shell_config
+from piccolo.apps.slow_queries.piccolo_app import (
+    APP_CONFIG as slow_queries_config,
+)
 from piccolo.apps.sql_shell.piccolo_app import APP_CONFIG as sql_shell_config
 from piccolo.apps.tester.piccolo_app import APP_CONFIG as tester_config
 from piccolo.apps.user.piccolo_app import APP_CONFIG as user_config
@@ -68,6 +71,7 @@ def main() -> None:
         project_config,
         schema_config,
         shell_config,
+        slow_queries_config,
         sql_shell_config,
         tester_config,
         user_config,
@@ -1,4 +1,5 @@
 from piccolo.columns.combination import WhereRaw
+from piccolo.querystring import Param
 
 from .base import Query
 from .functions.aggregate import Avg, Max, Min, Sum
@@ -34,6 +35,7 @@ __all__ = [
     "Min",
     "Objects",
     "OrderByRaw",
+    "Param",
     "Query",
     "Raw",
     "Select",
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import copy
 from collections.abc import Generator, Sequence
 from time import time
-from typing import TYPE_CHECKING, Any, Generic, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
 
 from piccolo.columns.column_types import JSON, JSONB
 from piccolo.custom_types import QueryResponseType, TableInstance
@@ -10,13 +20,18 @@ from piccolo.query.mixins import ColumnsDelegate
 from piccolo.query.operators.json import JSONQueryString
 from piccolo.querystring import QueryString
 from piccolo.utils.encoding import load_json
-from piccolo.utils.objects import make_nested_object
-from piccolo.utils.sync import run_sync
+from piccolo.utils.lazy_loader import LazyLoader
+from piccolo.utils.objects import make_nested_objects
+from piccolo.utils.sync import can_use_pool_sync, run_sync
 
 if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.engine.base import IdentityMap
+    from piccolo.query.explain import Explain, ExplainFormat, QueryPlan
     from piccolo.query.mixins import OutputDelegate
     from piccolo.table import Table  # noqa
 
+numpy = LazyLoader("numpy", globals(), "numpy")
+
 
 class Timer:
     def __enter__(self):
@@ -46,7 +61,43 @@ class Query(Generic[TableInstance, QueryResponseType]):
         else:
             raise ValueError("Engine isn't defined.")
 
+    @property
+    def _identity_map(self) -> Optional[IdentityMap]:
+        """
+        The identity map for the current task, if one is active. See
+        :meth:`Engine.identity_map <piccolo.engine.base.Engine.identity_map>`.
+        """
+        return self.table._meta.db.current_identity_map.get()
+
     async def _process_results(self, results) -> QueryResponseType:
+        output: Optional[OutputDelegate] = getattr(
+            self, "output_delegate", None
+        )
+
+        if output and output._output.as_tuples:
+            # Skip creating a dictionary for each row.
+            return cast(
+                QueryResponseType,
+                (
+                    self.table._meta.db.transform_response_to_tuples(results)
+                    if results
+                    else []
+                ),
+            )
+
+        if output and (output._output.as_columns or output._output.as_arrays):
+            # Build each column in a single pass, rather than creating a
+            # dictionary for each row.
+            columns = self.table._meta.db.transform_response_to_columns(
+                results,
+                column_names=() if results else self._get_output_names(),
+            )
+            if output._output.as_arrays:
+                columns = {
+                    key: numpy.array(value) for key, value in columns.items()
+                }
+            return cast(QueryResponseType, columns)
+
         raw = (
             self.table._meta.db.transform_response_to_dicts(results)
             if results
@@ -56,10 +107,6 @@ class Query(Generic[TableInstance, QueryResponseType]):
         if hasattr(self, "_raw_response_callback"):
             self._raw_response_callback(raw)
 
-        output: Optional[OutputDelegate] = getattr(
-            self, "output_delegate", None
-        )
-
         #######################################################################
 
         if output and output._output.load_json:
@@ -106,29 +153,35 @@ class Query(Generic[TableInstance, QueryResponseType]):
         raw = await self.response_handler(raw)
 
         if output and output._output.as_objects:
-            if output._output.nested:
+            if output._output.as_rows:
                 return cast(
                     QueryResponseType,
-                    [
-                        make_nested_object(
-                            row,
-                            self.table,
-                            load_json=output._output.load_json,
-                        )
-                        for row in raw
-                    ],
+                    self.table._get_row_class()._from_db_rows(raw),
                 )
-            else:
-                return cast(
-                    QueryResponseType,
-                    [
-                        self.table(**columns, _exists_in_db=True)
-                        for columns in raw
-                    ],
+
+            instances = (
+                make_nested_objects(
+                    raw, self.table, load_json=output._output.load_json
                 )
+                if output._output.nested
+                else self.table._from_db_rows(raw)
+            )
+
+            if (identity_map := self._identity_map) is not None:
+                # Reuse any instances which have already been loaded.
+                instances = [identity_map.add(i) for i in instances]
+
+            return cast(QueryResponseType, instances)
 
         return cast(QueryResponseType, raw)
 
+    def _get_output_names(self) -> list[str]:
+        """
+        Override in any subclasses which support ``as_columns``, to return the
+        keys in each row of the response.
+        """
+        return []
+
     def _validate(self):
         """
         Override in any subclasses if validation needs to be run before
@@ -159,7 +212,9 @@ class Query(Generic[TableInstance, QueryResponseType]):
             possible.
 
         """  # noqa: E501
-        self._validate()
+        if self._frozen_querystrings is None:
+            # Frozen queries are validated when they're frozen.
+            self._validate()
 
         engine = self.table._meta.db
 
@@ -202,7 +257,7 @@ class Query(Generic[TableInstance, QueryResponseType]):
         self,
         node: Optional[str] = None,
         timed: bool = False,
-        in_pool: bool = False,
+        in_pool: Optional[bool] = None,
     ) -> QueryResponseType:
         """
         A convenience method for running the coroutine synchronously.
@@ -211,12 +266,17 @@ class Query(Generic[TableInstance, QueryResponseType]):
             If ``True``, the time taken to run the query is printed out. Useful
             for debugging.
         :param in_pool:
-            Whether to run this in a connection pool if one is available. Set
-            to ``False`` by default, because if an app uses ``run`` and
+            Whether to run this in a connection pool if one is available. By
+            default, the pool is only used if it was started using
+            ``run_sync`` too, because a pool can only be used by the event
+            loop which created it, and if an app uses ``run`` and
             ``run_sync`` in the same app, it can cause errors. See
             `issue 505 <https://github.com/piccolo-orm/piccolo/issues/505>`_.
 
         """
+        if in_pool is None:
+            in_pool = can_use_pool_sync(self.table._meta.db)
+
         coroutine = self.run(node=node, in_pool=in_pool)
 
         if not timed:
@@ -280,6 +340,51 @@ class Query(Generic[TableInstance, QueryResponseType]):
 
     ###########################################################################
 
+    @overload
+    def explain(
+        self, analyze: bool = False, format: Literal["json"] = "json"
+    ) -> Explain[QueryPlan]: ...
+
+    @overload
+    def explain(
+        self, analyze: bool = False, *, format: Literal["text"]
+    ) -> Explain[str]: ...
+
+    def explain(
+        self, analyze: bool = False, format: ExplainFormat = "json"
+    ) -> Explain:
+        """
+        Returns the query plan, instead of running the query. For example:
+
+        .. code-block:: python
+
+            >>> plan = await Band.select().where(
+            ...     Band.name == 'Pythonistas'
+            ... ).explain()
+            >>> plan.uses_index
+            True
+            >>> plan.indexes
+            ['band_name']
+
+        This is useful in tests, to make sure important queries are using
+        the expected indexes.
+
+        :param analyze:
+            If ``True``, the query is actually run, so the plan also contains
+            the number of rows returned, and the time taken. It's run in a
+            savepoint which is rolled back, so any changes are discarded. Not
+            supported by SQLite.
+        :param format:
+            With ``'json'``, a :class:`QueryPlan <piccolo.query.explain.QueryPlan>`
+            is returned, which is parsed from the database's output, and looks
+            the same for each database. With ``'text'``, the plan is returned
+            as a string, as the database formats it.
+
+        """  # noqa: E501
+        from piccolo.query.explain import Explain
+
+        return Explain(query=self, analyze=analyze, format=format)
+
     def freeze(self) -> FrozenQuery:
         """
         This is a performance optimisation when the same query is run
@@ -308,15 +413,44 @@ class Query(Generic[TableInstance, QueryResponseType]):
         query is defined within the view/endpoint, it has to generate the SQL
         from scratch each time.
 
+        Piccolo already caches the compiled SQL for queries with the same
+        structure (see ``piccolo.querystring.compile_fingerprint``), but it
+        still has to build the query, and walk it to collect the argument
+        values. A frozen query skips all of this.
+
         Once a query is frozen, you can't apply any more clauses to it
         (``where``, ``limit``, ``output`` etc).
 
+        If the values change each time the query is run, use
+        :class:`Param <piccolo.querystring.Param>` placeholders, and pass
+        in the values when running the query:
+
+        .. code-block:: python
+
+            GET_BAND = Band.select().where(
+                Band.id == Param("band_id")
+            ).limit(
+                Param("limit")
+            ).freeze()
+
+            async def get_band(self, request, band_id: int):
+                return await GET_BAND.run(band_id=band_id, limit=1)
+
+        ``Param`` values are passed to the database as they are, so they
+        should already be the correct type for the column (e.g. a JSON string
+        rather than a ``dict``).
+
+        The SQL is identical each time the query is run, so on Postgres the
+        server-side prepared statement is also reused for each connection.
+
         Even though ``freeze`` helps with performance, there are limits to
         how much it can help, as most of the time is still spent waiting for a
         response from the database. However, for high throughput apps and data
         science scripts, it's a worthwhile optimisation.
 
         """
+        self._validate()
+
         querystrings = self.querystrings
         for querystring in querystrings:
             querystring.freeze(engine_type=self.engine_type)
@@ -336,6 +470,33 @@ class Query(Generic[TableInstance, QueryResponseType]):
 
         return FrozenQuery(query=query)
 
+    def _get_param_names(self) -> set[str]:
+        """
+        Returns the names of any ``Param`` values in a frozen query.
+        """
+        if self._frozen_querystrings is None:
+            return set()
+
+        param_names: set[str] = set()
+        for querystring in self._frozen_querystrings:
+            param_names.update(querystring.get_param_names())
+        return param_names
+
+    def _bind_params(self, **params: Any):
+        """
+        Returns a copy of a frozen query, with any ``Param`` values replaced
+        by the values provided. The SQL isn't compiled again.
+        """
+        if self._frozen_querystrings is None:
+            raise ValueError("The query must be frozen first.")
+
+        query = copy.copy(self)
+        query._frozen_querystrings = [
+            querystring.bind(**params)
+            for querystring in self._frozen_querystrings
+        ]
+        return query
+
     ###########################################################################
 
     def __str__(self) -> str:
@@ -346,14 +507,46 @@ class Query(Generic[TableInstance, QueryResponseType]):
 
 
 class FrozenQuery:
+    """
+    Returned by :meth:`Query.freeze`. If the query contains any
+    :class:`Param <piccolo.querystring.Param>` values, they are passed in as
+    keyword arguments when running it::
+
+        >>> GET_BAND = Band.select().where(
+        ...     Band.id == Param("band_id")
+        ... ).freeze()
+        >>> await GET_BAND.run(band_id=1)
+
+    """
+
     def __init__(self, query: Query):
         self.query = query
+        self.param_names = (
+            query._get_param_names() if isinstance(query, Query) else set()
+        )
+
+    def _get_query(self, kwargs: dict[str, Any]) -> Query:
+        """
+        Removes any ``Param`` values from ``kwargs``, and returns the query
+        with them bound.
+        """
+        if not self.param_names:
+            return self.query
+
+        params = {
+            name: kwargs.pop(name)
+            for name in self.param_names
+            if name in kwargs
+        }
+        return self.query._bind_params(**params)
 
     async def run(self, *args, **kwargs):
-        return await self.query.run(*args, **kwargs)
+        query = self._get_query(kwargs)
+        return await query.run(*args, **kwargs)
 
     def run_sync(self, *args, **kwargs):
-        return self.query.run_sync(*args, **kwargs)
+        query = self._get_query(kwargs)
+        return query.run_sync(*args, **kwargs)
 
     def __getattr__(self, name: str):
         if hasattr(self.query, name):
@@ -454,7 +647,9 @@ class DDL:
         """
         A convenience method for running the coroutine synchronously.
         """
-        coroutine = self.run(*args, **kwargs, in_pool=False)
+        coroutine = self.run(
+            *args, **kwargs, in_pool=can_use_pool_sync(self.table._meta.db)
+        )
 
         if not timed:
             return run_sync(coroutine)
@@ -0,0 +1,506 @@
+"""
+Runs a query in ``EXPLAIN``, and parses the output into a tree of
+:class:`PlanNode`, which looks the same for each database.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Generator, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, Literal, Optional, TypeVar
+
+from piccolo.querystring import QueryString
+from piccolo.utils.encoding import load_json
+from piccolo.utils.sync import can_use_pool_sync, run_sync
+
+if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.engine.base import Engine
+    from piccolo.query.base import Query
+
+
+ExplainFormat = Literal["json", "text"]
+ResponseType = TypeVar("ResponseType")
+
+
+@dataclass
+class PlanNode:
+    """
+    A single step in a query plan - for example, scanning a table.
+
+    Any values which the database doesn't report are ``None`` - SQLite
+    doesn't estimate the cost or number of rows, and CockroachDB doesn't
+    report the cost.
+    """
+
+    #: e.g. ``'Seq Scan'`` in Postgres, ``'scan'`` in CockroachDB, or
+    #: ``'SEARCH'`` in SQLite.
+    node_type: str
+    #: The table being read, if any.
+    relation: Optional[str] = None
+    #: The index being used to read the table, if any.
+    index_name: Optional[str] = None
+    total_cost: Optional[float] = None
+    estimated_rows: Optional[float] = None
+    #: Only available when the query is analyzed.
+    actual_rows: Optional[float] = None
+    children: list[PlanNode] = field(default_factory=list)
+    #: Everything the database reported about this node.
+    detail: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def uses_index(self) -> bool:
+        return self.index_name is not None
+
+    def walk(self) -> Iterator[PlanNode]:
+        """
+        Yields this node, and all of its descendants.
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class QueryPlan:
+    """
+    The parsed output of :meth:`Query.explain <piccolo.query.base.Query.explain>`.
+    """  # noqa: E501
+
+    engine_type: str
+    analyzed: bool
+    #: The top level nodes - there's one for each statement which was
+    #: explained.
+    roots: list[PlanNode] = field(default_factory=list)
+    #: In milliseconds - only reported by Postgres and CockroachDB.
+    planning_time: Optional[float] = None
+    #: In milliseconds - only reported when the query is analyzed.
+    execution_time: Optional[float] = None
+
+    @property
+    def nodes(self) -> list[PlanNode]:
+        return [node for root in self.roots for node in root.walk()]
+
+    @property
+    def total_cost(self) -> Optional[float]:
+        return _sum(root.total_cost for root in self.roots)
+
+    @property
+    def estimated_rows(self) -> Optional[float]:
+        return _sum(root.estimated_rows for root in self.roots)
+
+    @property
+    def actual_rows(self) -> Optional[float]:
+        return _sum(root.actual_rows for root in self.roots)
+
+    @property
+    def uses_index(self) -> bool:
+        return any(node.uses_index for node in self.nodes)
+
+    @property
+    def indexes(self) -> list[str]:
+        """
+        The names of any indexes which are used.
+        """
+        return [
+            node.index_name
+            for node in self.nodes
+            if node.index_name is not None
+        ]
+
+
+def _sum(values: Iterator[Optional[float]]) -> Optional[float]:
+    known = [value for value in values if value is not None]
+    return sum(known) if known else None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+###############################################################################
+# Postgres
+
+
+def parse_postgres_node(plan: dict[str, Any]) -> PlanNode:
+    return PlanNode(
+        node_type=plan.get("Node Type", ""),
+        relation=plan.get("Relation Name"),
+        index_name=plan.get("Index Name"),
+        total_cost=_to_float(plan.get("Total Cost")),
+        estimated_rows=_to_float(plan.get("Plan Rows")),
+        actual_rows=_to_float(plan.get("Actual Rows")),
+        children=[
+            parse_postgres_node(child) for child in plan.get("Plans", [])
+        ],
+        detail={key: value for key, value in plan.items() if key != "Plans"},
+    )
+
+
+def parse_postgres_plan(output: Any, query_plan: QueryPlan) -> None:
+    """
+    Parses the output of ``EXPLAIN (FORMAT JSON)``.
+    """
+    if isinstance(output, str):
+        output = load_json(output)
+
+    for statement in output:
+        query_plan.roots.append(parse_postgres_node(statement["Plan"]))
+
+        for key, attribute in (
+            ("Planning Time", "planning_time"),
+            ("Execution Time", "execution_time"),
+        ):
+            value = _to_float(statement.get(key))
+            if value is not None:
+                current = getattr(query_plan, attribute)
+                setattr(query_plan, attribute, (current or 0.0) + value)
+
+
+###############################################################################
+# CockroachDB
+
+
+COCKROACH_TIME_UNITS = {
+    "ns": 1e-6,
+    "µs": 1e-3,
+    "us": 1e-3,
+    "ms": 1.0,
+    "s": 1e3,
+}
+
+
+def _parse_cockroach_time(value: str) -> Optional[float]:
+    match = re.match(r"([\d.]+)\s*(ns|µs|us|ms|s)$", value.strip())
+    if match is None:
+        return None
+    return float(match.group(1)) * COCKROACH_TIME_UNITS[match.group(2)]
+
+
+def _parse_cockroach_rows(value: str) -> Optional[float]:
+    # e.g. '1 (100% of the table; stats collected 2 minutes ago)'
+    match = re.match(r"([\d,]+)", value.strip())
+    if match is None:
+        return None
+    return float(match.group(1).replace(",", ""))
+
+
+def parse_cockroach_plan(lines: Sequence[str], query_plan: QueryPlan) -> None:
+    """
+    Parses the text output of ``EXPLAIN``, which looks like this::
+
+        distribution: local
+        vectorized: true
+
+        • filter
+        │ estimated row count: 1
+        │ filter: name = 'Pythonistas'
+        │
+        └── • scan
+              estimated row count: 3
+              table: band@band_pkey
+              spans: FULL SCAN
+
+    """
+    # The column of the ``•`` for each open node, so we know which is the
+    # parent of the next one.
+    stack: list[tuple[int, PlanNode]] = []
+
+    for line in lines:
+        if "•" in line:
+            column = line.index("•")
+            node = PlanNode(node_type=line.split("•", 1)[1].strip())
+
+            while stack and stack[-1][0] >= column:
+                stack.pop()
+
+            if stack:
+                stack[-1][1].children.append(node)
+            else:
+                query_plan.roots.append(node)
+
+            stack.append((column, node))
+            continue
+
+        content = line.strip(" │├└─")
+        if ":" not in content:
+            continue
+
+        key, value = (i.strip() for i in content.split(":", 1))
+
+        if not stack:
+            if key == "planning time":
+                query_plan.planning_time = _parse_cockroach_time(value)
+            elif key == "execution time":
+                query_plan.execution_time = _parse_cockroach_time(value)
+            continue
+
+        node = stack[-1][1]
+        node.detail[key] = value
+
+        if key == "table":
+            relation, _, index_name = value.partition("@")
+            node.relation = relation
+            if index_name and node.detail.get("spans") != "FULL SCAN":
+                node.index_name = index_name
+        elif key == "spans" and value == "FULL SCAN":
+            # A full scan of the primary index is just a table scan.
+            node.index_name = None
+        elif key == "estimated row count":
+            node.estimated_rows = _parse_cockroach_rows(value)
+        elif key == "actual row count":
+            node.actual_rows = _parse_cockroach_rows(value)
+
+
+###############################################################################
+# SQLite
+
+
+SQLITE_DETAIL_REGEX = re.compile(
+    r"^(?P<node_type>SCAN|SEARCH)(?: TABLE)? (?P<relation>\S+)"
+    r"(?: AS \S+)?"
+    r"(?: USING (?:(?:COVERING )?INDEX (?P<index_name>\S+)"
+    r"|(?P<primary_key>(?:INTEGER )?PRIMARY KEY)))?"
+)
+
+
+def parse_sqlite_node(detail: str) -> PlanNode:
+    match = SQLITE_DETAIL_REGEX.match(detail)
+    if match is None:
+        return PlanNode(node_type=detail, detail={"detail": detail})
+
+    return PlanNode(
+        node_type=match.group("node_type"),
+        relation=match.group("relation"),
+        index_name=(
+            match.group("index_name") or match.group("primary_key") or None
+        ),
+        detail={"detail": detail},
+    )
+
+
+def parse_sqlite_plan(rows: Sequence[Any], query_plan: QueryPlan) -> None:
+    """
+    Parses the output of ``EXPLAIN QUERY PLAN``, where each row has an
+    ``id``, and the ``id`` of its ``parent`` (``0`` at the top level).
+    """
+    nodes: dict[int, PlanNode] = {}
+
+    for row in rows:
+        node = parse_sqlite_node(row["detail"])
+        nodes[row["id"]] = node
+
+        parent = nodes.get(row["parent"])
+        if parent is None:
+            query_plan.roots.append(node)
+        else:
+            parent.children.append(node)
+
+
+def format_sqlite_plan(query_plan: QueryPlan) -> str:
+    """
+    Mimics the output of the ``sqlite3`` shell.
+    """
+    lines = ["QUERY PLAN"]
+
+    def add(node: PlanNode, prefix: str, last: bool):
+        lines.append(
+            f"{prefix}{'`--' if last else '|--'}{node.detail['detail']}"
+        )
+        for index, child in enumerate(node.children):
+            add(
+                child,
+                prefix=prefix + ("   " if last else "|  "),
+                last=index == len(node.children) - 1,
+            )
+
+    for index, root in enumerate(query_plan.roots):
+        add(root, prefix="", last=index == len(query_plan.roots) - 1)
+
+    return "\n".join(lines)
+
+
+###############################################################################
+
+
+def get_explain_querystring(
+    engine_type: str,
+    querystring: QueryString,
+    analyze: bool,
+    format: ExplainFormat,
+) -> QueryString:
+    """
+    Wraps the querystring in the appropriate ``EXPLAIN`` statement for the
+    engine.
+    """
+    if engine_type == "sqlite":
+        return QueryString("EXPLAIN QUERY PLAN {}", querystring)
+    elif engine_type == "cockroach":
+        # CockroachDB's JSON output is very different, so the text output is
+        # parsed instead.
+        return QueryString(
+            "EXPLAIN ANALYZE {}" if analyze else "EXPLAIN {}", querystring
+        )
+    else:
+        options = []
+        if analyze:
+            options.append("ANALYZE")
+        if format == "json":
+            options.append("FORMAT JSON")
+
+        if options:
+            return QueryString(
+                f"EXPLAIN ({', '.join(options)}) {{}}", querystring
+            )
+        return QueryString("EXPLAIN {}", querystring)
+
+
+class Explain(Generic[ResponseType]):
+    """
+    Returned by :meth:`Query.explain <piccolo.query.base.Query.explain>`.
+    """
+
+    __slots__ = ("query", "analyze", "format")
+
+    def __init__(
+        self,
+        query: Query,
+        analyze: bool = False,
+        format: ExplainFormat = "json",
+    ):
+        if format not in ("json", "text"):
+            raise ValueError("The format must be 'json' or 'text'.")
+
+        if analyze and query.engine_type == "sqlite":
+            raise NotImplementedError(
+                "SQLite doesn't support EXPLAIN ANALYZE."
+            )
+
+        self.query = query
+        self.analyze = analyze
+        self.format = format
+
+    async def _explain(
+        self,
+        engine: Engine,
+        querystrings: Sequence[QueryString],
+        in_pool: bool,
+    ) -> list[list[Any]]:
+        responses = []
+        for querystring in querystrings:
+            explain_querystring = get_explain_querystring(
+                engine_type=engine.engine_type,
+                querystring=querystring,
+                analyze=self.analyze,
+                format=self.format,
+            )
+            responses.append(
+                await engine.run_querystring(
+                    explain_querystring, in_pool=in_pool
+                )
+            )
+        return responses
+
+    async def run(
+        self, node: Optional[str] = None, in_pool: bool = True
+    ) -> ResponseType:
+        """
+        :param node:
+            If specified, explain the query on another database node. Only
+            available in Postgres.
+        :param in_pool:
+            Whether to run this in a connection pool if one is available.
+
+        """
+        query = self.query
+
+        if query._frozen_querystrings is None:
+            query._validate()
+
+        engine = query.table._meta.db
+
+        if node is not None:
+            from piccolo.engine.postgres import PostgresEngine
+
+            if isinstance(engine, PostgresEngine):
+                engine = engine.extra_nodes[node]
+
+        querystrings = query.querystrings
+
+        if self.analyze:
+            # ``EXPLAIN ANALYZE`` actually runs the query, so run it in a
+            # savepoint which is rolled back, in case it modifies any data.
+            async with engine.transaction() as transaction:
+                savepoint = await transaction.savepoint()
+                try:
+                    responses = await self._explain(
+                        engine=engine,
+                        querystrings=querystrings,
+                        in_pool=in_pool,
+                    )
+                finally:
+                    await savepoint.rollback_to()
+        else:
+            responses = await self._explain(
+                engine=engine, querystrings=querystrings, in_pool=in_pool
+            )
+
+        return self._parse(engine_type=engine.engine_type, responses=responses)
+
+    def _parse(self, engine_type: str, responses: list[list[Any]]) -> Any:
+        query_plan = QueryPlan(engine_type=engine_type, analyzed=self.analyze)
+
+        if engine_type == "sqlite":
+            for rows in responses:
+                parse_sqlite_plan(rows=rows, query_plan=query_plan)
+            if self.format == "text":
+                return format_sqlite_plan(query_plan)
+            return query_plan
+
+        texts = [
+            "\n".join(str(next(iter(row.values()))) for row in rows)
+            for rows in responses
+        ]
+
+        if self.format == "text":
+            return "\n\n".join(texts)
+
+        if engine_type == "cockroach":
+            for text in texts:
+                parse_cockroach_plan(
+                    lines=text.splitlines(), query_plan=query_plan
+                )
+        else:
+            for rows in responses:
+                for row in rows:
+                    parse_postgres_plan(
+                        output=next(iter(row.values())), query_plan=query_plan
+                    )
+
+        return query_plan
+
+    def run_sync(
+        self, node: Optional[str] = None, in_pool: Optional[bool] = None
+    ) -> ResponseType:
+        if in_pool is None:
+            in_pool = can_use_pool_sync(self.query.table._meta.db)
+        return run_sync(self.run(node=node, in_pool=in_pool))
+
+    def __await__(self) -> Generator[None, None, ResponseType]:
+        return self.run().__await__()
+
+    def __str__(self) -> str:
+        return "\n".join(
+            get_explain_querystring(
+                engine_type=self.query.engine_type,
+                querystring=querystring,
+                analyze=self.analyze,
+                format=self.format,
+            ).__str__()
+            for querystring in self.query.querystrings
+        )
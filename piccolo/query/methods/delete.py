@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, TypeVar, Union
+from typing import TYPE_CHECKING, Optional, TypeVar, Union
 
 from piccolo.custom_types import Combinable
 from piccolo.query.base import Query
@@ -39,6 +39,12 @@ class Delete(Query):
         self.returning_delegate.returning(columns)
         return self
 
+    async def _run(self, node: Optional[str] = None, in_pool: bool = True):
+        if (identity_map := self._identity_map) is not None:
+            identity_map.invalidate(self.table)
+
+        return await super()._run(node=node, in_pool=in_pool)
+
     def _validate(self):
         """
         Don't let a deletion happen unless it has a where clause, or is
@@ -31,7 +31,9 @@ class Exists(Query[TableInstance, bool]):
         select.where_delegate._where = self.where_delegate._where
         return [
             QueryString(
-                'SELECT EXISTS({}) AS "exists"', select.querystrings[0]
+                'SELECT EXISTS({}) AS "exists"',
+                select.querystrings[0],
+                query_type="select",
             )
         ]
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from typing import (
     TYPE_CHECKING,
@@ -9,6 +10,7 @@ from typing import (
     Optional,
     TypeVar,
     Union,
+    cast,
 )
 
 from piccolo.custom_types import Combinable, TableInstance
@@ -20,16 +22,25 @@ from piccolo.query.mixins import (
     ReturningDelegate,
 )
 from piccolo.querystring import QueryString
+from piccolo.utils.list import batch
+from piccolo.utils.sql_values import convert_to_sql_value
 
 if TYPE_CHECKING:  # pragma: no cover
     from piccolo.columns.base import Column
+    from piccolo.engine.postgres import PostgresEngine
     from piccolo.table import Table
 
 
 class Insert(
     Generic[TableInstance], Query[TableInstance, list[dict[str, Any]]]
 ):
-    __slots__ = ("add_delegate", "on_conflict_delegate", "returning_delegate")
+    __slots__ = (
+        "add_delegate",
+        "on_conflict_delegate",
+        "returning_delegate",
+        "_use_copy",
+        "_concurrent",
+    )
 
     def __init__(
         self, table: type[TableInstance], *instances: TableInstance, **kwargs
@@ -38,6 +49,8 @@ class Insert(
         self.add_delegate = AddDelegate()
         self.returning_delegate = ReturningDelegate()
         self.on_conflict_delegate = OnConflictDelegate()
+        self._use_copy = False
+        self._concurrent = False
         self.add(*instances)
 
     ###########################################################################
@@ -49,6 +62,8 @@ class Insert(
 
     def returning(self: Self, *columns: Column) -> Self:
         self.returning_delegate.returning(columns)
+        if self._use_copy:
+            self._validate_copy()
         return self
 
     def on_conflict(
@@ -78,6 +93,9 @@ class Insert(
                 "clause."
             )
 
+        if self._use_copy:
+            raise NotImplementedError("ON CONFLICT can't be used with COPY.")
+
         self.on_conflict_delegate.on_conflict(
             target=target,
             action=action,
@@ -86,8 +104,205 @@ class Insert(
         )
         return self
 
+    def use_copy(self: Self) -> Self:
+        """
+        Insert the rows using Postgres' ``COPY`` command instead of
+        ``INSERT``, which is much faster when inserting lots of rows.
+        """
+        if self.engine_type != "postgres":
+            raise NotImplementedError("COPY is only supported by Postgres.")
+
+        if self.on_conflict_delegate._on_conflict.on_conflict_items:
+            raise NotImplementedError("ON CONFLICT can't be used with COPY.")
+
+        self._validate_copy()
+        self._use_copy = True
+        return self
+
+    def _validate_copy(self):
+        """
+        COPY can only return the primary key values (which ``Table.insert``
+        returns by default), as they're generated before the rows are copied.
+        """
+        returning = self.returning_delegate._returning
+        if returning is None:
+            return
+
+        primary_key = self.table._meta.primary_key
+        if not (
+            len(returning.columns) == 1
+            and returning.columns[0]._meta.name == primary_key._meta.name
+            and not returning.columns[0]._alias
+        ):
+            raise NotImplementedError("COPY can only return the primary key.")
+
+    def concurrent(self: Self, value: bool = True) -> Self:
+        """
+        If there are too many rows to insert in a single query, they're split
+        into several queries, which by default are run one after the other
+        in a transaction. If atomicity isn't required, this lets them run
+        at the same time, using the connection pool.
+        """
+        self._concurrent = value
+        return self
+
     ###########################################################################
 
+    async def _run(
+        self, node: Optional[str] = None, in_pool: bool = True
+    ) -> list[dict[str, Any]]:
+        if self._use_copy:
+            self._validate()
+            self._validate_copy()
+            return await self._run_copy(in_pool=in_pool)
+
+        if (
+            self.on_conflict_delegate._on_conflict.on_conflict_items
+            and (identity_map := self._identity_map) is not None
+        ):
+            # Existing rows might be updated.
+            identity_map.invalidate(self.table)
+
+        chunks = self._get_chunks()
+        if len(chunks) <= 1:
+            return await super()._run(node=node, in_pool=in_pool)
+
+        return await self._run_chunks(chunks, node=node, in_pool=in_pool)
+
+    def _get_chunks(self) -> list[list[Table]]:
+        """
+        Split the rows, so each query is within the engine's limit on the
+        number of bind parameters.
+        """
+        instances = self.add_delegate._add
+        if self._frozen_querystrings is not None or not instances:
+            return [instances]
+
+        max_parameters = self.table._meta.db.max_query_parameters
+
+        on_conflict = self.on_conflict_delegate._on_conflict
+        if on_conflict.on_conflict_items:
+            max_parameters -= len(on_conflict.querystring.compile_string()[1])
+
+        chunk_size = max(1, max_parameters // len(self.table._meta.columns))
+        return batch(data=instances, chunk_size=chunk_size)
+
+    async def _run_chunks(
+        self,
+        chunks: list[list[Table]],
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> list[dict[str, Any]]:
+        queries = []
+        for chunk in chunks:
+            query = self.__class__(self.table)
+            query.add_delegate._add = chunk
+            query.returning_delegate = self.returning_delegate
+            query.on_conflict_delegate = self.on_conflict_delegate
+            queries.append(query)
+
+        engine = self.table._meta.db
+
+        if (
+            self._concurrent
+            and getattr(engine, "pool", None) is not None
+            and engine.engine_type != "sqlite"
+            and engine.current_transaction.get() is None
+        ):
+            # Each query runs on a separate connection from the pool.
+            responses = await asyncio.gather(
+                *[query._run(node=node, in_pool=in_pool) for query in queries]
+            )
+        else:
+            responses = []
+            async with engine.transaction():
+                for query in queries:
+                    responses.append(
+                        await query._run(node=node, in_pool=in_pool)
+                    )
+
+        return [row for response in responses for row in response]
+
+    async def _run_copy(self, in_pool: bool = True) -> list[dict[str, Any]]:
+        instances = self.add_delegate._add
+        if not instances:
+            return []
+
+        engine = cast("PostgresEngine", self.table._meta.db)
+        primary_key = self.table._meta.primary_key
+        pk_column_name = primary_key._meta.db_column_name
+        columns = list(self.table._meta.columns)
+
+        response: list[dict[str, Any]] = []
+
+        if all(
+            isinstance(instance[primary_key._meta.name], QueryString)
+            for instance in instances
+        ):
+            # The primary key is generated by the database (e.g. ``Serial``),
+            # and COPY can't return it, so reserve the values from the
+            # sequence first.
+            results = await engine.run_querystring(
+                QueryString(
+                    "SELECT nextval(pg_get_serial_sequence({}, {})) AS "
+                    f'"{pk_column_name}" FROM generate_series(1, {{}})',
+                    self.table._meta.get_formatted_tablename(),
+                    pk_column_name,
+                    len(instances),
+                ),
+                in_pool=in_pool,
+            )
+            response = engine.transform_response_to_dicts(results)
+
+            if response[0][pk_column_name] is None:
+                # There's no sequence, so let the database generate them.
+                response = []
+                columns.remove(primary_key)
+            else:
+                for instance, row in zip(instances, response):
+                    setattr(
+                        instance, primary_key._meta.name, row[pk_column_name]
+                    )
+        else:
+            # The primary keys are generated in Python (e.g. ``UUID``).
+            response = [
+                {pk_column_name: instance[primary_key._meta.name]}
+                for instance in instances
+            ]
+
+        records = []
+        for instance in instances:
+            record = []
+            for column in columns:
+                value = convert_to_sql_value(
+                    value=instance[column._meta.name], column=column
+                )
+                if isinstance(value, QueryString):
+                    raise ValueError(
+                        f"The value for {column._meta.name} is a SQL "
+                        "expression, which can't be used with COPY."
+                    )
+                record.append(value)
+            records.append(tuple(record))
+
+        await engine.copy_records_to_table(
+            table_name=self.table._meta.tablename,
+            columns=[i._meta.db_column_name for i in columns],
+            records=records,
+            schema_name=self.table._meta.schema,
+            in_pool=in_pool,
+        )
+
+        if response:
+            self._raw_response_callback(response)
+        else:
+            # We don't know the primary keys, but the rows exist now.
+            for instance in instances:
+                instance._exists_in_db = True
+                instance._reset_changed_columns()
+
+        return response
+
     def _raw_response_callback(self, results: list):
         """
         Assign the ids of the created rows to the model instances.
@@ -102,6 +317,7 @@ class Insert(
                 ),
             )
             table_instance._exists_in_db = True
+            table_instance._reset_changed_columns()
 
     @property
     def default_querystrings(self) -> Sequence[QueryString]:
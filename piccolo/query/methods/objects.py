@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import AsyncGenerator, Callable, Generator, Sequence
+from contextlib import aclosing
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,10 +11,12 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
 from piccolo.columns.column_types import ForeignKey, ReferencedTable
 from piccolo.columns.combination import And, Where
+from piccolo.columns.operators.comparison import Equal
 from piccolo.custom_types import Combinable, TableInstance
 from piccolo.engine.base import BaseBatch
 from piccolo.query.base import Query
@@ -32,13 +35,15 @@ from piccolo.query.mixins import (
     WhereDelegate,
 )
 from piccolo.query.proxy import Proxy
-from piccolo.querystring import QueryString
+from piccolo.querystring import Param, QueryString
 from piccolo.utils.dictionary import make_nested
+from piccolo.utils.list import batch
 from piccolo.utils.sync import run_sync
 
 if TYPE_CHECKING:  # pragma: no cover
     from piccolo.columns import Column
-    from piccolo.table import Table
+    from piccolo.columns.m2m import M2M
+    from piccolo.table import Table, TableRow
 
 
 ###############################################################################
@@ -128,11 +133,13 @@ class First(
     async def run(
         self, node: Optional[str] = None, in_pool: bool = True
     ) -> Optional[TableInstance]:
-        objects = await self.query.run(
-            node=node, in_pool=in_pool, use_callbacks=False
-        )
+        results = self.query._get_from_identity_map()
 
-        results = objects[0] if objects else None
+        if results is None:
+            objects = await self.query.run(
+                node=node, in_pool=in_pool, use_callbacks=False
+            )
+            results = objects[0] if objects else None
 
         modified_response: Optional[TableInstance] = (
             await self.query.callback_delegate.invoke(
@@ -227,6 +234,8 @@ class UpdateSelf:
         for key, value in response[0].items():
             setattr(self.row, key, value)
 
+        self.row._reset_changed_columns(response[0].keys())
+
     def __await__(self) -> Generator[None, None, None]:
         """
         If the user doesn't explicity call .run(), proxy to it as a
@@ -249,11 +258,34 @@ class GetRelated(Generic[ReferencedTable]):
         node: Optional[str] = None,
         in_pool: bool = True,
     ) -> Optional[ReferencedTable]:
+        from piccolo.table import Table
+
         if not self.row._exists_in_db:
             raise ValueError("The object doesn't exist in the database.")
 
         root_table = self.row.__class__
 
+        references = cast(
+            type[ReferencedTable],
+            self.foreign_key._foreign_key_meta.resolved_references,
+        )
+
+        identity_map = root_table._meta.db.current_identity_map.get()
+        if (
+            identity_map is not None
+            and not self.foreign_key._meta.call_chain
+            # The identity map is keyed by primary key.
+            and self.foreign_key._foreign_key_meta.resolved_target_column
+            is references._meta.primary_key
+        ):
+            value = self.row.__dict__.get(self.foreign_key._meta.name)
+            if isinstance(value, Table):
+                value = getattr(value, value._meta.primary_key._meta.name)
+            if value is None:
+                return None
+            if (row := identity_map.get(references, value)) is not None:
+                return cast(ReferencedTable, row)
+
         data = (
             await root_table.select(
                 *[
@@ -273,31 +305,152 @@ class GetRelated(Generic[ReferencedTable]):
         if data is None or not any(data.values()):
             return None
 
+        row = references(**data, _exists_in_db=True)
+        row._reset_changed_columns()
+
+        if identity_map is not None:
+            row = cast(ReferencedTable, identity_map.add(row))
+
+        return row
+
+    def __await__(
+        self,
+    ) -> Generator[None, None, Optional[ReferencedTable]]:
+        """
+        If the user doesn't explicity call .run(), proxy to it as a
+        convenience.
+        """
+        return self.run().__await__()
+
+    def run_sync(self, *args, **kwargs) -> Optional[ReferencedTable]:
+        return run_sync(self.run(*args, **kwargs))
+
+
+class LoadRelated(Generic[ReferencedTable]):
+    """
+    Fetches the targets of a foreign key for lots of rows at once, using a
+    single query.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[Table],
+        foreign_key: ForeignKey[ReferencedTable],
+    ):
+        self.rows = rows
+        self.foreign_key = foreign_key
+
+    async def run(
+        self,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> list[Optional[ReferencedTable]]:
+        from piccolo.table import Table
+
+        if self.foreign_key._meta.call_chain:
+            raise ValueError(
+                "Only foreign keys on the table itself are supported - not "
+                "ones which are several levels deep."
+            )
+
+        foreign_key_name = self.foreign_key._meta.name
         references = cast(
             type[ReferencedTable],
             self.foreign_key._foreign_key_meta.resolved_references,
         )
+        target_column = (
+            self.foreign_key._foreign_key_meta.resolved_target_column
+        )
+        target_column_name = target_column._meta.name
+
+        # Maps the foreign key values to the related rows.
+        related_rows: dict[Any, ReferencedTable] = {}
+        values_to_fetch = set()
+
+        for row in self.rows:
+            value = row.__dict__.get(foreign_key_name)
+            if isinstance(value, Table):
+                related_rows[getattr(value, target_column_name)] = cast(
+                    ReferencedTable, value
+                )
+            elif value is not None:
+                values_to_fetch.add(value)
 
-        referenced_object = references(**data)
-        referenced_object._exists_in_db = True
-        return referenced_object
+        values_to_fetch.difference_update(related_rows.keys())
+
+        identity_map = references._meta.db.current_identity_map.get()
+        if (
+            identity_map is not None
+            and target_column is references._meta.primary_key
+        ):
+            for value in list(values_to_fetch):
+                related_row = identity_map.get(references, value)
+                if related_row is not None:
+                    related_rows[value] = cast(ReferencedTable, related_row)
+                    values_to_fetch.remove(value)
+
+        if values_to_fetch:
+            # Stay within the engine's limit on bind parameters.
+            chunk_size = references._meta.db.max_query_parameters - 1
+            for chunk in batch(
+                data=list(values_to_fetch), chunk_size=chunk_size
+            ):
+                response = (
+                    await references.objects()
+                    .where(target_column.is_in(chunk))
+                    .run(node=node, in_pool=in_pool)
+                )
+                for related_row in response:
+                    related_rows[getattr(related_row, target_column_name)] = (
+                        related_row
+                    )
+
+        output: list[Optional[ReferencedTable]] = []
+        for row in self.rows:
+            value = row.__dict__.get(foreign_key_name)
+            if isinstance(value, Table):
+                output.append(cast(ReferencedTable, value))
+                continue
+
+            related_row = related_rows.get(value)
+            if related_row is not None:
+                # Bypass ``__setattr__``, so the foreign key isn't
+                # unnecessarily saved.
+                row.__dict__[foreign_key_name] = related_row
+            output.append(related_row)
+
+        return output
 
     def __await__(
         self,
-    ) -> Generator[None, None, Optional[ReferencedTable]]:
+    ) -> Generator[None, None, list[Optional[ReferencedTable]]]:
         """
         If the user doesn't explicity call .run(), proxy to it as a
         convenience.
         """
         return self.run().__await__()
 
-    def run_sync(self, *args, **kwargs) -> Optional[ReferencedTable]:
+    def run_sync(self, *args, **kwargs) -> list[Optional[ReferencedTable]]:
         return run_sync(self.run(*args, **kwargs))
 
 
 ###############################################################################
 
 
+class ObjectsRows(Proxy["Objects", list["TableRow"]]):
+    """
+    This is for static typing purposes.
+    """
+
+    async def run(
+        self,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> list[TableRow]:
+        response = await self.query.run(node=node, in_pool=in_pool)
+        return cast("list[TableRow]", response)
+
+
 class Objects(
     Query[TableInstance, list[TableInstance]], Generic[TableInstance]
 ):
@@ -338,10 +491,37 @@ class Objects(
         self.where_delegate = WhereDelegate()
         self.lock_rows_delegate = LockRowsDelegate()
 
-    def output(self: Self, load_json: bool = False) -> Self:
+    @overload
+    def output(self: Self, *, as_rows: Literal[True]) -> ObjectsRows:  # type: ignore  # noqa: E501
+        ...
+
+    @overload
+    def output(self: Self, *, load_json: bool, as_rows: Literal[True]) -> ObjectsRows:  # type: ignore  # noqa: E501
+        ...
+
+    @overload
+    def output(self: Self, load_json: bool = False) -> Self: ...
+
+    def output(
+        self: Self, load_json: bool = False, as_rows: bool = False
+    ) -> Union[Self, ObjectsRows]:
+        """
+        :param load_json:
+            If ``True``, any JSON fields will have the JSON values returned
+            from the database loaded as Python objects.
+        :param as_rows:
+            Each row is returned as a lightweight, read only
+            :class:`TableRow <piccolo.table.TableRow>`, rather than a
+            ``Table`` instance. They use ``__slots__``, so are much faster to
+            create, and use less memory, which is useful when loading lots
+            of rows. It can't be used with ``prefetch``.
+
+        """
         self.output_delegate.output(
-            as_list=False, as_json=False, load_json=load_json
+            as_list=False, as_json=False, load_json=load_json, as_rows=as_rows
         )
+        if as_rows:
+            return ObjectsRows(query=self)
         return self
 
     def callback(
@@ -359,7 +539,7 @@ class Objects(
         self.as_of_delegate.as_of(interval)
         return self
 
-    def limit(self: Self, number: int) -> Self:
+    def limit(self: Self, number: Union[int, Param]) -> Self:
         self.limit_delegate.limit(number)
         return self
 
@@ -369,7 +549,60 @@ class Objects(
         self.prefetch_delegate.prefetch(*fk_columns)
         return self
 
-    def offset(self: Self, number: int) -> Self:
+    def prefetch_reverse(
+        self: Self,
+        foreign_key: ForeignKey,
+        attribute_name: Optional[str] = None,
+    ) -> Self:
+        """
+        Load the rows from another table which have a ``ForeignKey`` pointing
+        to each row, using a single extra query::
+
+            >>> bands = await Band.objects().prefetch_reverse(Concert.band_1)
+            >>> bands[0].concert_set
+            [<Concert: 1>, <Concert: 2>]
+
+        :param attribute_name:
+            The name of the attribute which the related rows are assigned to.
+            Defaults to the other table's name, with ``_set`` appended.
+
+        """
+        if (
+            isinstance(foreign_key, ForeignKey)
+            and foreign_key._foreign_key_meta.resolved_references
+            is not self.table
+        ):
+            raise ValueError(
+                f"{foreign_key._meta.name} doesn't reference "
+                f"{self.table.__name__}."
+            )
+
+        self.prefetch_delegate.prefetch_reverse(
+            foreign_key, attribute_name=attribute_name
+        )
+        return self
+
+    def prefetch_m2m(self: Self, *m2m: M2M) -> Self:
+        """
+        Load the related rows for each ``M2M`` relationship, using a single
+        extra query for each one::
+
+            >>> bands = await Band.objects().prefetch_m2m(Band.genres)
+            >>> bands[0].genres
+            [<Genre: 1>, <Genre: 2>]
+
+        """
+        for relationship in m2m:
+            if relationship._meta.table is not self.table:
+                raise ValueError(
+                    f"{relationship._meta.name} doesn't belong to "
+                    f"{self.table.__name__}."
+                )
+
+        self.prefetch_delegate.prefetch_m2m(*m2m)
+        return self
+
+    def offset(self: Self, number: Union[int, Param]) -> Self:
         self.offset_delegate.offset(number)
         return self
 
@@ -392,6 +625,40 @@ class Objects(
 
     ###########################################################################
 
+    def _get_from_identity_map(self) -> Optional[TableInstance]:
+        """
+        If an identity map is active, and the query is just looking up a row
+        by its primary key, check if the row has already been loaded.
+        """
+        identity_map = self._identity_map
+        if identity_map is None:
+            return None
+
+        where = self.where_delegate._where
+        if not (
+            isinstance(where, Where)
+            and where.column is self.table._meta.primary_key
+            and where.operator is Equal
+            and not isinstance(where.value, QueryString)
+        ):
+            return None
+
+        if (
+            self.prefetch_delegate.fk_columns
+            or self.prefetch_delegate.reverse_fk_columns
+            or self.prefetch_delegate.m2m_relationships
+            or self.offset_delegate._offset
+            or self.lock_rows_delegate._lock_rows
+            or self.as_of_delegate._as_of
+            or self.output_delegate._output.as_rows
+        ):
+            return None
+
+        return cast(
+            Optional[TableInstance],
+            identity_map.get(self.table, where.value),
+        )
+
     def first(self) -> First[TableInstance]:
         self.limit_delegate.limit(1)
         return First[TableInstance](query=self)
@@ -449,6 +716,32 @@ class Objects(
             kwargs.update(node=node)
         return await self.table._meta.db.batch(self, **kwargs)
 
+    async def stream(
+        self, prefetch: int = 500, node: Optional[str] = None
+    ) -> AsyncGenerator[TableInstance, None]:
+        """
+        Iterate over the results one object at a time, without loading them
+        all into memory::
+
+            >>> async for band in Band.objects().stream():
+            ...     print(band)
+
+        A server side cursor is used on Postgres, and a regular cursor on
+        SQLite.
+
+        :param prefetch:
+            How many rows to fetch from the database at a time. The next
+            batch is fetched while the current one is being iterated over.
+        :param node:
+            Which node to run the query on (see ``extra_nodes`` on
+            :class:`PostgresEngine <piccolo.engine.postgres.PostgresEngine>`).
+
+        """
+        batch = await self.batch(batch_size=prefetch, node=node)
+        async with aclosing(batch.stream()) as bands:
+            async for band in bands:
+                yield band
+
     async def response_handler(self, response):
         if self.output_delegate._output.nested:
             return [make_nested(i) for i in response]
@@ -470,7 +763,15 @@ class Objects(
         ):
             setattr(select, attr, getattr(self, attr))
 
+        if self.output_delegate._output.as_rows and (
+            self.prefetch_delegate.fk_columns
+            or self.prefetch_delegate.reverse_fk_columns
+            or self.prefetch_delegate.m2m_relationships
+        ):
+            raise ValueError("`as_rows` can't be used with `prefetch`.")
+
         if self.prefetch_delegate.fk_columns:
+
             select.columns(*self.table.all_columns())
             for fk in self.prefetch_delegate.fk_columns:
                 if isinstance(fk, ForeignKey):
@@ -488,6 +789,128 @@ class Objects(
 
     ###########################################################################
 
+    async def _prefetch_reverse(
+        self,
+        rows: list[TableInstance],
+        foreign_key: ForeignKey,
+        attribute_name: str,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ):
+        """
+        Assign a list of the rows which reference each row via
+        ``foreign_key``.
+        """
+        from piccolo.table import Table
+
+        related_table = foreign_key._meta.table
+        target_column_name = (
+            foreign_key._foreign_key_meta.resolved_target_column._meta.name
+        )
+
+        related_rows: dict[Any, list[Table]] = {
+            getattr(row, target_column_name): [] for row in rows
+        }
+
+        for chunk in self._get_chunks(list(related_rows.keys())):
+            response = (
+                await related_table.objects()
+                .where(foreign_key.is_in(chunk))
+                .order_by(related_table._meta.primary_key)
+                .run(node=node, in_pool=in_pool)
+            )
+            for related_row in response:
+                value = related_row.__dict__[foreign_key._meta.name]
+                if isinstance(value, Table):
+                    # The row came from the identity map, and already has the
+                    # related row assigned.
+                    value = getattr(value, target_column_name)
+                related_rows[value].append(related_row)
+
+        for row in rows:
+            # Bypass ``__setattr__``, as it's not a column.
+            row.__dict__[attribute_name] = related_rows[
+                getattr(row, target_column_name)
+            ]
+
+    async def _prefetch_m2m(
+        self,
+        rows: list[TableInstance],
+        m2m: M2M,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ):
+        """
+        Assign a list of the related rows for the ``M2M`` relationship.
+        """
+        joining_table = m2m._meta.resolved_joining_table
+        primary_foreign_key = m2m._meta.primary_foreign_key
+        secondary_foreign_key = m2m._meta.secondary_foreign_key
+        secondary_table = m2m._meta.secondary_table
+        secondary_primary_key_name = (
+            secondary_table._meta.primary_key._meta.name
+        )
+        target_column_name = (
+            primary_foreign_key._foreign_key_meta.resolved_target_column._meta.name  # noqa: E501
+        )
+
+        related_rows: dict[Any, list[Table]] = {
+            getattr(row, target_column_name): [] for row in rows
+        }
+        # So each related row is only represented by a single instance.
+        secondary_rows: dict[Any, Table] = {}
+
+        identity_map = self._identity_map
+
+        for chunk in self._get_chunks(list(related_rows.keys())):
+            response = (
+                await joining_table.select(
+                    primary_foreign_key.as_alias("__primary"),
+                    *[
+                        i.as_alias(i._meta.name)
+                        for i in secondary_foreign_key.all_columns()
+                    ],
+                )
+                .where(primary_foreign_key.is_in(chunk))
+                .order_by(joining_table._meta.primary_key)
+                .run(node=node, in_pool=in_pool)
+            )
+            if not response:
+                continue
+
+            create = secondary_table._get_db_row_factory(
+                [i for i in response[0].keys() if i != "__primary"]
+            )
+
+            for data in response:
+                primary_key = data.pop("__primary")
+                secondary_primary_key = data[secondary_primary_key_name]
+                if secondary_primary_key is None:
+                    continue
+
+                secondary_row = secondary_rows.get(secondary_primary_key)
+                if secondary_row is None:
+                    secondary_row = create(data)
+                    if identity_map is not None:
+                        secondary_row = identity_map.add(secondary_row)
+                    secondary_rows[secondary_primary_key] = secondary_row
+
+                related_rows[primary_key].append(secondary_row)
+
+        for row in rows:
+            # Bypass ``__setattr__``, as it's not a column.
+            row.__dict__[m2m._meta.name] = related_rows[
+                getattr(row, target_column_name)
+            ]
+
+    def _get_chunks(self, values: list[Any]) -> list[list[Any]]:
+        """
+        Split up the values for an ``IN`` clause, so the query is within the
+        engine's limit on the number of bind parameters.
+        """
+        chunk_size = self.table._meta.db.max_query_parameters - 1
+        return batch(data=values, chunk_size=chunk_size)
+
     async def run(
         self,
         node: Optional[str] = None,
@@ -496,6 +919,24 @@ class Objects(
     ) -> list[TableInstance]:
         results = await super().run(node=node, in_pool=in_pool)
 
+        if results:
+            for (
+                foreign_key,
+                attribute_name,
+            ) in self.prefetch_delegate.reverse_fk_columns:
+                await self._prefetch_reverse(
+                    results,
+                    foreign_key=foreign_key,
+                    attribute_name=attribute_name,
+                    node=node,
+                    in_pool=in_pool,
+                )
+
+            for m2m in self.prefetch_delegate.m2m_relationships:
+                await self._prefetch_m2m(
+                    results, m2m=m2m, node=node, in_pool=in_pool
+                )
+
         if use_callbacks:
             # With callbacks, the user can return any data that they want.
             # Assume that most of the time they will still return a list of
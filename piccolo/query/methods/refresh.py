@@ -106,6 +106,8 @@ class Refresh:
         Update the table instance. It is called recursively, if the instance
         has child instances.
         """
+        refreshed_column_names: list[str] = []
+
         for key, value in data_dict.items():
             if isinstance(value, dict) and not isinstance(value, JSONDict):
                 # If the value is a dict, then it's a child instance.
@@ -114,6 +116,7 @@ class Refresh:
                     # safely assume that the object itself is null, as the
                     # primary key value must be null.
                     setattr(instance, key, None)
+                    refreshed_column_names.append(key)
                 else:
                     self._update_instance(
                         getattr(
@@ -131,18 +134,18 @@ class Refresh:
                         value,
                     )
             else:
-                setattr(
-                    instance,
-                    # We have to do this just in case a column uses
-                    # db_column_name.
-                    # We should try and optimise this in the future to minimise
-                    # the overhead of searching for a matching column.
-                    instance._meta.get_column_by_name(
-                        key,
-                        match_db_column_name=True,
-                    )._meta.name,
-                    value,
-                )
+                # We have to do this just in case a column uses
+                # db_column_name.
+                # We should try and optimise this in the future to minimise
+                # the overhead of searching for a matching column.
+                column_name = instance._meta.get_column_by_name(
+                    key,
+                    match_db_column_name=True,
+                )._meta.name
+                setattr(instance, column_name, value)
+                refreshed_column_names.append(column_name)
+
+        instance._reset_changed_columns(refreshed_column_names)
 
     async def run(
         self, in_pool: bool = True, node: Optional[str] = None
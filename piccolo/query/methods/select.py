@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import itertools
 from collections import OrderedDict
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncGenerator, Callable, Sequence
+from contextlib import aclosing
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,6 +11,7 @@ from typing import (
     Optional,
     TypeVar,
     Union,
+    cast,
     overload,
 )
 
@@ -36,7 +38,7 @@ from piccolo.query.mixins import (
     WhereDelegate,
 )
 from piccolo.query.proxy import Proxy
-from piccolo.querystring import QueryString
+from piccolo.querystring import Param, QueryString
 from piccolo.utils.dictionary import make_nested
 from piccolo.utils.encoding import dump_json, load_json
 from piccolo.utils.warnings import colored_warning
@@ -144,6 +146,51 @@ class SelectJSON(Proxy["Select", str]):
         return dump_json(rows)
 
 
+class SelectTuples(Proxy["Select", list[tuple]]):
+    """
+    This is for static typing purposes.
+    """
+
+    async def run(
+        self,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> list[tuple]:
+        return cast(
+            list[tuple], await self.query.run(node=node, in_pool=in_pool)
+        )
+
+
+class SelectColumns(Proxy["Select", dict[str, list]]):
+    """
+    This is for static typing purposes.
+    """
+
+    async def run(
+        self,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> dict[str, list]:
+        return cast(
+            dict[str, list], await self.query.run(node=node, in_pool=in_pool)
+        )
+
+
+class SelectArrays(Proxy["Select", dict[str, Any]]):
+    """
+    This is for static typing purposes.
+    """
+
+    async def run(
+        self,
+        node: Optional[str] = None,
+        in_pool: bool = True,
+    ) -> dict[str, Any]:
+        return cast(
+            dict[str, Any], await self.query.run(node=node, in_pool=in_pool)
+        )
+
+
 class Select(Query[TableInstance, list[dict[str, Any]]]):
     __slots__ = (
         "columns_list",
@@ -227,7 +274,7 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
         self.as_of_delegate.as_of(interval)
         return self
 
-    def limit(self: Self, number: int) -> Self:
+    def limit(self: Self, number: Union[int, Param]) -> Self:
         self.limit_delegate.limit(number)
         return self
 
@@ -235,7 +282,7 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
         self.limit_delegate.limit(1)
         return First(query=self)
 
-    def offset(self: Self, number: int) -> Self:
+    def offset(self: Self, number: Union[int, Param]) -> Self:
         self.offset_delegate.offset(number)
         return self
 
@@ -302,6 +349,55 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
             row[m2m_name] = [extra_rows_map.get(i) for i in row[m2m_name]]
         return response
 
+    @staticmethod
+    def _convert_m2m_json_values(
+        values: list[Any], m2m_select: M2MSelect
+    ) -> list[Any]:
+        from piccolo.engine.sqlite import convert_json_value_out
+
+        def convert(value: Any, column: Column) -> Any:
+            if isinstance(column, (JSON, JSONB)):
+                if m2m_select.load_json and isinstance(value, str):
+                    return load_json(value)
+                return value
+            return convert_json_value_out(value, column.column_type)
+
+        if m2m_select.as_list:
+            column = m2m_select.columns[0]
+            return [convert(value, column) for value in values]
+
+        return [
+            {
+                column._meta.name: convert(row[column._meta.name], column)
+                for column in m2m_select.columns
+            }
+            for row in values
+        ]
+
+    def _get_output_names(self) -> list[str]:
+        names = []
+        for selectable in self.columns_delegate.selected_columns:
+            if isinstance(selectable, Column):
+                names.append(
+                    selectable._alias or selectable._meta.get_default_alias()
+                )
+            elif isinstance(selectable, Readable):
+                names.append(selectable.output_name)
+            elif getattr(selectable, "_alias", None):
+                names.append(selectable._alias)
+        return names
+
+    def _validate(self):
+        output = self.output_delegate._output
+        if (output.as_tuples or output.as_columns or output.as_arrays) and any(
+            isinstance(i, M2MSelect)
+            for i in self.columns_delegate.selected_columns
+        ):
+            raise ValueError(
+                "`as_tuples`, `as_columns` and `as_arrays` aren't supported "
+                "when selecting M2M columns."
+            )
+
     async def response_handler(self, response):
         m2m_selects = [
             i
@@ -313,7 +409,15 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
             secondary_table = m2m_select.m2m._meta.secondary_table
             secondary_table_pk = secondary_table._meta.primary_key
 
-            if self.engine_type == "sqlite":
+            if self.engine_type == "sqlite" and m2m_select.sqlite_json_safe:
+                # The values are returned as JSON, which has already been
+                # loaded, but the values need converting to the correct type.
+                for row in response:
+                    row[m2m_name] = self._convert_m2m_json_values(
+                        row[m2m_name] or [], m2m_select
+                    )
+
+            elif self.engine_type == "sqlite":
                 # With M2M queries in SQLite, we always get the value back as a
                 # list of strings, so we need to do some type conversion.
                 value_type = (
@@ -439,6 +543,18 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
     def output(self: Self, *, as_json: bool) -> SelectJSON:  # type: ignore
         ...
 
+    @overload
+    def output(self: Self, *, as_tuples: bool) -> SelectTuples:  # type: ignore
+        ...
+
+    @overload
+    def output(self: Self, *, as_columns: bool) -> SelectColumns:  # type: ignore  # noqa: E501
+        ...
+
+    @overload
+    def output(self: Self, *, as_arrays: bool) -> SelectArrays:  # type: ignore
+        ...
+
     @overload
     def output(self: Self, *, load_json: bool) -> Self: ...
 
@@ -459,17 +575,55 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
         as_json: bool = False,
         load_json: bool = False,
         nested: bool = False,
-    ) -> Union[Self, SelectJSON, SelectList]:
+        as_tuples: bool = False,
+        as_columns: bool = False,
+        as_arrays: bool = False,
+    ) -> Union[
+        Self, SelectJSON, SelectList, SelectTuples, SelectColumns, SelectArrays
+    ]:
+        """
+        :param as_tuples:
+            Each row is returned as a tuple, with the values in the same order
+            as the selected columns. This is the fastest output format, as no
+            dictionaries are created.
+        :param as_columns:
+            Returns a dictionary mapping each column name to a list of values.
+        :param as_arrays:
+            Returns a dictionary mapping each column name to a NumPy array.
+            NumPy must be installed.
+
+        ``as_tuples``, ``as_columns`` and ``as_arrays`` can't be combined with
+        each other, or the other output options.
+
+        """
+        fast_paths = [i for i in (as_tuples, as_columns, as_arrays) if i]
+        if fast_paths and (
+            len(fast_paths) > 1 or as_list or as_json or load_json or nested
+        ):
+            raise ValueError(
+                "`as_tuples`, `as_columns` and `as_arrays` can't be combined "
+                "with the other output options."
+            )
+
         self.output_delegate.output(
             as_list=as_list,
             as_json=as_json,
             load_json=load_json,
             nested=nested,
+            as_tuples=as_tuples,
+            as_columns=as_columns,
+            as_arrays=as_arrays,
         )
         if as_list:
             return SelectList(query=self)
         elif as_json:
             return SelectJSON(query=self)
+        elif as_tuples:
+            return SelectTuples(query=self)
+        elif as_columns:
+            return SelectColumns(query=self)
+        elif as_arrays:
+            return SelectArrays(query=self)
 
         return self
 
@@ -502,6 +656,32 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
             kwargs.update(node=node)
         return await self.table._meta.db.batch(self, **kwargs)
 
+    async def stream(
+        self, prefetch: int = 500, node: Optional[str] = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Iterate over the results one row at a time, without loading them
+        all into memory::
+
+            >>> async for row in Band.select().stream():
+            ...     print(row)
+
+        A server side cursor is used on Postgres, and a regular cursor on
+        SQLite.
+
+        :param prefetch:
+            How many rows to fetch from the database at a time. The next
+            batch is fetched while the current one is being iterated over.
+        :param node:
+            Which node to run the query on (see ``extra_nodes`` on
+            :class:`PostgresEngine <piccolo.engine.postgres.PostgresEngine>`).
+
+        """
+        batch = await self.batch(batch_size=prefetch, node=node)
+        async with aclosing(batch.stream()) as rows:
+            async for row in rows:
+                yield row
+
     ###########################################################################
 
     def _get_joins(self, columns: Sequence[Selectable]) -> list[str]:
@@ -681,7 +861,12 @@ class Select(Query[TableInstance, list[dict[str, Any]]]):
             query += "{}"
             args.append(self.lock_rows_delegate._lock_rows.querystring)
 
-        querystring = QueryString(query, *args)
+        # Locking rows requires a connection which can write.
+        query_type = (
+            "generic" if self.lock_rows_delegate._lock_rows else "select"
+        )
+
+        querystring = QueryString(query, *args, query_type=query_type)
 
         return [querystring]
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 from piccolo.custom_types import Combinable, TableInstance
 from piccolo.query.base import Query
@@ -11,9 +11,13 @@ from piccolo.query.mixins import (
     WhereDelegate,
 )
 from piccolo.querystring import QueryString
+from piccolo.utils.list import batch
+from piccolo.utils.sql_values import convert_to_sql_value
 
 if TYPE_CHECKING:  # pragma: no cover
     from piccolo.columns import Column
+    from piccolo.engine.sqlite import SQLiteEngine
+    from piccolo.table import Table
 
 
 class UpdateError(Exception):
@@ -26,6 +30,7 @@ class Update(Query[TableInstance, list[Any]]):
         "returning_delegate",
         "values_delegate",
         "where_delegate",
+        "_row",
     )
 
     def __init__(
@@ -36,6 +41,8 @@ class Update(Query[TableInstance, list[Any]]):
         self.returning_delegate = ReturningDelegate()
         self.values_delegate = ValuesDelegate(table=table)
         self.where_delegate = WhereDelegate()
+        # Set when the query is saving a table instance.
+        self._row: Optional[Table] = None
 
     ###########################################################################
     # Clauses
@@ -85,6 +92,30 @@ class Update(Query[TableInstance, list[Any]]):
 
     ###########################################################################
 
+    async def _run(
+        self, node: Optional[str] = None, in_pool: bool = True
+    ) -> list[Any]:
+        if self._row is not None and not self.values_delegate._values:
+            # Nothing has changed since the row was loaded or saved.
+            return []
+
+        if (identity_map := self._identity_map) is not None:
+            if self._row is not None:
+                identity_map.replace(self._row)
+            else:
+                # We don't know which rows will be modified.
+                identity_map.invalidate(self.table)
+
+        return await super()._run(node=node, in_pool=in_pool)
+
+    def _raw_response_callback(self, results: list):
+        if self._row is not None:
+            self._row._reset_changed_columns(
+                column._meta.name for column in self.values_delegate._values
+            )
+
+    ###########################################################################
+
     @property
     def default_querystrings(self) -> Sequence[QueryString]:
         columns_str = ", ".join(
@@ -116,3 +147,205 @@ class Update(Query[TableInstance, list[Any]]):
             )
 
         return [querystring]
+
+
+class UpdateMany(Query[TableInstance, None]):
+    """
+    Saves the values of several existing rows at once - see
+    :meth:`Table.update_many <piccolo.table.Table.update_many>`.
+    """
+
+    __slots__ = ("instances", "columns")
+
+    def __init__(
+        self,
+        table: type[TableInstance],
+        instances: Sequence[TableInstance],
+        columns: Sequence[Column],
+        **kwargs,
+    ):
+        super().__init__(table, **kwargs)
+        self.instances = instances
+        self.columns = columns
+
+    ###########################################################################
+
+    def _validate(self):
+        if len(self.columns) == 0:
+            raise ValueError("No columns were specified to update.")
+
+        for column in self.columns:
+            if column._meta.primary_key:
+                raise ValueError("The primary key can't be updated.")
+
+        for instance in self.instances:
+            if not isinstance(instance, self.table):
+                raise TypeError(
+                    f"{instance} isn't an instance of {self.table.__name__}."
+                )
+            if not instance._exists_in_db:
+                raise ValueError(
+                    f"{instance} hasn't been saved to the database yet."
+                )
+
+    def _get_values(self, instance: TableInstance) -> list[Any]:
+        return [
+            convert_to_sql_value(
+                value=getattr(instance, column._meta.name), column=column
+            )
+            for column in self.columns
+        ]
+
+    def _get_cast_type(self, column: Column) -> str:
+        """
+        The values in ``VALUES`` need an explicit type, otherwise Postgres
+        treats them as text.
+        """
+        from piccolo.columns.column_types import (
+            BigInt,
+            BigSerial,
+            Integer,
+            Serial,
+        )
+
+        if isinstance(column, BigSerial):
+            return BigInt()._get_column_type(
+                engine_type=column._meta.engine_type
+            )
+        elif isinstance(column, Serial):
+            return Integer().column_type
+        return column.column_type
+
+    ###########################################################################
+
+    async def _run(
+        self, node: Optional[str] = None, in_pool: bool = True
+    ) -> None:
+        if self._frozen_querystrings is None:
+            self._validate()
+
+        if not self.instances:
+            return None
+
+        engine = self.table._meta.db
+
+        if self.engine_type == "sqlite" and self._frozen_querystrings is None:
+            # The same statement is run for each row, so it's only prepared
+            # once, and only the template needs compiling.
+            args = [self._get_sqlite_args(i) for i in self.instances]
+            await cast("SQLiteEngine", engine).run_executemany(
+                QueryString(self._get_sqlite_template(), *args[0]),
+                args,
+                in_pool=in_pool,
+            )
+            self._reset_changed_columns()
+            self._update_identity_map()
+            return None
+
+        querystrings = self.querystrings
+        if len(querystrings) == 1:
+            await engine.run_querystring(querystrings[0], in_pool=in_pool)
+        else:
+            async with engine.transaction():
+                for querystring in querystrings:
+                    await engine.run_querystring(querystring, in_pool=in_pool)
+
+        self._reset_changed_columns()
+        self._update_identity_map()
+        return None
+
+    def _reset_changed_columns(self):
+        column_names = [column._meta.name for column in self.columns]
+        for instance in self.instances:
+            instance._reset_changed_columns(column_names)
+
+    def _update_identity_map(self):
+        if (identity_map := self._identity_map) is not None:
+            for instance in self.instances:
+                identity_map.replace(instance)
+
+    ###########################################################################
+
+    def _get_sqlite_template(self) -> str:
+        primary_key = self.table._meta.primary_key
+        columns_str = ", ".join(
+            f'"{column._meta.db_column_name}" = {{}}'
+            for column in self.columns
+        )
+        return (
+            f"UPDATE {self.table._meta.get_formatted_tablename()} "
+            f'SET {columns_str} WHERE "{primary_key._meta.db_column_name}" '
+            "= {}"
+        )
+
+    def _get_sqlite_args(self, instance: TableInstance) -> list[Any]:
+        return [
+            *self._get_values(instance),
+            getattr(instance, self.table._meta.primary_key._meta.name),
+        ]
+
+    @property
+    def sqlite_querystrings(self) -> Sequence[QueryString]:
+        """
+        One ``UPDATE`` per row. When run, the template and the values for
+        each row are sent using ``executemany`` instead.
+        """
+        template = self._get_sqlite_template()
+        return [
+            QueryString(template, *self._get_sqlite_args(instance))
+            for instance in self.instances
+        ]
+
+    @property
+    def default_querystrings(self) -> Sequence[QueryString]:
+        """
+        A single ``UPDATE ... FROM (VALUES ...)`` query, split into chunks if
+        there are more values than the engine allows in a query.
+        """
+        primary_key = self.table._meta.primary_key
+        tablename = self.table._meta.get_formatted_tablename()
+        columns = [primary_key, *self.columns]
+
+        column_names = ", ".join(
+            f'"{column._meta.db_column_name}"' for column in columns
+        )
+        set_str = ", ".join(
+            f'"{column._meta.db_column_name}" = '
+            f'"update_many"."{column._meta.db_column_name}"'
+            for column in self.columns
+        )
+        row_template = (
+            "("
+            + ", ".join(
+                f"{{}}::{self._get_cast_type(column)}" for column in columns
+            )
+            + ")"
+        )
+
+        chunk_size = max(
+            1, self.table._meta.db.max_query_parameters // len(columns)
+        )
+
+        querystrings = []
+        for chunk in batch(data=list(self.instances), chunk_size=chunk_size):
+            rows = [
+                QueryString(
+                    row_template,
+                    getattr(instance, primary_key._meta.name),
+                    *self._get_values(instance),
+                )
+                for instance in chunk
+            ]
+            values_str = ", ".join("{}" for _ in rows)
+            querystrings.append(
+                QueryString(
+                    f"UPDATE {tablename} SET {set_str} "
+                    f'FROM (VALUES {values_str}) AS "update_many" '
+                    f"({column_names}) "
+                    f'WHERE {tablename}."{primary_key._meta.db_column_name}" '
+                    f'= "update_many"."{primary_key._meta.db_column_name}"',
+                    *rows,
+                )
+            )
+
+        return querystrings
@@ -12,11 +12,12 @@ from piccolo.columns import And, Column, Or, Where
 from piccolo.columns.column_types import ForeignKey
 from piccolo.columns.combination import WhereRaw
 from piccolo.custom_types import Combinable
-from piccolo.querystring import QueryString
+from piccolo.querystring import Param, QueryString
 from piccolo.utils.list import flatten
 from piccolo.utils.sql_values import convert_to_sql_value
 
 if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.columns.m2m import M2M
     from piccolo.querystring import Selectable
     from piccolo.table import Table  # noqa
 
@@ -89,14 +90,16 @@ class Distinct:
 class Limit:
     __slots__ = ("number",)
 
-    number: int
+    number: Union[int, Param]
 
     def __post_init__(self):
-        if not isinstance(self.number, int):
+        if not isinstance(self.number, (int, Param)):
             raise TypeError("Limit must be an integer")
 
     @property
     def querystring(self) -> QueryString:
+        if isinstance(self.number, Param):
+            return QueryString(" LIMIT {}", self.number)
         return QueryString(f" LIMIT {self.number}")
 
     def __str__(self) -> str:
@@ -128,14 +131,16 @@ class AsOf:
 class Offset:
     __slots__ = ("number",)
 
-    number: int
+    number: Union[int, Param]
 
     def __post_init__(self):
-        if not isinstance(self.number, int):
+        if not isinstance(self.number, (int, Param)):
             raise TypeError("Offset must be an integer")
 
     @property
     def querystring(self) -> QueryString:
+        if isinstance(self.number, Param):
+            return QueryString(" OFFSET {}", self.number)
         return QueryString(f" OFFSET {self.number}")
 
     def __str__(self) -> str:
@@ -218,6 +223,10 @@ class Output:
     as_json: bool = False
     as_list: bool = False
     as_objects: bool = False
+    as_tuples: bool = False
+    as_columns: bool = False
+    as_arrays: bool = False
+    as_rows: bool = False
     load_json: bool = False
     nested: bool = False
 
@@ -226,6 +235,10 @@ class Output:
             as_json=self.as_json,
             as_list=self.as_list,
             as_objects=self.as_objects,
+            as_tuples=self.as_tuples,
+            as_columns=self.as_columns,
+            as_arrays=self.as_arrays,
+            as_rows=self.as_rows,
             load_json=self.load_json,
             nested=self.nested,
         )
@@ -312,7 +325,7 @@ class LimitDelegate:
     _limit: Optional[Limit] = None
     _first: bool = False
 
-    def limit(self, number: int):
+    def limit(self, number: Union[int, Param]):
         self._limit = Limit(number)
 
     def copy(self) -> LimitDelegate:
@@ -384,6 +397,10 @@ class OutputDelegate:
     .output(as_list=True)
     .output(as_json=True)
     .output(as_json=True, as_list=True)
+    .output(as_tuples=True)
+    .output(as_columns=True)
+    .output(as_arrays=True)
+    .output(as_rows=True)
     """
 
     _output: Output = field(default_factory=Output)
@@ -394,6 +411,10 @@ class OutputDelegate:
         as_json: Optional[bool] = None,
         load_json: Optional[bool] = None,
         nested: Optional[bool] = None,
+        as_tuples: Optional[bool] = None,
+        as_columns: Optional[bool] = None,
+        as_arrays: Optional[bool] = None,
+        as_rows: Optional[bool] = None,
     ):
         """
         :param as_list:
@@ -405,6 +426,17 @@ class OutputDelegate:
         :param load_json:
             If True, any JSON fields will have the JSON values returned from
             the database loaded as Python objects.
+        :param as_tuples:
+            Each row is returned as a tuple, rather than a dictionary.
+        :param as_columns:
+            The results are returned as a dictionary, mapping each column
+            name to a list of values.
+        :param as_arrays:
+            Like ``as_columns``, except each list of values is converted
+            into a NumPy array.
+        :param as_rows:
+            Used by ``Objects`` - each row is returned as a lightweight
+            ``TableRow``, rather than a ``Table`` instance.
         """
         # We do it like this, so output can be called multiple times, without
         # overriding any existing values if they're not specified.
@@ -414,6 +446,18 @@ class OutputDelegate:
         if as_json is not None:
             self._output.as_json = bool(as_json)
 
+        if as_tuples is not None:
+            self._output.as_tuples = bool(as_tuples)
+
+        if as_columns is not None:
+            self._output.as_columns = bool(as_columns)
+
+        if as_arrays is not None:
+            self._output.as_arrays = bool(as_arrays)
+
+        if as_rows is not None:
+            self._output.as_rows = bool(as_rows)
+
         if load_json is not None:
             self._output.load_json = bool(load_json)
 
@@ -476,9 +520,15 @@ class PrefetchDelegate:
     Example usage:
 
     .prefetch(MyTable.column_a, MyTable.column_b)
+    .prefetch_reverse(OtherTable.my_table)
+    .prefetch_m2m(MyTable.m2m_column)
     """
 
     fk_columns: list[ForeignKey] = field(default_factory=list)
+    reverse_fk_columns: list[tuple[ForeignKey, str]] = field(
+        default_factory=list
+    )
+    m2m_relationships: list[M2M] = field(default_factory=list)
 
     def prefetch(self, *fk_columns: Union[ForeignKey, list[ForeignKey]]):
         """
@@ -498,6 +548,28 @@ class PrefetchDelegate:
         combined = self.fk_columns + _fk_columns
         self.fk_columns = combined
 
+    def prefetch_reverse(
+        self, foreign_key: ForeignKey, attribute_name: Optional[str] = None
+    ):
+        """
+        :param foreign_key:
+            A ``ForeignKey`` on another table, which points to this table.
+        :param attribute_name:
+            The name of the attribute which the related rows are assigned to.
+            Defaults to the other table's name, with ``_set`` appended.
+
+        """
+        if not isinstance(foreign_key, ForeignKey):
+            raise ValueError(f"{foreign_key} doesn't seem to be a ForeignKey.")
+
+        if attribute_name is None:
+            attribute_name = f"{foreign_key._meta.table._meta.tablename}_set"
+
+        self.reverse_fk_columns.append((foreign_key, attribute_name))
+
+    def prefetch_m2m(self, *m2m: M2M):
+        self.m2m_relationships.extend(m2m)
+
 
 @dataclass
 class ColumnsDelegate:
@@ -595,7 +667,7 @@ class OffsetDelegate:
 
     _offset: Optional[Offset] = None
 
-    def offset(self, number: int = 0):
+    def offset(self, number: Union[int, Param] = 0):
         self._offset = Offset(number)
 
 
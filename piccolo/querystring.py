@@ -4,6 +4,7 @@ from abc import ABCMeta, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from importlib.util import find_spec
 from string import Formatter
 from typing import TYPE_CHECKING, Any, Optional
@@ -48,6 +49,34 @@ class Selectable(metaclass=ABCMeta):
         return self
 
 
+class Param:
+    """
+    A placeholder for a value, which is only provided when the query is run.
+    It's used with frozen queries, so the same SQL can be reused with
+    different values:
+
+    .. code-block:: python
+
+        >>> GET_BAND = Band.select().where(
+        ...     Band.id == Param("band_id")
+        ... ).freeze()
+        >>> await GET_BAND.run(band_id=1)
+        [{'id': 1, 'name': 'Pythonistas', 'manager': 1, 'popularity': 1000}]
+
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __str__(self) -> str:
+        return f":{self.name}"
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+
 @dataclass
 class Fragment:
     prefix: str
@@ -55,6 +84,66 @@ class Fragment:
     no_arg: bool = False
 
 
+###############################################################################
+# Compiled template cache
+
+# The maximum number of compiled SQL strings which are kept in memory.
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def parse_template(template: str) -> tuple[str, ...]:
+    """
+    Split up the template, separating by ``{}``. Only the literal text before
+    each placeholder is returned.
+    """
+    return tuple(i[0] for i in Formatter().parse(template))
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_fingerprint(fingerprint: tuple, engine_type: str) -> str:
+    """
+    Converts the fingerprint of a ``QueryString`` (see
+    ``QueryString.get_fingerprint``) into SQL, with the correct placeholders
+    for the engine.
+
+    The result is cached, so queries with the same shape, but different
+    values, only need to be compiled once.
+    """
+    if engine_type in ("postgres", "cockroach"):
+        numbered = True
+    elif engine_type == "sqlite":
+        numbered = False
+    else:
+        raise Exception("Engine type not recognised")
+
+    output: list[str] = []
+    index = 1
+
+    def _compile(fingerprint: tuple):
+        nonlocal index
+
+        template, *children = fingerprint
+
+        for fragment_index, prefix in enumerate(parse_template(template)):
+            output.append(prefix)
+
+            if fragment_index >= len(children):
+                # trailing element
+                continue
+
+            child = children[fragment_index]
+            if child is None:
+                output.append(f"${index}" if numbered else "?")
+                index += 1
+            else:
+                _compile(child)
+
+    _compile(fingerprint)
+
+    return "".join(output)
+
+
 class QueryString(Selectable):
     """
     When we're composing complex queries, we're combining QueryStrings, rather
@@ -91,7 +180,9 @@ class QueryString(Selectable):
             braces in the template).
         :param query_type:
             The query type is sometimes used by the engine to modify how the
-            query is run. For example, INSERT queries on old SQLite versions.
+            query is run. For example, INSERT queries on old SQLite versions,
+            or ``'select'`` queries, which only read data, so can be run on
+            a read only connection.
         :param table:
             Sometimes the ``piccolo.engine.base.Engine`` needs access to the
             table that the query is being run on.
@@ -163,6 +254,8 @@ class QueryString(Selectable):
                 converted_args.append(f"'{arg}'")
             elif arg is None:
                 converted_args.append("null")
+            elif isinstance(arg, Param):
+                converted_args.append(str(arg))
             else:
                 converted_args.append(arg)
 
@@ -176,7 +269,7 @@ class QueryString(Selectable):
     ):
         # Split up the string, separating by {}.
         fragments = [
-            Fragment(prefix=i[0]) for i in Formatter().parse(self.template)
+            Fragment(prefix=prefix) for prefix in parse_template(self.template)
         ]
 
         bundled = [] if bundled is None else bundled
@@ -217,32 +310,85 @@ class QueryString(Selectable):
         if self._frozen_compiled_strings is not None:
             return self._frozen_compiled_strings
 
-        _, bundled, combined_args = self.bundle(
-            start_index=1, bundled=[], combined_args=[]
-        )
-        if engine_type in ("postgres", "cockroach"):
-            string = "".join(
-                fragment.prefix
-                + ("" if fragment.no_arg else f"${fragment.index}")
-                for fragment in bundled
-            )
-
-        elif engine_type == "sqlite":
-            string = "".join(
-                fragment.prefix + ("" if fragment.no_arg else "?")
-                for fragment in bundled
-            )
-
-        else:
-            raise Exception("Engine type not recognised")
+        combined_args: list[Any] = []
+        fingerprint = self.get_fingerprint(combined_args=combined_args)
+        string = compile_fingerprint(fingerprint, engine_type)
 
         return (string, combined_args)
 
+    def get_fingerprint(self, combined_args: list[Any]) -> tuple:
+        """
+        Returns the structure of the ``QueryString`` (the templates of it, and
+        any nested ``QueryString`` instances), without the argument values.
+        Two queries which only differ by their argument values have the same
+        fingerprint, so the compiled SQL can be reused.
+
+        :param combined_args:
+            The argument values are appended to this list, in the order they
+            appear in the compiled SQL.
+
+        """
+        fragment_count = len(parse_template(self.template))
+        fingerprint: list[Any] = [self.template]
+
+        for value in self.args[:fragment_count]:
+            if isinstance(value, QueryString):
+                fingerprint.append(
+                    value.get_fingerprint(combined_args=combined_args)
+                )
+            else:
+                fingerprint.append(None)
+                combined_args.append(value)
+
+        return tuple(fingerprint)
+
     def freeze(self, engine_type: str = "postgres"):
         self._frozen_compiled_strings = self.compile_string(
             engine_type=engine_type
         )
 
+    def get_param_names(self) -> set[str]:
+        """
+        Returns the names of any ``Param`` values in a frozen
+        ``QueryString``.
+        """
+        if self._frozen_compiled_strings is None:
+            raise ValueError("The QueryString must be frozen first.")
+
+        _, args = self._frozen_compiled_strings
+        return {arg.name for arg in args if isinstance(arg, Param)}
+
+    def bind(self, **params: Any) -> QueryString:
+        """
+        Returns a copy of a frozen ``QueryString``, with any ``Param`` values
+        replaced by the values provided. The compiled SQL is reused.
+        """
+        if self._frozen_compiled_strings is None:
+            raise ValueError("The QueryString must be frozen first.")
+
+        string, args = self._frozen_compiled_strings
+
+        bound_args = []
+        for arg in args:
+            if isinstance(arg, Param):
+                try:
+                    arg = params[arg.name]
+                except KeyError as exception:
+                    raise ValueError(
+                        f"No value was provided for Param('{arg.name}')."
+                    ) from exception
+            bound_args.append(arg)
+
+        querystring = QueryString(
+            self.template,
+            *self.args,
+            query_type=self.query_type,
+            table=self.table,
+            alias=self._alias,
+        )
+        querystring._frozen_compiled_strings = (string, bound_args)
+        return querystring
+
     ###########################################################################
 
     def get_select_string(
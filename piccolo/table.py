@@ -4,7 +4,7 @@ import inspect
 import itertools
 import types
 import warnings
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
 from graphlib import TopologicalSorter
 from typing import TYPE_CHECKING, Any, Optional, Union, cast, overload
@@ -48,8 +48,13 @@ from piccolo.query import (
 )
 from piccolo.query.methods.create_index import CreateIndex
 from piccolo.query.methods.indexes import Indexes
-from piccolo.query.methods.objects import GetRelated, UpdateSelf
+from piccolo.query.methods.objects import (
+    GetRelated,
+    LoadRelated,
+    UpdateSelf,
+)
 from piccolo.query.methods.refresh import Refresh
+from piccolo.query.methods.update import UpdateMany
 from piccolo.querystring import QueryString
 from piccolo.utils import _camel_to_snake
 from piccolo.utils.sql_values import convert_to_sql_value
@@ -98,6 +103,9 @@ class TableMeta:
     # Piccolo API.
     _foreign_key_references: list[ForeignKey] = field(default_factory=list)
 
+    # Lazily generated by ``Table._get_row_class``.
+    _row_class: Optional[type[TableRow]] = None
+
     def get_formatted_tablename(
         self, include_schema: bool = True, quoted: bool = True
     ) -> str:
@@ -247,6 +255,71 @@ class TableMetaclass(type):
         return cls.__name__
 
 
+class TableRow:
+    """
+    A lightweight, read only alternative to ``Table`` instances, for when
+    lots of rows are being loaded. A subclass is generated for each
+    ``Table``, with a ``__slots__`` entry for each column, so it uses much
+    less memory than a ``Table`` instance. See ``Objects.output``.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    _table: type[Table]
+
+    @classmethod
+    def _from_db_rows(cls, rows: list[dict[str, Any]]) -> list[TableRow]:
+        if not rows:
+            return []
+
+        names = cls._table._get_attribute_names(rows[0].keys())
+        if names is None or len(names) != len(cls.__slots__):
+            raise ValueError(
+                "Rows can only be created when all of the columns are "
+                "selected."
+            )
+
+        output = []
+        for row in rows:
+            instance = object.__new__(cls)
+            for name, value in zip(names, row.values()):
+                object.__setattr__(instance, name, value)
+            output.append(instance)
+        return output
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns a dictionary mapping each column name to its value.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{self.__class__.__name__} is read only.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{self.__class__.__name__} is read only.")
+
+    def __repr__(self) -> str:
+        pk = getattr(self, self._table._meta.primary_key._meta.name, None)
+        return f"<{self.__class__.__name__}: {pk}>"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TableRow):
+            return NotImplemented
+
+        if other._table is not self._table:
+            return False
+
+        pk_name = self._table._meta.primary_key._meta.name
+        return getattr(self, pk_name) == getattr(other, pk_name)
+
+    def __hash__(self) -> int:
+        pk_name = self._table._meta.primary_key._meta.name
+        return hash((self._table, getattr(self, pk_name)))
+
+
 class Table(metaclass=TableMetaclass):
     """
     The class represents a database table. An instance represents a row.
@@ -489,6 +562,156 @@ class Table(metaclass=TableMetaclass):
             unrecognised_list = list(unrecognized)
             raise ValueError(f"Unrecognized columns - {unrecognised_list}")
 
+        # Which attributes have been modified since the row was loaded from,
+        # or last saved to, the database. If ``None``, we don't know what's
+        # in the database (e.g. ``_exists_in_db=True`` was passed in by the
+        # user), so all of the values need saving.
+        self.__dict__["_changed_columns"] = None
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        changed_columns = self.__dict__.get("_changed_columns")
+        if changed_columns is not None:
+            changed_columns.add(name)
+
+    def _reset_changed_columns(
+        self, column_names: Optional[Iterable[str]] = None
+    ):
+        """
+        Call this once the values match what's in the database.
+
+        :param column_names:
+            If specified, only these columns are marked as unchanged.
+            Otherwise, all of them are.
+
+        """
+        if column_names is None:
+            self.__dict__["_changed_columns"] = set()
+        elif (
+            changed_columns := self.__dict__.get("_changed_columns")
+        ) is not None:
+            changed_columns.difference_update(column_names)
+
+    def _get_changed_columns(self) -> list[Column]:
+        """
+        The columns which need saving to the database, excluding the primary
+        key.
+        """
+        changed_columns = self.__dict__.get("_changed_columns")
+
+        return [
+            column
+            for column in self._meta.columns
+            if not column._meta.primary_key
+            and (
+                changed_columns is None
+                or column._meta.name in changed_columns
+                # If the value is mutable, it might have been modified in
+                # place, which we can't detect.
+                or isinstance(
+                    self.__dict__.get(column._meta.name), (list, dict)
+                )
+            )
+        ]
+
+    @classmethod
+    def _get_attribute_names(cls, keys: Iterable[str]) -> Optional[list[str]]:
+        """
+        Map the keys of a row returned by the database to the column
+        attribute names. Returns ``None`` if any of the keys don't match a
+        column.
+        """
+        names = []
+        for key in keys:
+            try:
+                column = cls._meta.get_column_by_name(
+                    key, match_db_column_name=True
+                )
+            except ValueError:
+                return None
+            if column._meta.call_chain:
+                return None
+            names.append(column._meta.name)
+        return names
+
+    @classmethod
+    def _get_db_row_factory(
+        cls: type[TableInstance], keys: Sequence[str]
+    ) -> Callable[[dict[str, Any]], TableInstance]:
+        """
+        Returns a function for creating instances from rows loaded from the
+        database, which all have the given keys. If every column is present,
+        the values are assigned directly, skipping the defaults and
+        validation in ``__init__``.
+        """
+        names = cls._get_attribute_names(keys)
+        if (
+            names is None
+            or len(set(names)) != len(cls._meta.columns)
+            # Subclasses might have custom logic in their constructor.
+            or cls.__init__ is not Table.__init__
+        ):
+
+            def create(row: dict[str, Any]) -> TableInstance:
+                instance = cls(**row, _exists_in_db=True)
+                instance._reset_changed_columns()
+                return instance
+
+            return create
+
+        rename = names != list(keys)
+
+        def create_fast(row: dict[str, Any]) -> TableInstance:
+            instance = object.__new__(cls)
+            # Assign to ``__dict__`` directly, as ``__setattr__`` tracks the
+            # changed columns.
+            values = instance.__dict__
+            values.update(zip(names, row.values()) if rename else row)
+            values["_exists_in_db"] = True
+            values["_was_created"] = None
+            values["_changed_columns"] = set()
+            return instance
+
+        return create_fast
+
+    @classmethod
+    def _from_db_rows(
+        cls: type[TableInstance], rows: list[dict[str, Any]]
+    ) -> list[TableInstance]:
+        """
+        Create instances for rows loaded from the database.
+        """
+        if not rows:
+            return []
+
+        create = cls._get_db_row_factory(list(rows[0].keys()))
+        return [create(row) for row in rows]
+
+    @classmethod
+    def _get_row_class(cls) -> type[TableRow]:
+        """
+        Returns a subclass of :class:`TableRow` for this table, which is
+        generated the first time it's needed.
+        """
+        row_class = cls._meta._row_class
+        if row_class is None:
+            row_class = cast(
+                type[TableRow],
+                type(
+                    f"{cls.__name__}Row",
+                    (TableRow,),
+                    {
+                        "__slots__": tuple(
+                            i._meta.name for i in cls._meta.columns
+                        ),
+                        "__module__": cls.__module__,
+                        "_table": cls,
+                    },
+                ),
+            )
+            cls._meta._row_class = row_class
+        return row_class
+
     @classmethod
     def _create_serial_primary_key(cls) -> Serial:
         pk = Serial(index=False, primary_key=True, db_column_name="id")
@@ -526,8 +749,9 @@ class Table(metaclass=TableMetaclass):
                 band.popularity = 2000
                 await band.save(columns=[Band.popularity])
 
-            If ``columns=None`` (the default) then all columns will be synced
-            back to the database.
+            If ``columns=None`` (the default) then only the columns which
+            have changed since the row was loaded, or last saved, are synced
+            back to the database. If nothing has changed, no query is run.
 
         """
         cls = self.__class__
@@ -538,9 +762,7 @@ class Table(metaclass=TableMetaclass):
 
         # Pre-existing row - update
         if columns is None:
-            column_instances = [
-                i for i in cls._meta.columns if not i._meta.primary_key
-            ]
+            column_instances = self._get_changed_columns()
         else:
             column_instances = [
                 self._meta.get_column_by_name(i) if isinstance(i, str) else i
@@ -551,14 +773,14 @@ class Table(metaclass=TableMetaclass):
             i: getattr(self, i._meta.name, None) for i in column_instances
         }
 
-        # Assign any `auto_update` values
-        if cls._meta.auto_update_columns:
+        # Assign any `auto_update` values, unless there's nothing to save.
+        if values and cls._meta.auto_update_columns:
             auto_update_values = cls._meta.get_auto_update_values()
             values.update(auto_update_values)
             for column, value in auto_update_values.items():
                 setattr(self, column._meta.name, value)
 
-        return cls.update(
+        query = cls.update(
             values,  # type: ignore
             # We've already included the `auto_update` columns, so no need
             # to do it again:
@@ -567,6 +789,8 @@ class Table(metaclass=TableMetaclass):
             cls._meta.primary_key
             == getattr(self, self._meta.primary_key._meta.name)
         )
+        query._row = self
+        return query
 
     def update_self(self, values: dict[Union[Column, str], Any]) -> UpdateSelf:
         """
@@ -684,12 +908,61 @@ class Table(metaclass=TableMetaclass):
 
         if not isinstance(foreign_key, ForeignKey):
             raise ValueError(
-                "foreign_key isn't a ForeignKey instance,  or the name of a "
+                "foreign_key isn't a ForeignKey instance, or the name of a "
                 "ForeignKey column."
             )
 
         return GetRelated(foreign_key=foreign_key, row=self)
 
+    @overload
+    @classmethod
+    def load_related(
+        cls,
+        rows: Sequence[Table],
+        foreign_key: ForeignKey[ReferencedTable],
+    ) -> LoadRelated[ReferencedTable]: ...
+
+    @overload
+    @classmethod
+    def load_related(
+        cls, rows: Sequence[Table], foreign_key: str
+    ) -> LoadRelated[Table]: ...
+
+    @classmethod
+    def load_related(
+        cls,
+        rows: Sequence[Table],
+        foreign_key: Union[str, ForeignKey[ReferencedTable]],
+    ) -> LoadRelated[ReferencedTable]:
+        """
+        Like ``get_related``, but for lots of rows at once. Rather than
+        running a query for each row, the related rows are fetched using a
+        single query, and are assigned to each row.
+
+        .. code-block:: python
+
+            bands = await Band.objects()
+            managers = await Band.load_related(bands, Band.manager)
+            >>> bands[0].manager.name
+            'Guido'
+
+        A list is returned, containing the related row for each row (or
+        ``None`` if there isn't one).
+
+        """
+        if isinstance(foreign_key, str):
+            column = cls._meta.get_column_by_name(foreign_key)
+            if isinstance(column, ForeignKey):
+                foreign_key = column
+
+        if not isinstance(foreign_key, ForeignKey):
+            raise ValueError(
+                "foreign_key isn't a ForeignKey instance, or the name of a "
+                "ForeignKey column."
+            )
+
+        return LoadRelated(rows=rows, foreign_key=foreign_key)
+
     def get_m2m(self, m2m: M2M) -> M2MGetRelated:
         """
         Get all matching rows via the join table.
@@ -1100,7 +1373,7 @@ class Table(metaclass=TableMetaclass):
         return query
 
     @classmethod
-    def raw(cls, sql: str, *args: Any) -> Raw:
+    def raw(cls, sql: str, *args: Any, read_only: bool = False) -> Raw:
         """
         Execute raw SQL queries on the underlying engine - use with caution!
 
@@ -1114,8 +1387,17 @@ class Table(metaclass=TableMetaclass):
 
             await Band.raw("SELECT * FROM band WHERE name = {}", 'Pythonistas')
 
+        :param read_only:
+            Set this to ``True`` if the query only reads data, so it can be
+            run on a read only connection, or a read replica.
+
         """
-        return Raw(table=cls, querystring=QueryString(sql, *args))
+        return Raw(
+            table=cls,
+            querystring=QueryString(
+                sql, *args, query_type="select" if read_only else "generic"
+            ),
+        )
 
     @classmethod
     def _process_column_args(
@@ -1380,6 +1662,56 @@ class Table(metaclass=TableMetaclass):
 
         return Update(table=cls, force=force).values(values)
 
+    @classmethod
+    def update_many(
+        cls: type[TableInstance],
+        instances: Sequence[TableInstance],
+        columns: Optional[Sequence[Union[Column, str]]] = None,
+    ) -> UpdateMany:
+        """
+        Save the values of several existing rows at once, rather than calling
+        ``save`` on each of them, which does a query per row.
+
+        .. code-block:: python
+
+            bands = await Band.objects()
+            for band in bands:
+                band.popularity += 1
+
+            await Band.update_many(bands, columns=[Band.popularity])
+
+        In Postgres and Cockroach this is a single
+        ``UPDATE ... FROM (VALUES ...)`` query. In SQLite, the ``UPDATE`` is
+        prepared once, and run for each row using ``executemany``.
+
+        :param columns:
+            Which columns to save. If ``None`` (the default), all columns
+            apart from the primary key are saved.
+
+        """
+        if columns is None:
+            column_instances = [
+                i for i in cls._meta.columns if not i._meta.primary_key
+            ]
+        else:
+            column_instances = [
+                cls._meta.get_column_by_name(i) if isinstance(i, str) else i
+                for i in columns
+            ]
+
+        # Assign any `auto_update` values
+        if cls._meta.auto_update_columns:
+            auto_update_values = cls._meta.get_auto_update_values()
+            for column, value in auto_update_values.items():
+                if not any(i is column for i in column_instances):
+                    column_instances.append(column)
+                for instance in instances:
+                    setattr(instance, column._meta.name, value)
+
+        return UpdateMany(
+            table=cls, instances=instances, columns=column_instances
+        )
+
     @classmethod
     def indexes(cls) -> Indexes:
         """
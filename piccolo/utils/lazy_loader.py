@@ -45,6 +45,11 @@ class LazyLoader(types.ModuleType):
                     "SQLite driver not found. "
                     "Try running `pip install 'piccolo[sqlite]'`"
                 ) from exc
+            elif str(exc) == "No module named 'numpy'":
+                raise ModuleNotFoundError(
+                    "NumPy not found. "
+                    "Try running `pip install 'piccolo[numpy]'`"
+                ) from exc
             else:
                 raise exc from exc
 
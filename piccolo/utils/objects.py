@@ -1,14 +1,104 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
 
-from piccolo.columns.column_types import ForeignKey
+from piccolo.columns.column_types import JSON, JSONB, ForeignKey
 from piccolo.utils import encoding
 
 if TYPE_CHECKING:  # pragma: no cover
     from piccolo.table import Table
 
 
+# The maximum number of hydrators which are kept in memory.
+HYDRATOR_CACHE_SIZE = 1024
+
+Hydrator = Callable[[dict[str, Any]], "Table"]
+
+# Describes the keys in a nested row, for example:
+# (('id', None), ('manager', (('id', None), ('name', None))))
+RowShape = tuple[tuple[str, Optional["RowShape"]], ...]
+
+
+def get_row_shape(row: dict[str, Any]) -> RowShape:
+    return tuple(
+        (key, get_row_shape(value) if isinstance(value, dict) else None)
+        for key, value in row.items()
+    )
+
+
+@lru_cache(maxsize=HYDRATOR_CACHE_SIZE)
+def get_hydrator(
+    table_class: type[Table], shape: RowShape, load_json: bool = False
+) -> Hydrator:
+    """
+    Returns a function which converts nested dictionaries with the given
+    shape into ``Table`` instances. Which keys are foreign keys, and which
+    are JSON, is only worked out once, rather than for every row.
+    """
+    # Maps the key of each foreign key to the hydrator for the related table.
+    foreign_keys: list[tuple[str, type[Table], Optional[Hydrator]]] = []
+    json_keys: list[str] = []
+
+    for key, nested_shape in shape:
+        try:
+            column = table_class._meta.get_column_by_name(
+                key, match_db_column_name=True
+            )
+        except ValueError:
+            # Let the ``Table`` constructor raise a helpful error.
+            continue
+
+        if isinstance(column, ForeignKey):
+            related_table_class = column._foreign_key_meta.resolved_references
+            foreign_keys.append(
+                (
+                    key,
+                    related_table_class,
+                    (
+                        get_hydrator(
+                            related_table_class,
+                            nested_shape,
+                            load_json=load_json,
+                        )
+                        if nested_shape is not None
+                        else None
+                    ),
+                )
+            )
+        elif load_json and isinstance(column, (JSON, JSONB)):
+            json_keys.append(key)
+
+    create = table_class._get_db_row_factory([key for key, _ in shape])
+
+    def hydrate(row: dict[str, Any]) -> Table:
+        values = dict(row)
+
+        for key, related_table_class, hydrator in foreign_keys:
+            value = values[key]
+            if isinstance(value, dict):
+                values[key] = (
+                    hydrator(value)
+                    if hydrator is not None
+                    else make_nested_object(
+                        value, related_table_class, load_json=load_json
+                    )
+                )
+
+        for key in json_keys:
+            value = values[key]
+            # The top level might already have the JSON loaded, so check for
+            # a string, rather than it being non-null.
+            # https://github.com/piccolo-orm/piccolo/issues/1399
+            if isinstance(value, (str, bytes, bytearray)):
+                values[key] = encoding.load_json(value)
+
+        return create(values)
+
+    return hydrate
+
+
 def make_nested_object(
     row: dict[str, Any],
     table_class: type[Table],
@@ -41,47 +131,22 @@ def make_nested_object(
         1
 
     """
-    table_params: dict[str, Any] = {}
+    hydrator = get_hydrator(table_class, get_row_shape(row), load_json)
+    return hydrator(row)
 
-    json_column_names = (
-        [column._meta.name for column in table_class._meta.json_columns]
-        if load_json
-        else []
-    )
 
-    for key, value in row.items():
-        if isinstance(value, dict):
-            # This is probably a related table.
-            fk_column = table_class._meta.get_column_by_name(
-                key,
-                match_db_column_name=True,
-            )
+def make_nested_objects(
+    rows: list[dict[str, Any]],
+    table_class: type[Table],
+    load_json: bool = False,
+) -> list[Table]:
+    """
+    The same as :func:`make_nested_object`, but for a list of rows, which
+    all have the same shape (e.g. from the same query). The hydrator is only
+    looked up once, using the first row.
+    """
+    if not rows:
+        return []
 
-            if isinstance(fk_column, ForeignKey):
-                related_table_class = (
-                    fk_column._foreign_key_meta.resolved_references
-                )
-                table_params[key] = make_nested_object(
-                    value,
-                    related_table_class,
-                    load_json=load_json,
-                )
-            else:
-                # The value doesn't belong to a foreign key, so just append it.
-                table_params[key] = value
-        elif (
-            load_json
-            and key in json_column_names
-            # The top level might already have the JSON loaded, so check for
-            # a string, rather than it being non-null.
-            # https://github.com/piccolo-orm/piccolo/issues/1399
-            # Ideally we want a cleaner solution than this.
-            and isinstance(value, (str, bytes, bytearray))
-        ):
-            table_params[key] = encoding.load_json(value)
-        else:
-            table_params[key] = value
-
-    table_instance = table_class(**table_params)
-    table_instance._exists_in_db = True
-    return table_instance
+    hydrator = get_hydrator(table_class, get_row_shape(rows[0]), load_json)
+    return [hydrator(row) for row in rows]
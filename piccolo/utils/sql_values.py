@@ -18,9 +18,13 @@ def convert_to_sql_value(value: Any, column: Column) -> Any:
     columns.
     """
     from piccolo.columns.column_types import JSON, JSONB, ForeignKey
+    from piccolo.querystring import Param
     from piccolo.table import Table
 
-    if isinstance(value, Table):
+    if isinstance(value, Param):
+        # The value is only provided when the frozen query is run.
+        return value
+    elif isinstance(value, Table):
         if isinstance(column, ForeignKey):
             return getattr(
                 value,
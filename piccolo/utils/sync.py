@@ -1,29 +1,159 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import os
+import threading
 from collections.abc import Coroutine
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from piccolo.engine.base import Engine
 
 ReturnType = TypeVar("ReturnType")
 
 
+class BackgroundLoop:
+    """
+    An event loop which runs forever in a daemon thread, so coroutines can be
+    run synchronously without creating a new event loop each time. Because
+    the loop outlives each coroutine, connection pools can be shared between
+    them.
+    """
+
+    __slots__ = ("_loop", "_thread", "_pid", "_lock")
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop, starting it if it isn't already running.
+        """
+        if self._is_alive():
+            return cast(asyncio.AbstractEventLoop, self._loop)
+
+        with self._lock:
+            if not self._is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="piccolo-run-sync",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+        return cast(asyncio.AbstractEventLoop, self._loop)
+
+    def _is_alive(self) -> bool:
+        # After a fork, the thread no longer exists in the child process.
+        return (
+            self._thread is not None
+            and self._pid == os.getpid()
+            and self._thread.is_alive()
+        )
+
+    def is_background_loop(
+        self, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> bool:
+        """
+        Returns ``True`` if ``loop`` is the background event loop.
+        """
+        return loop is not None and loop is self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, ReturnType]) -> ReturnType:
+        loop = self.get_loop()
+
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop]
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        # ``SystemExit`` and ``KeyboardInterrupt`` would stop the event loop,
+        # so they're passed back to the caller instead.
+        wrapped = capture_exit(coroutine)
+
+        if running_loop is None:
+            future = asyncio.run_coroutine_threadsafe(wrapped, loop)
+        elif running_loop is loop:
+            # We're inside a coroutine on the background loop, which would
+            # deadlock if we blocked it waiting for the result.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return unwrap(executor.submit(asyncio.run, wrapped).result())
+        else:
+            # Another event loop is running in this thread (e.g. iPython with
+            # %autoawait enabled). Any transactions belonging to it can't be
+            # used from the background loop, so start with an empty context.
+            future = contextvars.Context().run(
+                asyncio.run_coroutine_threadsafe, wrapped, loop
+            )
+
+        try:
+            return unwrap(future.result())
+        except BaseException:
+            # e.g. KeyboardInterrupt - don't leave the coroutine running.
+            future.cancel()
+            raise
+
+
+async def capture_exit(
+    coroutine: Coroutine[Any, Any, ReturnType],
+) -> tuple[Optional[ReturnType], Optional[BaseException]]:
+    try:
+        return await coroutine, None
+    except (SystemExit, KeyboardInterrupt) as exception:
+        return None, exception
+
+
+def unwrap(
+    result: tuple[Optional[ReturnType], Optional[BaseException]],
+) -> ReturnType:
+    response, exception = result
+    if exception is not None:
+        raise exception
+    return cast(ReturnType, response)
+
+
+BACKGROUND_LOOP = BackgroundLoop()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop which ``run_sync`` runs coroutines on.
+    """
+    return BACKGROUND_LOOP.get_loop()
+
+
 def run_sync(
     coroutine: Coroutine[Any, Any, ReturnType],
 ) -> ReturnType:
     """
     Run the coroutine synchronously - trying to accommodate as many edge cases
     as possible.
+
+    The coroutine is run on a long lived event loop in a background thread,
+    rather than creating a new event loop each time. It also works:
+
      1. When called within a coroutine.
      2. When called from ``python -m asyncio``, or iPython with %autoawait
         enabled, which means an event loop may already be running in the
         current thread.
+
     """
-    try:
-        # We try this first, as in most situations this will work.
-        return asyncio.run(coroutine)
-    except RuntimeError:
-        # An event loop already exists.
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future: Future = executor.submit(asyncio.run, coroutine)
-            return future.result()
+    return BACKGROUND_LOOP.run(coroutine)
+
+
+def can_use_pool_sync(engine: Optional[Engine]) -> bool:
+    """
+    Returns ``True`` if the engine's connection pool was started using
+    ``run_sync``, so can be used by other ``run_sync`` calls.
+    """
+    return BACKGROUND_LOOP.is_background_loop(
+        getattr(engine, "pool_loop", None)
+    )
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from piccolo.apps.slow_queries.commands.show import show
+from piccolo.engine.instrumentation import SlowQueryHook
+
+ENTRIES = [
+    {
+        "sql": "SELECT * FROM band",
+        "args": [],
+        "duration": 0.6,
+        "start_time": 1700000000.0,
+        "engine_type": "postgres",
+        "node": None,
+        "in_transaction": False,
+        "row_count": 10,
+        "plan": "Seq Scan on band",
+    },
+    {
+        "sql": "SELECT * FROM manager WHERE name = $1",
+        "args": ["Guido"],
+        "duration": 1.2,
+        "start_time": 1700000001.0,
+        "engine_type": "postgres",
+        "node": "read_1",
+        "in_transaction": False,
+        "row_count": 1,
+        "plan": None,
+    },
+]
+
+
+class TestShow(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.gettempdir(), "slow_queries.json")
+        with open(self.path, "w") as f:
+            json.dump(ENTRIES, f)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    @patch("piccolo.apps.slow_queries.commands.show.print")
+    def test_show(self, print_: MagicMock):
+        """
+        Make sure the slowest queries are shown first.
+        """
+        show(path=self.path)
+
+        output = "\n".join(str(i.args[0]) for i in print_.call_args_list)
+        self.assertLess(
+            output.index("FROM manager"), output.index("FROM band")
+        )
+        self.assertIn("Seq Scan on band", output)
+        self.assertIn("(node: read_1)", output)
+        self.assertIn("['Guido']", output)
+
+    @patch("piccolo.apps.slow_queries.commands.show.print")
+    def test_limit(self, print_: MagicMock):
+        show(path=self.path, limit=1, as_json=True)
+
+        entries = json.loads(print_.call_args.args[0])
+        self.assertEqual([i["duration"] for i in entries], [1.2])
+
+    @patch("piccolo.apps.slow_queries.commands.show.print")
+    def test_engine_path(self, print_: MagicMock):
+        """
+        If no path is given, use the one from the engine's ``SlowQueryHook``.
+        """
+        engine = MagicMock()
+        engine.hooks = [SlowQueryHook(path=self.path)]
+
+        with patch(
+            "piccolo.apps.slow_queries.commands.show.engine_finder",
+            return_value=engine,
+        ):
+            show(as_json=True)
+
+        self.assertEqual(len(json.loads(print_.call_args.args[0])), 2)
+
+    def test_no_path(self):
+        engine = MagicMock()
+        engine.hooks = []
+
+        with patch(
+            "piccolo.apps.slow_queries.commands.show.engine_finder",
+            return_value=engine,
+        ):
+            with self.assertRaises(SystemExit):
+                show()
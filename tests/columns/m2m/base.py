@@ -418,6 +418,29 @@ class M2MBase:
         genres = band.get_m2m(Band.genres).run_sync()
         self.assertEqual(genres, [])
 
+    def test_prefetch_m2m(self):
+        """
+        Make sure the related rows for all of the bands can be loaded using a
+        single extra query.
+        """
+        bands = (
+            Band.objects().prefetch_m2m(Band.genres).order_by(Band.id)
+        ).run_sync()
+
+        self.assertEqual(
+            [[genre.name for genre in band.genres] for band in bands],
+            [["Rock", "Folk"], ["Folk"], ["Rock", "Classical"]],
+        )
+        self.assertTrue(all(isinstance(i, Genre) for i in bands[0].genres))
+
+        # Each genre should only be represented by a single instance.
+        self.assertIs(bands[0].genres[1], bands[1].genres[0])
+
+    def test_prefetch_m2m_no_rows(self):
+        GenreToBand.delete(force=True).run_sync()
+        bands = Band.objects().prefetch_m2m(Band.genres).run_sync()
+        self.assertEqual([band.genres for band in bands], [[], [], []])
+
     def test_remove_m2m(self):
         """
         Make sure we can remove related items via the joining table.
@@ -5,7 +5,7 @@ import uuid
 from unittest import TestCase
 
 from piccolo.utils.encoding import JSONDict
-from tests.base import engines_skip
+from tests.base import engines_only, engines_skip
 
 try:
     from asyncpg.pgproto.pgproto import UUID as asyncpgUUID
@@ -420,3 +420,55 @@ class TestM2MComplexSchema(TestCase):
                     returned_value,
                     msg=f"{column_name} doesn't match",
                 )
+
+    @engines_skip("cockroach")
+    def test_select_all_without_bytea(self):
+        """
+        On SQLite, the M2M values are fetched using ``json_group_array``
+        unless a ``Bytea`` column is selected - make sure every other column
+        type survives the round trip through JSON.
+        """
+        columns = [
+            i for i in MegaTable._meta.columns if not isinstance(i, Bytea)
+        ]
+        response = SmallTable.select(
+            SmallTable.varchar_col,
+            SmallTable.mega_rows(*columns, load_json=True),
+        ).run_sync()
+
+        mega_row = response[0]["mega_rows"][0]
+
+        for column in columns:
+            column_name = column._meta.name
+            original_value = getattr(self.mega_table, column_name)
+            returned_value = mega_row[column_name]
+
+            if isinstance(column, UUID):
+                self.assertEqual(str(original_value), str(returned_value))
+            else:
+                if not isinstance(column, (JSON, JSONB)):
+                    self.assertEqual(
+                        type(original_value),
+                        type(returned_value),
+                        msg=f"{column_name} type isn't correct",
+                    )
+                self.assertAlmostEqual(
+                    original_value,
+                    returned_value,
+                    msg=f"{column_name} doesn't match",
+                )
+
+    @engines_only("sqlite")
+    def test_sqlite_json(self):
+        """
+        Make sure SQLite uses ``json_group_array``, and falls back to
+        ``group_concat`` when a ``Bytea`` column is selected.
+        """
+        query = SmallTable.select(
+            SmallTable.mega_rows(MegaTable.varchar_col, MegaTable.json_col)
+        )
+        self.assertIn("json_group_array", query.__str__())
+
+        query = SmallTable.select(SmallTable.mega_rows())
+        self.assertNotIn("json_group_array", query.__str__())
+        self.assertIn("group_concat", query.__str__())
@@ -0,0 +1,179 @@
+from unittest import TestCase
+
+from piccolo.columns import ForeignKey, Integer, Varchar
+from piccolo.engine.base import IdentityMap
+from piccolo.table import Table
+from piccolo.testing.test_case import AsyncTableTest
+from tests.example_apps.music.tables import Band, Manager
+
+
+class Label(Table):
+    name = Varchar()
+    code = Integer(unique=True)
+
+
+class Artist(Table):
+    name = Varchar()
+    label = ForeignKey(Label, target_column=Label.code)
+
+
+class TestIdentityMap(TestCase):
+    def test_add(self):
+        identity_map = IdentityMap()
+
+        band = Band(id=1, name="Pythonistas", _exists_in_db=True)
+        self.assertIs(identity_map.add(band), band)
+        self.assertIs(identity_map.get(Band, 1), band)
+
+        # The existing instance should be returned.
+        duplicate = Band(id=1, name="Pythonistas", _exists_in_db=True)
+        self.assertIs(identity_map.add(duplicate), band)
+
+        identity_map.replace(duplicate)
+        self.assertIs(identity_map.get(Band, 1), duplicate)
+
+        identity_map.invalidate(Band)
+        self.assertIsNone(identity_map.get(Band, 1))
+
+    def test_unsaved(self):
+        """
+        Rows without a primary key value shouldn't be tracked.
+        """
+        identity_map = IdentityMap()
+        identity_map.add(Band(name="Pythonistas"))
+        self.assertEqual(len(identity_map), 0)
+
+    def test_related(self):
+        """
+        Prefetched related rows should be tracked too.
+        """
+        identity_map = IdentityMap()
+
+        manager = Manager(id=1, name="Guido", _exists_in_db=True)
+        identity_map.add(manager)
+
+        band = Band(
+            id=1,
+            name="Pythonistas",
+            manager=Manager(id=1, name="Guido", _exists_in_db=True),
+            _exists_in_db=True,
+        )
+        identity_map.add(band)
+        self.assertIs(band.manager, manager)
+
+
+class TestIdentityMapQueries(AsyncTableTest):
+    tables = [Manager, Band]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.manager = Manager(name="Guido")
+        await self.manager.save()
+        for name in ("Pythonistas", "Rustaceans"):
+            await Band(name=name, manager=self.manager).save()
+
+    async def test_objects(self):
+        async with Band._meta.db.identity_map():
+            band_1 = await Band.objects().get(Band.name == "Pythonistas")
+            band_2 = await Band.objects().get(Band.name == "Pythonistas")
+            self.assertIs(band_1, band_2)
+
+        # Outside of the context manager, new instances are returned.
+        band_3 = await Band.objects().get(Band.name == "Pythonistas")
+        self.assertIsNot(band_1, band_3)
+
+    async def test_get(self):
+        """
+        Looking up a row by primary key shouldn't query the database, if it's
+        already been loaded.
+        """
+        async with Band._meta.db.identity_map():
+            band = await Band.objects().get(Band.name == "Pythonistas")
+            assert band is not None
+
+            await Band.raw(
+                "UPDATE band SET name = 'Changed' WHERE id = {}", band.id
+            )
+            cached_band = await Band.objects().get(Band.id == band.id)
+            self.assertIs(cached_band, band)
+            self.assertEqual(band.name, "Pythonistas")
+
+    async def test_get_related(self):
+        async with Band._meta.db.identity_map() as identity_map:
+            bands = await Band.objects()
+            managers = [await band.get_related(Band.manager) for band in bands]
+            self.assertIs(managers[0], managers[1])
+            self.assertEqual(managers[0].name, "Guido")
+
+            # Both bands share a manager, so it's only tracked once.
+            self.assertEqual(len(identity_map), 3)
+
+    async def test_prefetch_reverse(self):
+        """
+        The bands returned by the identity map already have their manager
+        assigned, so make sure they're still matched up correctly.
+        """
+        async with Band._meta.db.identity_map():
+            await Band.objects(Band.manager)
+            managers = await Manager.objects().prefetch_reverse(
+                Band.manager, attribute_name="bands"
+            )
+            self.assertEqual(
+                sorted(band.name for band in managers[0].bands),
+                ["Pythonistas", "Rustaceans"],
+            )
+
+    async def test_update(self):
+        """
+        Update and delete queries should remove the table's rows from the
+        identity map.
+        """
+        async with Band._meta.db.identity_map() as identity_map:
+            await Band.objects()
+            self.assertEqual(len(identity_map), 2)
+
+            await Band.update({Band.popularity: 100}, force=True)
+            self.assertEqual(len(identity_map), 0)
+
+            await Band.objects()
+            await Band.delete().where(Band.name == "Rustaceans")
+            self.assertEqual(len(identity_map), 0)
+
+    async def test_save(self):
+        """
+        A saved row should replace any existing instance.
+        """
+        async with Band._meta.db.identity_map():
+            band = await Band.objects().get(Band.name == "Pythonistas")
+            assert band is not None
+
+        async with Band._meta.db.identity_map():
+            await Band.objects()
+            band.popularity = 100
+            await band.save()
+            cached_band = await Band.objects().get(Band.id == band.id)
+            self.assertIs(cached_band, band)
+
+
+class TestIdentityMapTargetColumn(AsyncTableTest):
+    tables = [Label, Artist]
+
+    async def test_get_related(self):
+        """
+        The identity map is keyed by primary key, so it can't be used if the
+        foreign key references a different column.
+        """
+        # Each label's code matches the other label's primary key.
+        await Label.insert(
+            Label(id=1, name="Label 1", code=2),
+            Label(id=2, name="Label 2", code=1),
+        )
+        await Artist.insert(Artist(name="Pythonistas", label=2))
+
+        async with Label._meta.db.identity_map():
+            await Label.objects()
+            artist = await Artist.objects().first()
+            assert artist is not None
+            label = await artist.get_related(Artist.label)
+            assert label is not None
+            self.assertEqual(label.name, "Label 1")
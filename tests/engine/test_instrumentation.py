@@ -0,0 +1,430 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from piccolo.engine.instrumentation import (
+    LoggingHook,
+    QueryEvent,
+    QueryHook,
+    SlowQuery,
+    SlowQueryHook,
+    SpanHook,
+    can_analyze,
+)
+from piccolo.utils.sync import run_sync
+from tests.base import TableTest, engines_only
+from tests.example_apps.music.tables import Manager
+
+
+class RecordingHook(QueryHook):
+    def __init__(self):
+        self.calls: list[tuple[str, QueryEvent]] = []
+
+    def before_query(self, event: QueryEvent) -> None:
+        self.calls.append(("before_query", event))
+
+    def after_query(self, event: QueryEvent) -> None:
+        self.calls.append(("after_query", event))
+
+    def on_error(self, event: QueryEvent, exception: BaseException) -> None:
+        self.calls.append(("on_error", event))
+
+
+class BrokenHook(QueryHook):
+    def before_query(self, event: QueryEvent) -> None:
+        raise ValueError("Broken")
+
+    def after_query(self, event: QueryEvent) -> None:
+        raise ValueError("Broken")
+
+    def on_error(self, event: QueryEvent, exception: BaseException) -> None:
+        raise ValueError("Broken")
+
+
+class HookTestCase(TableTest):
+    tables = [Manager]
+
+    def add_hook(self, hook: QueryHook):
+        engine = Manager._meta.db
+        engine.add_hook(hook)
+        self.addCleanup(engine.remove_hook, hook)
+
+
+class TestHooks(HookTestCase):
+    def test_hooks(self):
+        Manager.insert(Manager(name="Guido"), Manager(name="Maz")).run_sync()
+
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        Manager.select().where(Manager.name == "Guido").run_sync()
+
+        self.assertEqual(
+            [name for name, _ in hook.calls], ["before_query", "after_query"]
+        )
+        event = hook.calls[0][1]
+        self.assertIs(hook.calls[1][1], event)
+        self.assertIs(event.engine, Manager._meta.db)
+        self.assertTrue(event.sql.startswith("SELECT"))
+        self.assertEqual(event.operation, "SELECT")
+        self.assertEqual(event.args_count, 1)
+        self.assertEqual(event.row_count, 1)
+        self.assertFalse(event.in_transaction)
+        self.assertIsNone(event.node)
+        assert event.duration is not None
+        self.assertGreater(event.duration, 0)
+
+    def test_error(self):
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        with self.assertRaises(Exception):
+            Manager.raw("MALFORMED QUERY").run_sync()
+
+        self.assertEqual(
+            [name for name, _ in hook.calls], ["before_query", "on_error"]
+        )
+        self.assertIsNone(hook.calls[1][1].row_count)
+
+    def test_cancelled(self):
+        """
+        ``on_error`` should be called if the query is cancelled.
+        """
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        with self.assertRaises(asyncio.CancelledError):
+            with Manager._meta.db.instrument("SELECT 1"):
+                raise asyncio.CancelledError()
+
+        self.assertEqual(
+            [name for name, _ in hook.calls], ["before_query", "on_error"]
+        )
+
+    def test_broken_hook(self):
+        """
+        If a hook raises an exception, it should be logged, and not cause
+        the query to fail.
+        """
+        hook = RecordingHook()
+        self.add_hook(BrokenHook())
+        self.add_hook(hook)
+
+        with self.assertLogs("piccolo.engine.base", level="ERROR") as logs:
+            Manager.insert(Manager(name="Guido")).run_sync()
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(Manager.count().run_sync(), 1)
+        self.assertEqual(
+            [name for name, _ in hook.calls][:2],
+            ["before_query", "after_query"],
+        )
+
+        with self.assertRaises(Exception):
+            Manager.raw("MALFORMED QUERY").run_sync()
+        self.assertEqual(hook.calls[-1][0], "on_error")
+
+    def test_batch(self):
+        """
+        Opening the cursor for a batch query should be instrumented.
+        """
+        Manager.insert(Manager(name="Guido"), Manager(name="Maz")).run_sync()
+
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        async def run():
+            async with await Manager.select().batch(batch_size=1) as batch:
+                async for _ in batch:
+                    pass
+
+        run_sync(run())
+
+        self.assertEqual(
+            [name for name, _ in hook.calls], ["before_query", "after_query"]
+        )
+        self.assertTrue(hook.calls[0][1].sql.startswith("SELECT"))
+
+    @engines_only("postgres")
+    def test_copy(self):
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        Manager.insert(Manager(name="Guido")).use_copy().run_sync()
+
+        self.assertIn(
+            ("COPY", 0),
+            [(event.operation, event.row_count) for _, event in hook.calls],
+        )
+
+    def test_transaction(self):
+        hook = RecordingHook()
+        self.add_hook(hook)
+
+        async def run():
+            async with Manager._meta.db.transaction():
+                await Manager.select()
+
+        run_sync(run())
+
+        self.assertTrue(hook.calls[-1][1].in_transaction)
+
+    def test_remove_hook(self):
+        hook = RecordingHook()
+        engine = Manager._meta.db
+        engine.add_hook(hook)
+        engine.remove_hook(hook)
+
+        Manager.select().run_sync()
+        self.assertEqual(hook.calls, [])
+
+
+class TestLoggingHook(HookTestCase):
+    def test_logging(self):
+        self.add_hook(LoggingHook())
+
+        with self.assertLogs("piccolo.queries", level=logging.DEBUG) as logs:
+            Manager.select().run_sync()
+
+        self.assertEqual(len(logs.records), 1)
+        message = logs.records[0].getMessage()
+        self.assertIn("returned 0 rows", message)
+        self.assertIn("SELECT", message)
+
+    def test_error(self):
+        self.add_hook(LoggingHook())
+
+        with self.assertLogs("piccolo.queries", level=logging.DEBUG) as logs:
+            with self.assertRaises(Exception):
+                Manager.raw("MALFORMED QUERY").run_sync()
+
+        self.assertEqual(logs.records[0].levelno, logging.ERROR)
+
+
+class TestSpanHook(HookTestCase):
+    def test_spans(self):
+        exporter = MagicMock()
+        hook = SpanHook(exporter=exporter)
+        self.add_hook(hook)
+
+        Manager.select().run_sync()
+
+        with self.assertRaises(Exception):
+            Manager.raw("MALFORMED QUERY").run_sync()
+
+        self.assertEqual(len(hook.spans), 2)
+        self.assertEqual(exporter.call_count, 2)
+
+        span, error_span = hook.spans
+        self.assertEqual(span["name"], "SELECT")
+        self.assertEqual(span["kind"], "SPAN_KIND_CLIENT")
+        self.assertEqual(span["status"], {"code": "STATUS_CODE_OK"})
+        self.assertEqual(span["attributes"]["db.response.returned_rows"], 0)
+        self.assertIn(
+            span["attributes"]["db.system"],
+            ("postgresql", "cockroachdb", "sqlite"),
+        )
+        self.assertGreaterEqual(
+            span["end_time_unix_nano"], span["start_time_unix_nano"]
+        )
+        self.assertEqual(error_span["status"]["code"], "STATUS_CODE_ERROR")
+
+    def test_max_spans(self):
+        hook = SpanHook(max_spans=1)
+        self.add_hook(hook)
+
+        Manager.select().run_sync()
+        Manager.count().run_sync()
+
+        self.assertEqual(len(hook.spans), 1)
+
+    def test_tracer(self):
+        """
+        Make sure OpenTelemetry spans are created if a tracer is passed in.
+        """
+        try:
+            import opentelemetry.trace  # noqa: F401
+        except ImportError:
+            self.skipTest("opentelemetry isn't installed")
+
+        tracer = MagicMock()
+        self.add_hook(SpanHook(tracer=tracer))
+
+        Manager.select().run_sync()
+
+        tracer.start_span.assert_called_once()
+        tracer.start_span.return_value.end.assert_called_once()
+
+
+class TestSlowQueryHook(HookTestCase):
+    def test_threshold(self):
+        hook = SlowQueryHook(threshold=60)
+        self.add_hook(hook)
+
+        Manager.select().run_sync()
+        self.assertEqual(len(hook.entries), 0)
+
+        hook.threshold = 0
+        Manager.select().where(Manager.name == "Guido").run_sync()
+
+        self.assertEqual(len(hook.entries), 1)
+        entry = hook.entries[0]
+        self.assertTrue(entry.sql.startswith("SELECT"))
+        self.assertEqual(entry.args, ["Guido"])
+        self.assertEqual(entry.row_count, 0)
+        self.assertIsNone(entry.plan)
+
+    def test_max_entries(self):
+        hook = SlowQueryHook(threshold=0, max_entries=2)
+        self.add_hook(hook)
+
+        for _ in range(3):
+            Manager.select().run_sync()
+
+        self.assertEqual(len(hook.entries), 2)
+
+    def test_explain(self):
+        """
+        Make sure the query plan is captured.
+        """
+        hook = SlowQueryHook(threshold=0, explain_sample_rate=1.0)
+        self.add_hook(hook)
+
+        async def run():
+            await Manager.select().where(Manager.name == "Guido")
+            await hook.wait()
+
+        run_sync(run())
+
+        plan = hook.entries[0].plan
+        assert plan is not None
+        self.assertNotIn("Unable to capture the plan", plan)
+        self.assertIn("manager", plan.lower())
+
+    def test_explain_error(self):
+        """
+        If the plan can't be captured, the error is recorded instead.
+        """
+        engine = Manager._meta.db
+        hook = SlowQueryHook(threshold=0, explain_sample_rate=1.0)
+        entry = SlowQuery(
+            sql="SELECT * FROM missing_table",
+            args=[],
+            duration=1.0,
+            start_time=0.0,
+            engine_type=engine.engine_type,
+        )
+        run_sync(hook.explain(entry, engine=engine))
+
+        assert entry.plan is not None
+        self.assertTrue(entry.plan.startswith("Unable to capture the plan"))
+
+    @engines_only("postgres")
+    def test_explain_rollback(self):
+        """
+        ``EXPLAIN ANALYZE`` runs the query, so make sure any side effects are
+        rolled back.
+        """
+        Manager.raw(
+            "CREATE FUNCTION add_manager() RETURNS integer AS $$ "
+            "INSERT INTO manager (name) VALUES ('Guido') RETURNING id "
+            "$$ LANGUAGE sql VOLATILE"
+        ).run_sync()
+        self.addCleanup(Manager.raw("DROP FUNCTION add_manager()").run_sync)
+
+        engine = Manager._meta.db
+        hook = SlowQueryHook(threshold=0, explain_sample_rate=1.0)
+        entry = SlowQuery(
+            sql="SELECT add_manager()",
+            args=[],
+            duration=1.0,
+            start_time=0.0,
+            engine_type=engine.engine_type,
+        )
+        run_sync(hook.explain(entry, engine=engine))
+
+        assert entry.plan is not None
+        self.assertIn("actual time", entry.plan)
+        self.assertEqual(Manager.count().run_sync(), 0)
+
+    def test_can_analyze(self):
+        self.assertTrue(can_analyze("postgres", "SELECT * FROM manager"))
+        self.assertFalse(can_analyze("sqlite", "SELECT * FROM manager"))
+        self.assertFalse(can_analyze("postgres", "DELETE FROM manager"))
+
+        # Locking rows might wait for the original query's transaction.
+        for sql in (
+            "SELECT * FROM manager FOR UPDATE",
+            "select * from manager for no key update nowait",
+            "SELECT * FROM manager FOR SHARE SKIP LOCKED",
+            "SELECT * FROM manager\nFOR KEY SHARE",
+        ):
+            self.assertFalse(can_analyze("postgres", sql))
+
+    def test_path(self):
+        """
+        Make sure the entries are saved to a file, if a path is given.
+        """
+        path = os.path.join(tempfile.gettempdir(), "slow_queries.json")
+        self.addCleanup(os.remove, path)
+
+        hook = SlowQueryHook(threshold=0, path=path)
+        self.add_hook(hook)
+
+        Manager.select().run_sync()
+        # It's saved in the background.
+        run_sync(hook.wait())
+
+        with open(path) as f:
+            entries = json.load(f)
+
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0]["sql"].startswith("SELECT"))
+
+    def test_path_error(self):
+        """
+        If the entries can't be saved, the error should be logged, rather than
+        causing the query to fail.
+        """
+        hook = SlowQueryHook(threshold=0, path="/nonexistent/dir/x.json")
+        self.add_hook(hook)
+
+        with self.assertLogs(
+            "piccolo.engine.instrumentation", level="ERROR"
+        ) as logs:
+            Manager.insert(Manager(name="Guido")).run_sync()
+            run_sync(hook.wait())
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(Manager.count().run_sync(), 1)
+
+    def test_explain_running(self):
+        """
+        Only one query plan should be captured at a time.
+        """
+        hook = SlowQueryHook(threshold=0, explain_sample_rate=1.0)
+        self.add_hook(hook)
+
+        async def run():
+            finished = asyncio.Event()
+
+            async def explain(*args, **kwargs):
+                await finished.wait()
+
+            with patch.object(hook, "explain", side_effect=explain) as mock:
+                await Manager.select()
+                await Manager.select()
+                finished.set()
+                await hook.wait()
+
+            mock.assert_called_once()
+
+        run_sync(run())
+        self.assertEqual(len(hook.entries), 2)
+
+    def test_sample_rate(self):
+        with self.assertRaises(ValueError):
+            SlowQueryHook(explain_sample_rate=2.0)
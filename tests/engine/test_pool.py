@@ -3,10 +3,13 @@ import os
 import tempfile
 from typing import cast
 from unittest import TestCase
-from unittest.mock import call, patch
+from unittest.mock import patch
 
+from piccolo.columns.column_types import Varchar
 from piccolo.engine.postgres import PostgresEngine
 from piccolo.engine.sqlite import SQLiteEngine
+from piccolo.table import Table
+from piccolo.utils.sync import run_sync
 from tests.base import DBTestCase, engine_is, engines_only, sqlite_only
 from tests.example_apps.music.tables import Manager
 
@@ -68,6 +71,46 @@ class TestPool(DBTestCase):
         """
         asyncio.run(self._make_many_queries())
 
+    def test_run_sync(self):
+        """
+        If the pool was started using ``run_sync``, then ``run_sync`` should
+        use it by default.
+        """
+        engine = cast(PostgresEngine, Manager._meta.db)
+        run_sync(engine.start_connection_pool())
+        self.addCleanup(run_sync, engine.close_connection_pool())
+
+        with patch.object(
+            PostgresEngine,
+            "_run_in_pool",
+            side_effect=PostgresEngine._run_in_pool,
+            autospec=True,
+        ) as run_in_pool:
+            Manager(name="Bob").save().run_sync()
+            Manager.select().run_sync()
+
+        self.assertEqual(run_in_pool.call_count, 2)
+
+    def test_run_sync_other_loop(self):
+        """
+        If the pool was started in another event loop, ``run_sync`` can't use
+        it.
+        """
+
+        async def run():
+            engine = cast(PostgresEngine, Manager._meta.db)
+            await engine.start_connection_pool()
+            try:
+                with patch.object(
+                    PostgresEngine, "_run_in_pool"
+                ) as run_in_pool:
+                    await asyncio.to_thread(Manager.select().run_sync)
+                self.assertFalse(run_in_pool.called)
+            finally:
+                await engine.close_connection_pool()
+
+        asyncio.run(run())
+
 
 @engines_only("postgres", "cockroach")
 class TestPoolProxyMethods(DBTestCase):
@@ -91,33 +134,69 @@ class TestPoolProxyMethods(DBTestCase):
 
 
 @sqlite_only
-class TestConnectionPoolWarning(TestCase):
-    async def _create_pool(self):
+class TestSQLitePool(TestCase):
+    def setUp(self):
         sqlite_file = os.path.join(tempfile.gettempdir(), "engine.sqlite")
-        engine = SQLiteEngine(path=sqlite_file)
+        self.engine = SQLiteEngine(path=sqlite_file)
 
-        with patch("piccolo.engine.base.colored_warning") as colored_warning:
-            await engine.start_connection_pool()
-            await engine.close_connection_pool()
-
-            self.assertEqual(
-                colored_warning.call_args_list,
-                [
-                    call(
-                        "Connection pooling is not supported for sqlite.",
-                        stacklevel=3,
-                    ),
-                    call(
-                        "Connection pooling is not supported for sqlite.",
-                        stacklevel=3,
-                    ),
-                ],
-            )
-
-    def test_warnings(self):
-        """
-        Make sure that when trying to start and close a connection pool with
-        SQLite, a warning is printed out, as connection pools aren't currently
-        supported.
+        class Musician(Table, db=self.engine):
+            name = Varchar()
+
+        self.table = Musician
+        self.table.create_table(if_not_exists=True).run_sync()
+
+    def tearDown(self):
+        self.table.alter().drop_table().run_sync()
+
+    async def _create_pool(self):
+        await self.engine.start_connection_pool(max_size=2)
+        assert self.engine.pool is not None
+
+        await self.engine.close_connection_pool()
+        assert self.engine.pool is None
+
+    def test_creation(self):
+        """
+        Make sure a connection pool can be created.
         """
         asyncio.run(self._create_pool())
+
+    async def _make_many_queries(self):
+        import aiosqlite
+
+        await self.engine.start_connection_pool(max_size=2)
+
+        try:
+            with patch.object(
+                aiosqlite, "connect", wraps=aiosqlite.connect
+            ) as connect:
+                await asyncio.gather(
+                    *[
+                        self.table.insert(self.table(name=f"name_{i}")).run()
+                        for i in range(20)
+                    ]
+                )
+
+                async def get_data():
+                    return await self.table.count().run()
+
+                responses = await asyncio.gather(
+                    *[get_data() for _ in range(50)]
+                )
+                self.assertEqual(set(responses), {20})
+
+                async with self.engine.transaction():
+                    await self.table.delete(force=True).run()
+
+                self.assertEqual(await self.table.count().run(), 0)
+
+                # The connections should all have come from the pool.
+                connect.assert_not_called()
+        finally:
+            await self.engine.close_connection_pool()
+
+    def test_many_queries(self):
+        """
+        Make sure reads and writes work concurrently using the pool.
+        """
+        asyncio.run(self._make_many_queries())
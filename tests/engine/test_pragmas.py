@@ -0,0 +1,113 @@
+import asyncio
+import os
+import tempfile
+from typing import cast
+from unittest import TestCase
+
+from piccolo.engine.sqlite import SQLiteEngine
+from tests.base import sqlite_only
+
+
+@sqlite_only
+class TestPragmas(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.gettempdir(), "pragmas.sqlite")
+
+    def tearDown(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.unlink(self.path + suffix)
+
+    async def _get_pragmas(self, engine: SQLiteEngine) -> dict:
+        connection = await engine.get_connection()
+        try:
+            output = {}
+            for name in engine.pragmas.keys():
+                cursor = await connection.execute(f"PRAGMA {name}")
+                row = await cursor.fetchone()
+                assert row is not None
+                # The engine's row factory returns dictionaries.
+                output[name] = list(cast(dict, row).values())[0]
+            return output
+        finally:
+            await connection.close()
+
+    def test_pragmas(self):
+        """
+        Make sure the PRAGMA values are set on each connection.
+        """
+        engine = SQLiteEngine(
+            path=self.path,
+            journal_mode="wal",
+            synchronous="normal",
+            busy_timeout=3000,
+            cache_size=-8000,
+            mmap_size=1000000,
+        )
+
+        self.assertDictEqual(
+            engine.pragmas,
+            {
+                "busy_timeout": 3000,
+                "journal_mode": "wal",
+                "synchronous": "normal",
+                "cache_size": -8000,
+                "mmap_size": 1000000,
+            },
+        )
+
+        pragmas = asyncio.run(self._get_pragmas(engine))
+        self.assertEqual(pragmas["journal_mode"], "wal")
+        # 'normal' is returned as 1
+        self.assertEqual(pragmas["synchronous"], 1)
+        self.assertEqual(pragmas["busy_timeout"], 3000)
+        self.assertEqual(pragmas["cache_size"], -8000)
+
+    def test_case_insensitive(self):
+        """
+        SQLite isn't case sensitive, so the values are normalised.
+        """
+        engine = SQLiteEngine(
+            path=self.path, journal_mode="WAL", synchronous="Normal"
+        )
+        self.assertDictEqual(
+            engine.pragmas, {"journal_mode": "wal", "synchronous": "normal"}
+        )
+
+    def test_extra_pragmas(self):
+        engine = SQLiteEngine(
+            path=self.path,
+            extra_pragmas={
+                "temp_store": "MEMORY",
+                "locking_mode": "exclusive",
+            },
+        )
+        self.assertDictEqual(
+            engine.pragmas,
+            {"temp_store": "memory", "locking_mode": "exclusive"},
+        )
+
+        pragmas = asyncio.run(self._get_pragmas(engine))
+        # 'memory' is returned as 2
+        self.assertEqual(pragmas["temp_store"], 2)
+        self.assertEqual(pragmas["locking_mode"], "exclusive")
+
+    def test_defaults(self):
+        engine = SQLiteEngine(path=self.path)
+        self.assertDictEqual(engine.pragmas, {})
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            SQLiteEngine(path=self.path, journal_mode="wal; DROP TABLE band")
+
+        with self.assertRaises(ValueError):
+            SQLiteEngine(path=self.path, synchronous="sometimes")
+
+        with self.assertRaises(ValueError):
+            SQLiteEngine(path=self.path, busy_timeout="1000")  # type: ignore
+
+        with self.assertRaises(ValueError):
+            SQLiteEngine(path=self.path, extra_pragmas={"bad name": 1})
+
+        with self.assertRaises(ValueError):
+            SQLiteEngine(path=self.path, extra_pragmas={"temp_store": "disk"})
@@ -0,0 +1,68 @@
+import asyncio
+from typing import cast
+from unittest import TestCase
+
+from piccolo.columns.column_types import Text, Varchar
+from piccolo.engine import engine_finder
+from piccolo.engine.postgres import PostgresEngine
+from piccolo.table import Table
+from tests.base import engines_only
+
+
+@engines_only("postgres", "cockroach")
+class TestPreparedStatementCache(TestCase):
+    def setUp(self):
+        test_engine = engine_finder()
+        assert test_engine is not None
+        test_engine = cast(PostgresEngine, test_engine)
+
+        self.engine = PostgresEngine(
+            config=test_engine.config, prepared_statement_cache_size=2
+        )
+
+        class Musician(Table, db=self.engine):
+            name = Varchar()
+
+        self.table = Musician
+        self.table.create_table().run_sync()
+
+    def tearDown(self):
+        self.table.alter().drop_table().run_sync()
+
+    def test_size(self):
+        self.assertEqual(self.engine.config["statement_cache_size"], 2)
+
+        test_engine = cast(PostgresEngine, engine_finder())
+        self.assertNotIn("statement_cache_size", test_engine.config)
+
+    async def _run_after_schema_change(self):
+        await self.engine.start_connection_pool(min_size=1, max_size=1)
+
+        try:
+            await self.table.insert(self.table(name="Bob")).run()
+            await self.table.select().run()
+
+            # Changing the column type means the cached prepared statement
+            # is no longer valid, so it should be discarded. Otherwise the
+            # query fails, as it can't be retried in a transaction.
+            await self.table.alter().set_column_type(
+                old_column=self.table.name, new_column=Text()
+            )
+            async with self.engine.transaction():
+                response = await self.table.select().run()
+            self.assertEqual(response, [{"id": 1, "name": "Bob"}])
+
+            # The same, but when the DDL runs in a transaction.
+            async with self.engine.transaction():
+                await self.table.alter().set_column_type(
+                    old_column=self.table.name, new_column=Varchar()
+                )
+            async with self.engine.transaction():
+                response = await self.table.select().run()
+            self.assertEqual(response, [{"id": 1, "name": "Bob"}])
+        finally:
+            await self.engine.close_connection_pool()
+
+    @engines_only("postgres")
+    def test_invalidation(self):
+        asyncio.run(self._run_after_schema_change())
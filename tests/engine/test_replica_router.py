@@ -0,0 +1,149 @@
+from typing import cast
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from piccolo.columns.column_types import Varchar
+from piccolo.engine import engine_finder
+from piccolo.engine.postgres import PostgresEngine, ReplicaRouter
+from piccolo.table import Table
+from piccolo.utils.sync import run_sync
+from tests.base import AsyncMock, engines_only
+
+
+class TestReplicaRouter(TestCase):
+    def test_round_robin(self):
+        router = ReplicaRouter()
+        nodes = ["read_1", "read_2", "read_3"]
+        chosen = [router.choose(nodes) for _ in range(6)]
+        self.assertEqual(sorted(chosen), sorted(nodes * 2))
+
+    def test_least_outstanding(self):
+        router = ReplicaRouter(strategy="least_outstanding")
+        nodes = ["read_1", "read_2"]
+
+        with router.track("read_1"):
+            self.assertEqual(router.choose(nodes), "read_2")
+            self.assertEqual(router.choose(nodes), "read_2")
+
+    def test_nodes(self):
+        router = ReplicaRouter(nodes=["read_2"])
+        self.assertEqual(router.choose(["read_1", "read_2"]), "read_2")
+
+    def test_ejection(self):
+        """
+        Make sure nodes are ejected after connection errors, and re-admitted
+        once ``ejection_time`` has passed.
+        """
+        router = ReplicaRouter(max_failures=2, ejection_time=10.0)
+        nodes = ["read_1", "read_2"]
+
+        for _ in range(2):
+            with self.assertRaises(ConnectionRefusedError):
+                with router.track("read_1"):
+                    raise ConnectionRefusedError()
+
+        self.assertEqual(router.ejected_nodes, ["read_1"])
+        self.assertEqual({router.choose(nodes) for _ in range(4)}, {"read_2"})
+
+        with patch("piccolo.engine.postgres.time") as time:
+            time.monotonic.return_value = float("inf")
+            self.assertEqual(router.ejected_nodes, [])
+            self.assertTrue(router.is_healthy("read_1"))
+
+    def test_query_errors(self):
+        """
+        Errors in the query itself shouldn't eject the node.
+        """
+        router = ReplicaRouter()
+
+        with self.assertRaises(ValueError):
+            with router.track("read_1"):
+                raise ValueError()
+
+        self.assertEqual(router.ejected_nodes, [])
+
+    def test_no_healthy_nodes(self):
+        router = ReplicaRouter()
+        router.record_failure("read_1")
+        self.assertIsNone(router.choose(["read_1"]))
+
+
+@engines_only("postgres", "cockroach")
+class TestReplicaRouting(TestCase):
+    def setUp(self):
+        test_engine = cast(PostgresEngine, engine_finder())
+
+        self.replica = MagicMock(
+            spec=PostgresEngine(config=test_engine.config)
+        )
+        self.replica.run_querystring = AsyncMock(return_value=[])
+
+        self.engine = PostgresEngine(
+            config=test_engine.config,
+            extra_nodes={"read_1": self.replica},
+            replica_router=ReplicaRouter(),
+        )
+        patcher = patch.object(
+            PostgresEngine, "_run_in_new_connection", return_value=[]
+        )
+        self.run_in_new_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        class Manager(Table, db=self.engine):
+            name = Varchar()
+
+        self.table = Manager
+
+    def test_reads(self):
+        """
+        Make sure read only queries are sent to the replica.
+        """
+        run_sync(self.table.select().run())
+        run_sync(self.table.raw("SELECT 1", read_only=True).run())
+        self.assertEqual(self.replica.run_querystring.call_count, 2)
+        self.assertFalse(self.run_in_new_connection.called)
+
+    def test_hooks(self):
+        """
+        Make sure hooks know which node the query was run on.
+        """
+        hook = MagicMock()
+        self.engine.add_hook(hook)
+
+        run_sync(self.table.select().run())
+
+        event = hook.after_query.call_args.args[0]
+        self.assertEqual(event.node, "read_1")
+        self.assertEqual(event.row_count, 0)
+
+    def test_writes(self):
+        """
+        Make sure queries which might write data run on the main node.
+        """
+        run_sync(self.table.raw("SELECT 1").run())
+        run_sync(self.table.select().lock_rows().run())
+        self.assertFalse(self.replica.run_querystring.called)
+        self.assertEqual(self.run_in_new_connection.call_count, 2)
+
+    def test_transaction(self):
+        """
+        Queries inside a transaction should run on the main node.
+        """
+        token = self.engine.current_transaction.set(MagicMock())
+        try:
+            self.assertIsNone(
+                self.engine._get_read_node(self.table.select().querystrings[0])
+            )
+        finally:
+            self.engine.current_transaction.reset(token)
+
+    def test_fallback(self):
+        """
+        If the replica can't be reached, the query should be retried on the
+        main node.
+        """
+        self.replica.run_querystring.side_effect = ConnectionRefusedError()
+        run_sync(self.table.select().run())
+        self.assertTrue(self.run_in_new_connection.called)
+        assert self.engine.replica_router is not None
+        self.assertEqual(self.engine.replica_router.ejected_nodes, ["read_1"])
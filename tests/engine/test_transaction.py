@@ -1,6 +1,7 @@
 import asyncio
 from typing import cast
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -44,6 +45,63 @@ class TestAtomic(TestCase):
 
         drop_db_tables_sync(Band, Manager)
 
+    def test_ddl_error(self):
+        """
+        Make sure the DDL statements are rolled back if one of them fails,
+        even though they're sent to the database together.
+        """
+        atomic = Band._meta.db.atomic()
+        atomic.add(
+            Manager.create_table(),
+            Band.create_table(),
+            Manager.create_table(),
+        )
+        with self.assertRaises(Exception):
+            atomic.run_sync()
+
+        self.assertFalse(Band.table_exists().run_sync())
+        self.assertFalse(Manager.table_exists().run_sync())
+
+    def test_responses(self):
+        """
+        Make sure a response is returned for each query.
+        """
+        atomic = Band._meta.db.atomic()
+        atomic.add(
+            Manager.create_table(),
+            Manager.insert(Manager(name="Guido")).returning(Manager.name),
+            Band.create_table(),
+        )
+        responses = atomic.run_sync()
+        self.assertEqual(responses, [[], [{"name": "Guido"}], []])
+
+        drop_db_tables_sync(Band, Manager)
+
+    def test_ddl_script(self):
+        """
+        Make sure consecutive DDL statements are sent to the database
+        together.
+        """
+        engine = Band._meta.db
+        with patch.object(
+            engine.__class__,
+            "run_ddl_script",
+            side_effect=engine.__class__.run_ddl_script,
+            autospec=True,
+        ) as run_ddl_script:
+            atomic = engine.atomic()
+            atomic.add(Manager.create_table(), Band.create_table())
+            atomic.run_sync()
+
+        self.assertEqual(run_ddl_script.call_count, 1)
+        self.assertEqual(
+            run_ddl_script.call_args.args[1],
+            [*Manager.create_table().ddl, *Band.create_table().ddl],
+        )
+        self.assertTrue(Band.table_exists().run_sync())
+
+        drop_db_tables_sync(Band, Manager)
+
     @engines_only("postgres", "cockroach")
     def test_pool(self) -> None:
         """
@@ -0,0 +1,197 @@
+from unittest import TestCase
+
+from piccolo.columns import Integer, Varchar
+from piccolo.query.explain import (
+    PlanNode,
+    QueryPlan,
+    parse_cockroach_plan,
+    parse_sqlite_node,
+)
+from piccolo.table import Table
+from piccolo.utils.sync import run_sync
+from tests.base import TableTest, engines_only, engines_skip
+
+
+class Venue(Table):
+    name = Varchar(index=True)
+    capacity = Integer()
+
+
+class TestExplain(TableTest):
+    tables = [Venue]
+
+    def setUp(self):
+        super().setUp()
+        Venue.insert(
+            Venue(name="Stadium", capacity=50000),
+            Venue(name="Club", capacity=200),
+        ).run_sync()
+
+    def test_primary_key(self):
+        plan = Venue.select().where(Venue.id == 1).explain().run_sync()
+
+        self.assertIsInstance(plan, QueryPlan)
+        self.assertTrue(plan.uses_index)
+        self.assertFalse(plan.analyzed)
+        self.assertIn("venue", [node.relation for node in plan.nodes])
+
+    def test_full_scan(self):
+        plan = Venue.select().where(Venue.capacity > 1000).explain().run_sync()
+        self.assertFalse(plan.uses_index)
+        self.assertEqual(plan.indexes, [])
+
+    @engines_only("postgres", "sqlite")
+    def test_index(self):
+        """
+        Make sure we can tell which index is used.
+        """
+
+        async def explain() -> QueryPlan:
+            async with Venue._meta.db.transaction():
+                if Venue._meta.db.engine_type == "postgres":
+                    # The table is so small that Postgres would otherwise
+                    # prefer a sequential scan.
+                    await Venue.raw("SET LOCAL enable_seqscan = off")
+                return (
+                    await Venue.select().where(Venue.name == "Club").explain()
+                )
+
+        plan = run_sync(explain())
+
+        self.assertTrue(plan.uses_index)
+        self.assertEqual(plan.indexes, ["venue_name"])
+
+    @engines_skip("sqlite")
+    def test_cost(self):
+        plan = Venue.select().where(Venue.id == 1).explain().run_sync()
+        self.assertIsNotNone(plan.estimated_rows)
+        self.assertIsNone(plan.actual_rows)
+
+        if Venue._meta.db.engine_type == "postgres":
+            self.assertIsNotNone(plan.total_cost)
+
+    @engines_skip("sqlite")
+    def test_analyze(self):
+        """
+        Make sure the actual row counts are returned, and any changes are
+        rolled back.
+        """
+        plan = (
+            Venue.delete()
+            .where(Venue.capacity > 1000)
+            .explain(analyze=True)
+            .run_sync()
+        )
+
+        self.assertTrue(plan.analyzed)
+        self.assertIsNotNone(plan.execution_time)
+        self.assertIn(1.0, [node.actual_rows for node in plan.nodes])
+        self.assertEqual(Venue.count().run_sync(), 2)
+
+    @engines_only("sqlite")
+    def test_analyze_sqlite(self):
+        with self.assertRaises(NotImplementedError):
+            Venue.select().explain(analyze=True)
+
+    def test_text(self):
+        plan = Venue.select().explain(format="text").run_sync()
+        self.assertIsInstance(plan, str)
+        self.assertIn("venue", plan.lower())
+
+    def test_format(self):
+        with self.assertRaises(ValueError):
+            Venue.select().explain(format="yaml")  # type: ignore
+
+    def test_query_types(self):
+        """
+        Make sure ``explain`` works with other query types.
+        """
+        for query in (
+            Venue.objects().where(Venue.name == "Club").first(),
+            Venue.count(),
+            Venue.exists().where(Venue.id == 1),
+            Venue.update({Venue.capacity: 300}).where(Venue.id == 2),
+        ):
+            plan = query.explain().run_sync()
+            self.assertGreater(len(plan.roots), 0)
+
+        self.assertEqual(
+            Venue.select(Venue.capacity)
+            .where(Venue.id == 2)
+            .first()
+            .run_sync(),
+            {"capacity": 200},
+        )
+
+
+class TestParse(TestCase):
+    def test_cockroach(self):
+        output = """distribution: local
+vectorized: true
+
+• filter
+│ estimated row count: 1
+│ filter: capacity > 1000
+│
+└── • index join
+    │ estimated row count: 2
+    │ table: venue@venue_pkey
+    │
+    └── • scan
+          estimated row count: 2 (100% of the table)
+          table: venue@venue_name
+          spans: [/'Club' - /'Club']"""
+
+        query_plan = QueryPlan(engine_type="cockroach", analyzed=False)
+        parse_cockroach_plan(lines=output.splitlines(), query_plan=query_plan)
+
+        self.assertEqual(len(query_plan.roots), 1)
+        root = query_plan.roots[0]
+        self.assertEqual(root.node_type, "filter")
+        self.assertEqual(root.estimated_rows, 1.0)
+        self.assertEqual(root.children[0].node_type, "index join")
+        self.assertEqual(
+            root.children[0].children[0],
+            PlanNode(
+                node_type="scan",
+                relation="venue",
+                index_name="venue_name",
+                estimated_rows=2.0,
+                detail={
+                    "estimated row count": "2 (100% of the table)",
+                    "table": "venue@venue_name",
+                    "spans": "[/'Club' - /'Club']",
+                },
+            ),
+        )
+        self.assertEqual(query_plan.indexes, ["venue_pkey", "venue_name"])
+
+    def test_cockroach_full_scan(self):
+        output = """planning time: 500µs
+execution time: 2ms
+
+• scan
+  actual row count: 2
+  estimated row count: 2
+  table: venue@venue_pkey
+  spans: FULL SCAN"""
+
+        query_plan = QueryPlan(engine_type="cockroach", analyzed=True)
+        parse_cockroach_plan(lines=output.splitlines(), query_plan=query_plan)
+
+        self.assertFalse(query_plan.uses_index)
+        self.assertEqual(query_plan.actual_rows, 2.0)
+        self.assertEqual(query_plan.planning_time, 0.5)
+        self.assertEqual(query_plan.execution_time, 2.0)
+
+    def test_sqlite(self):
+        node = parse_sqlite_node(
+            "SEARCH venue USING COVERING INDEX venue_name (name=?)"
+        )
+        self.assertEqual(node.node_type, "SEARCH")
+        self.assertEqual(node.relation, "venue")
+        self.assertEqual(node.index_name, "venue_name")
+
+        node = parse_sqlite_node("USE TEMP B-TREE FOR ORDER BY")
+        self.assertEqual(node.node_type, "USE TEMP B-TREE FOR ORDER BY")
+        self.assertFalse(node.uses_index)
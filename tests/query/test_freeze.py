@@ -5,6 +5,7 @@ from unittest import mock
 
 from piccolo.columns import Integer, Varchar
 from piccolo.query.base import FrozenQuery, Query
+from piccolo.querystring import Param
 from piccolo.table import Table
 from tests.base import AsyncMock, DBTestCase, sqlite_only
 from tests.example_apps.music.tables import Band
@@ -126,3 +127,76 @@ class TestFreeze(DBTestCase):
 
         with self.assertRaises(AttributeError):
             query.where(Band.name == "Pythonistas")
+
+
+class TestFreezeParams(DBTestCase):
+    """
+    Make sure frozen queries containing ``Param`` values can be run with
+    different values.
+    """
+
+    def test_where(self):
+        self.insert_rows()
+
+        query = (
+            Band.select(Band.name)
+            .where(Band.popularity > Param("popularity"))
+            .order_by(Band.name)
+            .freeze()
+        )
+
+        self.assertEqual(query.param_names, {"popularity"})
+        self.assertListEqual(
+            query.run_sync(popularity=1500), [{"name": "Rustaceans"}]
+        )
+        self.assertListEqual(
+            query.run_sync(popularity=500),
+            [{"name": "Pythonistas"}, {"name": "Rustaceans"}],
+        )
+
+    def test_limit_offset(self):
+        self.insert_rows()
+
+        query = (
+            Band.select(Band.name)
+            .order_by(Band.name)
+            .limit(Param("limit"))
+            .offset(Param("offset"))
+            .freeze()
+        )
+
+        self.assertListEqual(
+            query.run_sync(limit=1, offset=0), [{"name": "CSharps"}]
+        )
+        self.assertListEqual(
+            query.run_sync(limit=2, offset=1),
+            [{"name": "Pythonistas"}, {"name": "Rustaceans"}],
+        )
+
+    def test_update_values(self):
+        self.insert_rows()
+
+        query = (
+            Band.update({Band.popularity: Param("popularity")})
+            .where(Band.name == Param("name"))
+            .freeze()
+        )
+        query.run_sync(popularity=5, name="CSharps")
+
+        self.assertEqual(
+            Band.select(Band.popularity)
+            .where(Band.name == "CSharps")
+            .first()
+            .run_sync(),
+            {"popularity": 5},
+        )
+
+    def test_missing_param(self):
+        query = Band.select().where(Band.name == Param("name")).freeze()
+
+        with self.assertRaises(ValueError):
+            query.run_sync()
+
+    def test_str(self):
+        query = Band.select(Band.name).where(Band.name == Param("name"))
+        self.assertIn('"band"."name" = :name', query.__str__())
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from piccolo.querystring import QueryString
+from piccolo.querystring import QueryString, compile_fingerprint
 
 
 # TODO - add more extensive tests (increased nesting and argument count).
@@ -30,6 +30,57 @@ class TestQueryString(TestCase):
         self.assertEqual(qs.compile_string(), ("SELECT name FROM band", []))
 
 
+class TestCompiledTemplateCache(TestCase):
+    """
+    Make sure queries with the same structure, but different values, reuse
+    the compiled SQL.
+    """
+
+    def setUp(self):
+        compile_fingerprint.cache_clear()
+
+    def test_cache_hit(self):
+        for name in ("Pythonistas", "Rustaceans"):
+            qs = QueryString(
+                "SELECT id FROM band {}", QueryString("WHERE name = {}", name)
+            )
+            self.assertEqual(
+                qs.compile_string(),
+                ("SELECT id FROM band WHERE name = $1", [name]),
+            )
+
+        cache_info = compile_fingerprint.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_engine_type(self):
+        """
+        The same structure compiled for different engines shouldn't share a
+        cache entry.
+        """
+        qs = QueryString("SELECT {} + {}", 1, QueryString("{}", 2))
+
+        self.assertEqual(qs.compile_string(), ("SELECT $1 + $2", [1, 2]))
+        self.assertEqual(
+            qs.compile_string(engine_type="sqlite"), ("SELECT ? + ?", [1, 2])
+        )
+        self.assertEqual(compile_fingerprint.cache_info().misses, 2)
+
+    def test_different_structure(self):
+        """
+        A value and a nested ``QueryString`` in the same position must result
+        in different SQL.
+        """
+        self.assertEqual(
+            QueryString("SELECT {}", "id").compile_string(),
+            ("SELECT $1", ["id"]),
+        )
+        self.assertEqual(
+            QueryString("SELECT {}", QueryString("id")).compile_string(),
+            ("SELECT id", []),
+        )
+
+
 class TestQueryStringOperators(TestCase):
     """
     Make sure basic operations can be used on ``QueryString``.
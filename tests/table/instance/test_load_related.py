@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+from piccolo.query.methods.objects import Objects
+from piccolo.testing.test_case import AsyncTableTest
+from tests.example_apps.music.tables import Band, Concert, Manager, Venue
+
+
+class TestLoadRelated(AsyncTableTest):
+    tables = [Manager, Band, Concert, Venue]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        self.manager = Manager(name="Guido")
+        await self.manager.save()
+
+        self.manager_2 = Manager(name="Graydon")
+        await self.manager_2.save()
+
+        for name, manager in (
+            ("Pythonistas", self.manager),
+            ("Pythonistas 2", self.manager),
+            ("Rustaceans", self.manager_2),
+            ("C-Sharps", None),
+        ):
+            await Band(name=name, manager=manager).save()
+
+    async def test_load_related(self):
+        bands = await Band.objects().order_by(Band.id)
+
+        with patch.object(
+            Objects, "run", side_effect=Objects.run, autospec=True
+        ) as run:
+            managers = await Band.load_related(bands, Band.manager)
+
+        # Only a single query should be run.
+        self.assertEqual(run.call_count, 1)
+
+        self.assertEqual(
+            [i.name if i else None for i in managers],
+            ["Guido", "Guido", "Graydon", None],
+        )
+        self.assertIs(bands[0].manager, managers[0])
+        self.assertIs(managers[0], managers[1])
+        self.assertIsNone(bands[3].manager)
+
+        # Assigning the related rows shouldn't count as a change.
+        self.assertEqual(bands[0]._get_changed_columns(), [])
+
+    async def test_string(self):
+        bands = await Band.objects().order_by(Band.id)
+        managers = await Band.load_related(bands, "manager")
+        self.assertEqual(managers[2].name, "Graydon")
+
+    async def test_already_loaded(self):
+        """
+        Related rows which have already been loaded (e.g. using ``prefetch``)
+        shouldn't be fetched again.
+        """
+        bands = await Band.objects(Band.manager).order_by(Band.id)
+        manager = bands[0].manager
+
+        with patch.object(Objects, "run") as run:
+            managers = await Band.load_related(bands, Band.manager)
+
+        self.assertFalse(run.called)
+        self.assertIs(managers[0], manager)
+
+    async def test_identity_map(self):
+        async with Manager._meta.db.identity_map():
+            await Manager.objects()
+            bands = await Band.objects()
+
+            with patch.object(Objects, "run") as run:
+                await Band.load_related(bands, Band.manager)
+
+            self.assertFalse(run.called)
+
+    async def test_not_foreign_key(self):
+        with self.assertRaises(ValueError):
+            Band.load_related([], "name")
+
+        with self.assertRaises(ValueError):
+            await Concert.load_related([], Concert.band_1.manager)
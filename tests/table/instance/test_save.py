@@ -149,3 +149,90 @@ class TestSave(TestCase):
                 }
             ],
         )
+
+
+class TestSaveChangedColumns(TestCase):
+    def setUp(self):
+        create_db_tables_sync(Manager, Band)
+        Band(name="Pythonistas", popularity=1000).save().run_sync()
+
+    def tearDown(self):
+        drop_db_tables_sync(Manager, Band)
+
+    def get_band(self) -> Band:
+        band = Band.objects().first().run_sync()
+        assert band is not None
+        return band
+
+    def test_changed_columns(self):
+        """
+        Make sure only the columns which have changed are saved.
+        """
+        band = self.get_band()
+        band.popularity = 2000
+
+        query = band.save()
+        self.assertIn('"popularity"', query.__str__())
+        self.assertNotIn('"name"', query.__str__())
+        query.run_sync()
+
+        self.assertEqual(self.get_band().popularity, 2000)
+
+    def test_unchanged(self):
+        """
+        If nothing has changed, no query should be run.
+        """
+        band = self.get_band()
+        Band.update({Band.name: "Rustaceans"}, force=True).run_sync()
+
+        band.save().run_sync()
+        self.assertEqual(self.get_band().name, "Rustaceans")
+
+    def test_saved(self):
+        """
+        Once saved, the columns shouldn't be saved again, unless they change.
+        """
+        band = self.get_band()
+        band.name = "Pythonistas 2"
+        band.popularity = 2000
+        band.save(columns=[Band.name]).run_sync()
+
+        # Only the popularity is still waiting to be saved.
+        query = band.save()
+        self.assertNotIn('"name"', query.__str__())
+        query.run_sync()
+
+        self.assertEqual(self.get_band().popularity, 2000)
+        self.assertEqual(band._get_changed_columns(), [])
+
+    def test_new_row(self):
+        """
+        After a new row is inserted, changes should be tracked.
+        """
+        band = Band(name="Rustaceans", popularity=500)
+        band.save().run_sync()
+        self.assertEqual(band._get_changed_columns(), [])
+
+        band.popularity = 600
+        self.assertEqual(
+            [i._meta.name for i in band._get_changed_columns()],
+            ["popularity"],
+        )
+
+    def test_exists_in_db(self):
+        """
+        If the user creates an instance with ``_exists_in_db=True``, we don't
+        know what's in the database, so all of the columns should be saved.
+        """
+        band = self.get_band()
+        Band(
+            id=band.id,
+            name="Rustaceans",
+            manager=None,
+            popularity=2000,
+            _exists_in_db=True,
+        ).save().run_sync()
+
+        band = self.get_band()
+        self.assertEqual(band.name, "Rustaceans")
+        self.assertEqual(band.popularity, 2000)
@@ -1,6 +1,7 @@
 import asyncio
 import math
 from unittest import TestCase
+from unittest.mock import patch
 
 from piccolo.columns import Varchar
 from piccolo.engine.finder import engine_finder
@@ -136,6 +137,103 @@ class TestBatchRaw(DBTestCase):
         self.assertEqual(iterations, _iterations)
 
 
+class TestStream(DBTestCase):
+    async def run_stream(self, query, prefetch):
+        return [i async for i in query.stream(prefetch=prefetch)]
+
+    def test_select(self):
+        row_count = 1000
+        self.insert_many_rows(row_count)
+
+        rows = asyncio.run(
+            self.run_stream(Manager.select(), prefetch=30), debug=True
+        )
+
+        self.assertEqual(len(rows), row_count)
+        self.assertIsInstance(rows[0], dict)
+        self.assertIn("name", rows[0].keys())
+
+    def test_objects(self):
+        row_count = 1000
+        self.insert_many_rows(row_count)
+
+        rows = asyncio.run(
+            self.run_stream(Manager.objects(), prefetch=30), debug=True
+        )
+
+        self.assertEqual(len(rows), row_count)
+        self.assertIsInstance(rows[0], Manager)
+
+    def test_where(self):
+        """
+        Make sure the query's arguments are passed in correctly.
+        """
+        self.insert_many_rows(100)
+
+        rows = asyncio.run(
+            self.run_stream(
+                Manager.select(Manager.name).where(Manager.name == "name_10"),
+                prefetch=10,
+            )
+        )
+        self.assertEqual(rows, [{"name": "name_10"}])
+
+        rows = asyncio.run(
+            self.run_stream(
+                Manager.select(Manager.name)
+                .where(Manager.name.is_in(["name_1", "name_2", "name_3"]))
+                .where(Manager.id > 1)
+                .order_by(Manager.name),
+                prefetch=10,
+            )
+        )
+        self.assertEqual(
+            rows, [{"name": "name_1"}, {"name": "name_2"}, {"name": "name_3"}]
+        )
+
+    def test_break(self):
+        """
+        Make sure we can stop iterating early, and the connection is closed
+        cleanly.
+        """
+        self.insert_many_rows(100)
+
+        async def run():
+            stream = Manager.select().stream(prefetch=10)
+            async for row in stream:
+                break
+            await stream.aclose()
+            return row
+
+        row = asyncio.run(run(), debug=True)
+        self.assertIn("name", row.keys())
+
+    def test_error(self):
+        """
+        If the query fails when opening the cursor, make sure the batch is
+        still closed.
+        """
+
+        class MissingTable(Table, db=Manager._meta.db):
+            name = Varchar()
+
+        async def run():
+            batch = await MissingTable.select().batch()
+            with patch.object(
+                type(batch),
+                "__aexit__",
+                autospec=True,
+                side_effect=type(batch).__aexit__,
+            ) as aexit:
+                with self.assertRaises(Exception):
+                    async for _ in batch.stream():
+                        pass
+            return aexit
+
+        aexit = asyncio.run(run())
+        aexit.assert_called_once()
+
+
 @engines_only("postgres", "cockroach")
 class TestBatchNodeArg(TestCase):
     def test_batch_extra_node(self):
@@ -148,6 +246,7 @@ class TestBatchNodeArg(TestCase):
         assert isinstance(test_engine, PostgresEngine)
 
         EXTRA_NODE = AsyncMock(spec=PostgresEngine(config=test_engine.config))
+        EXTRA_NODE.pool = None
 
         DB = PostgresEngine(
             config=test_engine.config,
@@ -167,3 +266,96 @@ class TestBatchNodeArg(TestCase):
         response = run_sync(Manager.objects().batch(node="read_1"))
         self.assertIsInstance(response, AsyncBatch)
         self.assertTrue(EXTRA_NODE.get_new_connection.called)
+
+
+@engines_only("postgres", "cockroach")
+class TestBatchConnection(DBTestCase):
+    async def run_batch(self) -> int:
+        row_count = 0
+        async with await Manager.select().batch(batch_size=10) as batch:
+            async for _batch in batch:
+                row_count += len(_batch)
+        return row_count
+
+    def test_pool(self):
+        """
+        Make sure the batch borrows a connection from the pool, and releases
+        it afterwards.
+        """
+        self.insert_many_rows(100)
+        engine = Manager._meta.db
+        assert isinstance(engine, PostgresEngine)
+
+        async def run():
+            await engine.start_connection_pool(min_size=1, max_size=1)
+            try:
+                row_count = await self.run_batch()
+                assert engine.pool is not None
+                return row_count, engine.pool.get_idle_size()
+            finally:
+                await engine.close_connection_pool()
+
+        row_count, idle_size = asyncio.run(run())
+        self.assertEqual(row_count, 100)
+        self.assertEqual(idle_size, 1)
+
+    def test_pool_error(self):
+        """
+        If the cursor can't be opened, make sure the connection is still
+        released back to the pool.
+        """
+        engine = Manager._meta.db
+        assert isinstance(engine, PostgresEngine)
+
+        class MissingTable(Table, db=engine):
+            name = Varchar()
+
+        async def run():
+            await engine.start_connection_pool(min_size=1, max_size=1)
+            try:
+                with self.assertRaises(Exception):
+                    async with await MissingTable.select().batch():
+                        pass
+
+                with self.assertRaises(Exception):
+                    async for _ in MissingTable.select().stream():
+                        pass
+
+                assert engine.pool is not None
+                return engine.pool.get_idle_size()
+            finally:
+                await engine.close_connection_pool()
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_transaction(self):
+        """
+        Make sure the batch uses the connection of the current transaction,
+        so uncommitted rows are visible.
+        """
+        engine = Manager._meta.db
+
+        async def run():
+            async with engine.transaction():
+                await Manager.insert(Manager(name="Guido"))
+                return await self.run_batch()
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+    def test_stream_in_transaction(self):
+        """
+        Make sure other queries can be run in the transaction while
+        streaming.
+        """
+        self.insert_many_rows(50)
+        engine = Manager._meta.db
+
+        async def run():
+            names = []
+            async with engine.transaction():
+                async for row in Manager.select().stream(prefetch=10):
+                    names.append(row["name"])
+                    await Manager.count()
+            return names
+
+        self.assertEqual(len(asyncio.run(run())), 50)
@@ -1,16 +1,19 @@
 import sqlite3
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
-from piccolo.columns import Integer, Serial, Varchar
+from piccolo.columns import UUID, Integer, Serial, Varchar
 from piccolo.query.methods.insert import OnConflictAction
 from piccolo.table import Table
 from piccolo.utils.lazy_loader import LazyLoader
+from piccolo.utils.sync import run_sync
 from tests.base import (
     DBTestCase,
     engine_version_lt,
     engines_only,
+    engines_skip,
     is_running_sqlite,
 )
 from tests.example_apps.music.tables import Band, Manager
@@ -492,3 +495,189 @@ class TestOnConflict(TestCase):
                 }
             ],
         )
+
+
+@engines_only("postgres")
+class TestInsertCopy(DBTestCase):
+    def test_copy(self):
+        """
+        Make sure the rows are inserted, and the primary keys are assigned to
+        the instances.
+        """
+        manager = Manager(name="Guido")
+        manager.save().run_sync()
+
+        bands = [
+            Band(name=f"Band {i}", popularity=i, manager=manager)
+            for i in range(1000)
+        ]
+        response = Band.insert(*bands).use_copy().run_sync()
+
+        self.assertEqual(len(response), 1000)
+        self.assertEqual(Band.count().run_sync(), 1000)
+
+        self.assertTrue(all(band._exists_in_db for band in bands))
+
+        for band in (bands[0], bands[-1]):
+            self.assertEqual(
+                Band.select(Band.name, Band.manager)
+                .where(Band.id == band.id)
+                .first()
+                .run_sync(),
+                {"name": band.name, "manager": manager.id},
+            )
+
+        # Make sure the sequence was used, so new rows don't clash.
+        Band.insert(Band(name="Rustaceans")).run_sync()
+        self.assertEqual(Band.count().run_sync(), 1001)
+
+    def test_transaction(self):
+        async def run():
+            async with Band._meta.db.transaction() as transaction:
+                await Band.insert(Band(name="Pythonistas")).use_copy()
+                await transaction.rollback()
+
+        run_sync(run())
+        self.assertEqual(Band.count().run_sync(), 0)
+
+    def test_on_conflict(self):
+        with self.assertRaises(NotImplementedError):
+            Band.insert(Band(name="Pythonistas")).use_copy().on_conflict(
+                action="DO NOTHING"
+            )
+
+    def test_returning(self):
+        """
+        Only the primary key can be returned.
+        """
+        response = (
+            Band.insert(Band(name="Pythonistas"))
+            .use_copy()
+            .returning(Band.id)
+            .run_sync()
+        )
+        self.assertEqual(response, [{"id": 1}])
+
+        with self.assertRaises(NotImplementedError):
+            Band.insert(Band(name="Pythonistas")).use_copy().returning(
+                Band.name
+            )
+
+        with self.assertRaises(NotImplementedError):
+            Band.insert(Band(name="Pythonistas")).returning(
+                Band.name
+            ).use_copy()
+
+
+class Ticket(Table):
+    id = UUID(primary_key=True)
+    name = Varchar()
+
+
+@engines_only("postgres")
+class TestInsertCopyUUID(TestCase):
+    def setUp(self):
+        Ticket.create_table().run_sync()
+
+    def tearDown(self):
+        Ticket.alter().drop_table().run_sync()
+
+    def test_copy(self):
+        """
+        The primary keys are generated in Python, so make sure they're
+        returned, and the instances are marked as saved.
+        """
+        tickets = [Ticket(name="Front row"), Ticket(name="Back row")]
+        response = Ticket.insert(*tickets).use_copy().run_sync()
+
+        self.assertEqual(response, [{"id": i.id} for i in tickets])
+        self.assertTrue(all(i._exists_in_db for i in tickets))
+
+        # Saving again should update the rows, rather than inserting them.
+        tickets[0].name = "Middle row"
+        tickets[0].save().run_sync()
+        self.assertEqual(
+            Ticket.select(Ticket.name).order_by(Ticket.name).run_sync(),
+            [{"name": "Back row"}, {"name": "Middle row"}],
+        )
+
+
+@engines_skip("postgres")
+class TestInsertCopyUnsupported(TestCase):
+    def test_copy(self):
+        with self.assertRaises(NotImplementedError):
+            Band.insert(Band(name="Pythonistas")).use_copy()
+
+
+class TestInsertChunks(TestCase):
+    class Band(Table):
+        id: Serial
+        name = Varchar(unique=True)
+        popularity = Integer()
+
+    def setUp(self) -> None:
+        self.Band.create_table().run_sync()
+
+        # Only 2 rows fit in each query.
+        engine = self.Band._meta.db
+        patcher = patch.object(type(engine), "max_query_parameters", 7)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.Band.alter().drop_table().run_sync()
+
+    def test_chunks(self):
+        """
+        Make sure all of the rows are inserted, and the primary keys are
+        assigned to the correct instances.
+        """
+        Band = self.Band
+        bands = [Band(name=f"Band {i}", popularity=i) for i in range(5)]
+        response = Band.insert(*bands).run_sync()
+
+        self.assertEqual(len(response), 5)
+        self.assertEqual(Band.count().run_sync(), 5)
+
+        for band in bands:
+            self.assertEqual(
+                Band.select(Band.popularity)
+                .where(Band.id == band.id)
+                .first()
+                .run_sync(),
+                {"popularity": band.popularity},
+            )
+
+    def test_atomic(self):
+        """
+        If one of the chunks fails, none of the rows should be inserted.
+        """
+        Band = self.Band
+        bands = [Band(name=f"Band {i}", popularity=i) for i in range(4)]
+        bands.append(Band(name="Band 0", popularity=5))
+
+        with self.assertRaises(Exception):
+            Band.insert(*bands).run_sync()
+
+        self.assertEqual(Band.count().run_sync(), 0)
+
+    @engines_only("postgres", "cockroach")
+    def test_concurrent(self):
+        Band = self.Band
+        engine = Band._meta.db
+        bands = [Band(name=f"Band {i}", popularity=i) for i in range(5)]
+
+        async def run():
+            await engine.start_connection_pool(min_size=1, max_size=3)
+            try:
+                return await Band.insert(*bands).concurrent()
+            finally:
+                await engine.close_connection_pool()
+
+        response = run_sync(run())
+
+        self.assertEqual(len(response), 5)
+        self.assertEqual(
+            sorted(i["id"] for i in response), sorted(i.id for i in bands)
+        )
+        self.assertEqual(Band.count().run_sync(), 5)
@@ -1,7 +1,11 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from piccolo.columns import Column
 from piccolo.columns.column_types import ForeignKey
 from piccolo.testing.test_case import AsyncTableTest
 from tests.base import DBTestCase, engines_only, sqlite_only
-from tests.example_apps.music.tables import Band, Manager
+from tests.example_apps.music.tables import Band, Concert, Manager, Venue
 
 
 class TestGetAll(DBTestCase):
@@ -28,6 +32,82 @@ class TestGetAll(DBTestCase):
         )
 
 
+class TestFromDBRows(TestCase):
+    def test_all_columns(self):
+        """
+        If all of the columns are present, the values are assigned directly,
+        without evaluating the defaults in ``__init__``.
+        """
+        with patch.object(Column, "get_default_value") as get_default_value:
+            bands = Band._from_db_rows(
+                [
+                    {
+                        "id": 1,
+                        "name": "Pythonistas",
+                        "manager": 2,
+                        "popularity": 5,
+                    }
+                ]
+            )
+
+        self.assertFalse(get_default_value.called)
+        band = bands[0]
+        self.assertEqual(band.name, "Pythonistas")
+        self.assertTrue(band._exists_in_db)
+        self.assertIsNone(band._was_created)
+        self.assertEqual(band._get_changed_columns(), [])
+
+        band.popularity = 10
+        self.assertEqual(
+            [i._meta.name for i in band._get_changed_columns()],
+            ["popularity"],
+        )
+
+    def test_missing_columns(self):
+        """
+        If some columns are missing, fall back to ``__init__``, so defaults
+        are used.
+        """
+        bands = Band._from_db_rows([{"id": 1, "name": "Pythonistas"}])
+        band = bands[0]
+        self.assertEqual(band.popularity, 0)
+        self.assertTrue(band._exists_in_db)
+
+
+class TestPrefetchReverse(AsyncTableTest):
+    tables = [Manager, Band, Venue, Concert]
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.bands = [Band(name=i) for i in ("Pythonistas", "Rustaceans")]
+        await Band.insert(*self.bands)
+
+        venue = Venue(name="Arena")
+        await venue.save()
+
+        await Concert.insert(
+            Concert(band_1=self.bands[0], band_2=self.bands[1], venue=venue),
+            Concert(band_1=self.bands[0], band_2=self.bands[1], venue=venue),
+        )
+
+    async def test_prefetch_reverse(self):
+        bands = (
+            await Band.objects()
+            .prefetch_reverse(Concert.band_1)
+            .prefetch_reverse(Concert.band_2, attribute_name="support_slots")
+            .order_by(Band.id)
+        )
+        self.assertEqual(len(bands[0].concert_set), 2)
+        self.assertEqual(bands[1].concert_set, [])
+        self.assertEqual(bands[0].support_slots, [])
+        self.assertEqual(len(bands[1].support_slots), 2)
+        self.assertIsInstance(bands[0].concert_set[0], Concert)
+
+    async def test_wrong_table(self):
+        with self.assertRaises(ValueError):
+            Manager.objects().prefetch_reverse(Concert.band_1)
+
+
 class TestOffset(DBTestCase):
     @engines_only("postgres", "cockroach")
     def test_offset_postgres(self):
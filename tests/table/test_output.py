@@ -1,7 +1,11 @@
 import json
 from unittest import TestCase
 
-from piccolo.table import create_db_tables_sync, drop_db_tables_sync
+from piccolo.table import (
+    TableRow,
+    create_db_tables_sync,
+    drop_db_tables_sync,
+)
 from tests.base import DBTestCase
 from tests.example_apps.music.tables import Band, Instrument, RecordingStudio
 
@@ -23,6 +27,167 @@ class TestOutputList(DBTestCase):
         self.assertEqual(empty_response, [])
 
 
+class TestOutputTuples(DBTestCase):
+    def test_output_as_tuples(self):
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.name, Band.popularity)
+            .order_by(Band.name)
+            .output(as_tuples=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            response,
+            [("CSharps", 10), ("Pythonistas", 1000), ("Rustaceans", 2000)],
+        )
+
+        # Make sure that if no rows are found, an empty list is returned.
+        empty_response = (
+            Band.select(Band.name)
+            .where(Band.name == "ABC123")
+            .output(as_tuples=True)
+            .run_sync()
+        )
+        self.assertEqual(empty_response, [])
+
+    def test_joins(self):
+        """
+        Make sure the values are in the same order as the selected columns,
+        including columns from joined tables.
+        """
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.manager.name, Band.name)
+            .where(Band.name == "Pythonistas")
+            .output(as_tuples=True)
+            .run_sync()
+        )
+        self.assertEqual(response, [("Guido", "Pythonistas")])
+
+    def test_combined(self):
+        """
+        Make sure ``as_tuples`` can't be combined with other output options.
+        """
+        with self.assertRaises(ValueError):
+            Band.select(Band.name).output(as_tuples=True, as_list=True)
+
+
+class TestOutputColumns(DBTestCase):
+    def test_output_as_columns(self):
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.name, Band.popularity)
+            .order_by(Band.name)
+            .output(as_columns=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            response,
+            {
+                "name": ["CSharps", "Pythonistas", "Rustaceans"],
+                "popularity": [10, 1000, 2000],
+            },
+        )
+
+        # Make sure that if no rows are found, each column is still present.
+        empty_response = (
+            Band.select(
+                Band.name,
+                Band.popularity.as_alias("rating"),
+                Band.manager.name,
+            )
+            .where(Band.name == "ABC123")
+            .output(as_columns=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            empty_response, {"name": [], "rating": [], "manager.name": []}
+        )
+
+    def test_output_as_arrays(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy isn't installed.")
+
+        self.insert_rows()
+
+        response = (
+            Band.select(Band.name, Band.popularity)
+            .order_by(Band.name)
+            .output(as_arrays=True)
+            .run_sync()
+        )
+        self.assertIsInstance(response["popularity"], numpy.ndarray)
+        self.assertEqual(response["popularity"].tolist(), [10, 1000, 2000])
+
+        empty_response = (
+            Band.select()
+            .where(Band.name == "ABC123")
+            .output(as_arrays=True)
+            .run_sync()
+        )
+        self.assertEqual(
+            {key: value.tolist() for key, value in empty_response.items()},
+            {"id": [], "name": [], "manager": [], "popularity": []},
+        )
+
+    def test_combined(self):
+        with self.assertRaises(ValueError):
+            Band.select(Band.name).output(as_columns=True, as_tuples=True)
+
+
+class TestOutputRows(DBTestCase):
+    def test_output_as_rows(self):
+        self.insert_rows()
+
+        rows = (
+            Band.objects().order_by(Band.name).output(as_rows=True).run_sync()
+        )
+        self.assertEqual(
+            [row.name for row in rows],
+            ["CSharps", "Pythonistas", "Rustaceans"],
+        )
+
+        row = rows[1]
+        self.assertIsInstance(row, TableRow)
+        self.assertEqual(row.__class__.__name__, "BandRow")
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertEqual(
+            row.to_dict(),
+            Band.select().where(Band.name == "Pythonistas").first().run_sync(),
+        )
+
+        # The same class should be used each time.
+        self.assertIs(Band._get_row_class(), row.__class__)
+
+    def test_read_only(self):
+        self.insert_rows()
+
+        row = Band.objects().output(as_rows=True).first().run_sync()
+        assert row is not None
+
+        with self.assertRaises(AttributeError):
+            row.name = "Rustaceans"
+
+        with self.assertRaises(AttributeError):
+            del row.name
+
+    def test_equality(self):
+        self.insert_rows()
+
+        rows_1 = Band.objects().order_by(Band.id).output(as_rows=True)
+        rows_2 = Band.objects().order_by(Band.id).output(as_rows=True)
+        self.assertEqual(rows_1.run_sync(), rows_2.run_sync())
+
+    def test_prefetch(self):
+        with self.assertRaises(ValueError):
+            Band.objects(Band.manager).output(as_rows=True).run_sync()
+
+
 class TestOutputJSON(DBTestCase):
     def test_output_as_json(self):
         self.insert_row()
@@ -2,6 +2,7 @@ import dataclasses
 import datetime
 from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -15,6 +16,7 @@ from piccolo.columns.column_types import (
     Timestamptz,
     Varchar,
 )
+from piccolo.query.methods.update import UpdateMany
 from piccolo.querystring import QueryString
 from piccolo.table import Table
 from piccolo.testing.test_case import AsyncTableTest
@@ -574,6 +576,107 @@ class TestOperators(TestCase):
             )
 
 
+###############################################################################
+# Test update_many
+
+
+class TestUpdateMany(DBTestCase):
+    def get_popularity(self) -> dict[str, int]:
+        return {
+            i["name"]: i["popularity"]
+            for i in Band.select(Band.name, Band.popularity).run_sync()
+        }
+
+    def test_update_many(self):
+        self.insert_rows()
+
+        bands = Band.objects().order_by(Band.name).run_sync()
+        for band in bands:
+            band.popularity += 1
+            band.name = band.name.upper()
+
+        Band.update_many(bands, columns=[Band.popularity]).run_sync()
+
+        # Only the specified columns should be saved.
+        self.assertDictEqual(
+            self.get_popularity(),
+            {"CSharps": 11, "Pythonistas": 1001, "Rustaceans": 2001},
+        )
+
+    @sqlite_only
+    def test_sqlite_template(self):
+        """
+        Make sure the values for each row are only calculated once, and a
+        querystring isn't built for each row.
+        """
+        self.insert_rows()
+
+        bands = Band.objects().run_sync()
+        for band in bands:
+            band.popularity = 0
+
+        with patch.object(
+            UpdateMany,
+            "_get_values",
+            autospec=True,
+            side_effect=UpdateMany._get_values,
+        ) as get_values:
+            Band.update_many(bands, columns=[Band.popularity]).run_sync()
+
+        self.assertEqual(get_values.call_count, len(bands))
+        self.assertEqual(
+            Band.count().where(Band.popularity == 0).run_sync(), 3
+        )
+
+    def test_all_columns(self):
+        self.insert_rows()
+
+        manager = (
+            Manager.objects().where(Manager.name == "Guido").first().run_sync()
+        )
+        assert manager is not None
+
+        bands = Band.objects().run_sync()
+        for band in bands:
+            band.popularity = 0
+            band.manager = manager
+
+        Band.update_many(bands).run_sync()
+
+        self.assertEqual(
+            Band.count().where(Band.popularity == 0).run_sync(), 3
+        )
+        self.assertEqual(
+            Band.count().where(Band.manager == manager.id).run_sync(), 3
+        )
+
+    @engines_skip("sqlite")
+    def test_chunks(self):
+        """
+        Make sure all rows are updated when there are more values than fit in
+        a single query.
+        """
+        self.insert_rows()
+
+        bands = Band.objects().run_sync()
+        for band in bands:
+            band.popularity = 0
+
+        query = Band.update_many(bands, columns=[Band.popularity])
+
+        with patch.object(type(Band._meta.db), "max_query_parameters", 4):
+            self.assertEqual(len(query.querystrings), 2)
+            query.run_sync()
+
+        self.assertEqual(
+            Band.count().where(Band.popularity == 0).run_sync(), 3
+        )
+
+    def test_not_saved(self):
+        with self.assertRaises(ValueError):
+            Band.update_many([Band(name="Pythonistas")]).run_sync()
+
+
 ###############################################################################
 # Test auto_update
 
@@ -615,6 +718,24 @@ class TestAutoUpdate(TestCase):
         self.assertIsInstance(row.modified_on, datetime.datetime)
         self.assertGreater(row.modified_on, existing_modified_on)
 
+    def test_update_many(self):
+        """
+        Make sure the ``update_many`` method uses ``auto_update`` columns
+        correctly.
+        """
+        row = AutoUpdateTable(name="test")
+        row.save().run_sync()
+
+        row.name = "test 2"
+        AutoUpdateTable.update_many(
+            [row], columns=[AutoUpdateTable.name]
+        ).run_sync()
+        self.assertIsInstance(row.modified_on, datetime.datetime)
+
+        updated_row = AutoUpdateTable.select().first().run_sync()
+        assert updated_row is not None
+        self.assertEqual(updated_row["modified_on"], row.modified_on)
+
     def test_update(self):
         """
         Make sure the update method uses ``auto_update`` columns correctly.
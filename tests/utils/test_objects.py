@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from piccolo.utils.objects import (
+    get_hydrator,
+    get_row_shape,
+    make_nested_object,
+    make_nested_objects,
+)
+from tests.example_apps.music.tables import (
+    Band,
+    Instrument,
+    Manager,
+    RecordingStudio,
+)
+
+
+class TestMakeNestedObject(TestCase):
+    def test_nesting(self):
+        band = make_nested_object(
+            {
+                "id": 1,
+                "name": "Pythonistas",
+                "manager": {"id": 2, "name": "Guido"},
+                "popularity": 1000,
+            },
+            Band,
+        )
+        assert isinstance(band, Band)
+        self.assertEqual(band.name, "Pythonistas")
+        self.assertIsInstance(band.manager, Manager)
+        self.assertEqual(band.manager.name, "Guido")
+        self.assertTrue(band.manager._exists_in_db)
+
+    def test_load_json(self):
+        instrument = make_nested_object(
+            {
+                "id": 1,
+                "name": "Piano",
+                "recording_studio": {
+                    "id": 2,
+                    "facilities": '{"restaurant": true}',
+                    "facilities_b": None,
+                },
+            },
+            Instrument,
+            load_json=True,
+        )
+        assert isinstance(instrument, Instrument)
+        recording_studio = instrument.recording_studio
+        assert isinstance(recording_studio, RecordingStudio)
+        self.assertEqual(recording_studio.facilities, {"restaurant": True})
+
+
+class TestMakeNestedObjects(TestCase):
+    def test_hydrator_cached(self):
+        """
+        The hydrator should only be built once for each shape of row.
+        """
+        rows = [
+            {"id": i, "name": "Pythonistas", "manager": {"id": i}}
+            for i in range(3)
+        ]
+        shape = get_row_shape(rows[0])
+        self.assertEqual(
+            shape,
+            (("id", None), ("name", None), ("manager", (("id", None),))),
+        )
+        self.assertIs(get_hydrator(Band, shape), get_hydrator(Band, shape))
+
+        bands = make_nested_objects(rows, Band)
+        self.assertEqual([band.manager.id for band in bands], [0, 1, 2])
+
+        # Popularity wasn't included, so the default is used.
+        self.assertEqual(bands[0].popularity, 0)
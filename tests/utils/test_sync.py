@@ -1,7 +1,7 @@
 import asyncio
 from unittest import TestCase
 
-from piccolo.utils.sync import run_sync
+from piccolo.utils.sync import get_background_loop, run_sync
 
 
 class TestSync(TestCase):
@@ -32,3 +32,44 @@ class TestSync(TestCase):
         run_sync(asyncio.sleep(0.1))
 
         asyncio.set_event_loop(None)
+
+    def test_same_event_loop(self):
+        """
+        Make sure the coroutines are run on the same event loop each time,
+        rather than creating a new one.
+        """
+
+        async def get_loop():
+            return asyncio.get_running_loop()
+
+        loop = run_sync(get_loop())
+        self.assertIs(run_sync(get_loop()), loop)
+        self.assertIs(get_background_loop(), loop)
+
+    def test_running_event_loop(self):
+        """
+        Test calling ``run_sync`` when an event loop is already running in
+        the current thread.
+        """
+
+        async def test():
+            return run_sync(asyncio.sleep(0, result="done"))
+
+        self.assertEqual(asyncio.run(test()), "done")
+
+    def test_exceptions(self):
+        """
+        Make sure exceptions are raised to the caller - including
+        ``SystemExit``, which would otherwise stop the event loop.
+        """
+
+        async def raise_exception(exception: BaseException):
+            raise exception
+
+        with self.assertRaises(NotImplementedError):
+            run_sync(raise_exception(NotImplementedError()))
+
+        with self.assertRaises(SystemExit):
+            run_sync(raise_exception(SystemExit()))
+
+        self.assertEqual(run_sync(asyncio.sleep(0, result="done")), "done")